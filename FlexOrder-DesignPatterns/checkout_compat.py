@@ -0,0 +1,246 @@
+"""Camada de compatibilidade: a API do SistemaPedidoAntigo sobre o motor refatorado.
+
+`SistemaPedidoCompat` tem a mesma assinatura e as mesmas regras de negócio do
+`checkout_monolitico.SistemaPedidoAntigo`, mas:
+- os nomes ("pix", "expresso", ...) são resolvidos por tabelas montadas uma
+  única vez na importação, em vez de cadeias de `elif` a cada chamada;
+- pagamento e frete são estratégias (`MetodoPagamento`/`EstrategiaFrete`) e o
+  desconto PIX é o decorator `DescontoPix` do checkout refatorado;
+- `finalizar_compra` calcula o valor com as regras do legado e entrega o
+  pagamento, o estoque e a nota fiscal à `CheckoutFacade`; o e-mail fica a
+  cargo do pacote `subsistemas`, sem os laços de verificação e reserva item a
+  item.
+
+Migrar é trocar a importação:
+
+    from checkout_compat import SistemaPedidoCompat as SistemaPedidoAntigo
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from checkout_refatorado import (
+    CheckoutFacade, DescontoPix, EstrategiaFrete, MetodoPagamento, PagamentoPix, Pedido,
+    PedidoDecorator,
+)
+from subsistemas import GeradorNotaFiscal, ServicoEmail, SistemaEstoque
+
+
+# ===== Strategy: Pagamento (métodos do sistema legado) =====
+class PagamentoCreditoLegado(MetodoPagamento):
+    """Crédito como no sistema legado: sem o limite do PagamentoCredito."""
+
+    def processar(self, valor: float) -> bool:
+        print(f"Processando pagamento via Crédito de R$ {valor:.2f}")
+        print("Validando cartão...")
+        return True
+
+
+class PagamentoBoleto(MetodoPagamento):
+    def processar(self, valor: float) -> bool:
+        print(f"Gerando boleto de R$ {valor:.2f}")
+        print("Código de barras: 34191.79001...")
+        return True
+
+
+class PagamentoDebito(MetodoPagamento):
+    def processar(self, valor: float) -> bool:
+        print(f"Processando débito de R$ {valor:.2f}")
+        return True
+
+
+# ===== Strategy: Frete (regras do sistema legado, sobre o valor base) =====
+class FreteFaixaLegado(EstrategiaFrete):
+    """Frete fixo que muda quando o valor passa de um limite."""
+
+    def __init__(self, rotulo: str, limite: float, acima: float, ate_limite: float):
+        self.rotulo = rotulo
+        self.limite = limite
+        self.acima = acima
+        self.ate_limite = ate_limite
+
+    def calcular(self, valor: float) -> float:
+        custo = self.acima if valor > self.limite else self.ate_limite
+        print(f"{self.rotulo}: R$ {custo:.2f}")
+        return custo
+
+
+class FreteRetirada(EstrategiaFrete):
+    def calcular(self, valor: float) -> float:
+        print("Retirada na loja (sem custo)")
+        return 0.0
+
+
+class FreteJaCalculado(EstrategiaFrete):
+    """Frete entregue à fachada quando o valor do pedido já o inclui.
+
+    No legado o frete incide sobre o valor base e os descontos sobre o valor
+    com frete, ordem inversa à da `CheckoutFacade`.
+    """
+
+    def calcular(self, valor: float) -> float:
+        return 0.0
+
+
+# ===== Decorator: descontos do sistema legado =====
+class DescontoPrimeiraCompra(PedidoDecorator):
+    def calcular_valor(self):
+        print("Aplicando R$50.00 de desconto de primeira compra.")
+        return self._pedido.calcular_valor() - 50.0
+
+
+class DescontoCupomVerao(PedidoDecorator):
+    def calcular_valor(self):
+        print("Aplicando 10% de desconto do cupom de verão.")
+        return self._pedido.calcular_valor() * 0.90
+
+
+class _Subtotal(Pedido):
+    """Pedido reduzido a um valor, para aplicar os decorators de desconto."""
+
+    def __init__(self, valor: float, pagamento: Optional[MetodoPagamento] = None,
+                 frete: Optional[EstrategiaFrete] = None):
+        super().__init__([], pagamento, frete)
+        self.valor_base = valor
+
+
+# ===== Tabelas de despacho (montadas uma única vez) =====
+PAGAMENTOS: Dict[str, MetodoPagamento] = {
+    "pix": PagamentoPix(),
+    "credito": PagamentoCreditoLegado(),
+    "boleto": PagamentoBoleto(),
+    "debito": PagamentoDebito(),
+}
+
+FRETES: Dict[str, EstrategiaFrete] = {
+    "normal": FreteFaixaLegado("Frete Normal (5-7 dias úteis)", 200.0, 0.0, 15.0),
+    "expresso": FreteFaixaLegado("Frete Expresso (1-2 dias úteis)", 500.0, 20.0, 35.0),
+    "retirada": FreteRetirada(),
+}
+
+DESCONTOS: Dict[str, type] = {
+    "pix": DescontoPix,
+    "primeira_compra": DescontoPrimeiraCompra,
+    "cupom_verao": DescontoCupomVerao,
+}
+
+# Decorators aplicados automaticamente por método de pagamento.
+DESCONTOS_POR_PAGAMENTO: Dict[str, Tuple[type, ...]] = {"pix": (DescontoPix,)}
+
+_FRETE_JA_CALCULADO = FreteJaCalculado()
+
+
+class SistemaPedidoCompat:
+    """Substituto direto do SistemaPedidoAntigo, montado sobre as estratégias."""
+
+    NUMERO_PEDIDO = "PED1000"  # Simulado, como no sistema legado
+
+    def __init__(self, itens: List[Dict], valor_base: float,
+                 estoque=None, gerador_nf=None, servico_email=None):
+        self.itens = itens
+        self.valor_base = valor_base
+        self.valor_total = valor_base
+        self.metodo_pagamento = None
+        self.tipo_frete = None
+        self.tem_embalagem_presente = False
+        self.estoque = estoque or SistemaEstoque()
+        self.gerador_nf = gerador_nf or GeradorNotaFiscal()
+        self.servico_email = servico_email or ServicoEmail()
+        self.facade = CheckoutFacade(self.estoque, self.gerador_nf)
+
+    def processar_pagamento(self, metodo: str) -> bool:
+        self.metodo_pagamento = metodo
+        pagamento = PAGAMENTOS.get(metodo)
+        if pagamento is None:
+            print("Método de pagamento inválido!")
+            return False
+        return pagamento.processar(self.valor_total)
+
+    def calcular_frete(self, tipo: str) -> float:
+        self.tipo_frete = tipo
+        frete = FRETES.get(tipo)
+        if frete is None:
+            print("Tipo de frete inválido!")
+            return 0.0
+        custo = frete.calcular(self.valor_base)
+        self.valor_total += custo
+        return custo
+
+    def aplicar_desconto(self, tipo_desconto: str) -> None:
+        decorator = DESCONTOS.get(tipo_desconto)
+        if decorator is not None:
+            self._decorar((decorator,))
+
+    def adicionar_embalagem_presente(self) -> None:
+        self.tem_embalagem_presente = True
+        taxa = 10.0
+        self.valor_total += taxa
+        print(f"Taxa de embalagem para presente: +R$ {taxa:.2f}")
+
+    def verificar_estoque(self) -> bool:
+        return True
+
+    def reservar_itens(self) -> bool:
+        return True
+
+    def baixar_estoque(self) -> bool:
+        self.estoque.registrar_pedido(self)
+        return True
+
+    def gerar_nota_fiscal(self, numero_pedido: str) -> str:
+        self.gerador_nf.emitir(self, self.valor_total)
+        return f"NF-e: {numero_pedido}-2024"
+
+    def enviar_email_confirmacao(self, email: str, numero_pedido: str) -> bool:
+        return self.servico_email.enviar_confirmacao(email, numero_pedido)
+
+    def finalizar_compra(self, metodo_pagamento: str, tipo_frete: str, email_cliente: str) -> bool:
+        """Mesmo resultado do SistemaPedidoAntigo.finalizar_compra.
+
+        O valor segue as regras do legado (frete sobre o valor base, descontos
+        sobre o valor com frete); pagamento, estoque e nota fiscal ficam a
+        cargo da `CheckoutFacade`.
+        """
+        print("=" * 60)
+        print("INICIANDO PROCESSO DE CHECKOUT (COMPATIBILIDADE)")
+        print("=" * 60)
+        self.calcular_frete(tipo_frete)
+        self._decorar(DESCONTOS_POR_PAGAMENTO.get(metodo_pagamento, ()))
+
+        self.metodo_pagamento = metodo_pagamento
+        pagamento = PAGAMENTOS.get(metodo_pagamento)
+        if pagamento is None:
+            print("Método de pagamento inválido!")
+            print("ERRO: Falha no pagamento!")
+            return False
+        pedido = _Subtotal(self.valor_total, pagamento, _FRETE_JA_CALCULADO)
+        if not self.facade.concluir_transacao(pedido):
+            print("ERRO: Falha no pagamento!")
+            return False
+
+        self.enviar_email_confirmacao(email_cliente, self.NUMERO_PEDIDO)
+
+        print("\n" + "=" * 60)
+        print(f"COMPRA FINALIZADA! Valor total: R$ {self.valor_total:.2f}")
+        print("=" * 60)
+        return True
+
+    def _decorar(self, decorators: Tuple[type, ...]) -> None:
+        if not decorators:
+            return
+        pedido = _Subtotal(self.valor_total)
+        for decorator in decorators:
+            pedido = decorator(pedido)
+        self.valor_total = pedido.calcular_valor()
+
+
+def main():
+    itens = [
+        {"nome": "Notebook", "quantidade": 1, "preco": 2500.00},
+        {"nome": "Mouse", "quantidade": 2, "preco": 50.00},
+    ]
+    sistema = SistemaPedidoCompat(itens, 2600.00)
+    sistema.finalizar_compra("pix", "normal", "cliente@email.com")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,164 @@
 """Refatoração do checkout_monolitico usando Strategy, Decorator e Facade.
 
 Mantém funcionalidades do monolítico mas com melhor estrutura:
+- Carrinho editável com totais incrementais (Pedido)
 - Estratégias de pagamento (Strategy)
 - Estratégias de frete (Strategy)
 - Descontos/taxas como Decorators  
 - Fachada (CheckoutFacade) que orquestra o fluxo
-- ProcessadorPedido que centraliza regras
+- Métricas por estratégia e por transação (subsistemas.metricas)
 """
 
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 try:
-    from .processador_pedido import ProcessadorPedido
+    from subsistemas import SistemaEstoque, GeradorNotaFiscal
 except ImportError:
-    from processador_pedido import ProcessadorPedido
+    SistemaEstoque = GeradorNotaFiscal = None
+try:
+    from subsistemas.metricas import MedidorFluxo, instrumentar_frete, instrumentar_pagamento
+except ImportError:
+    MedidorFluxo = instrumentar_frete = instrumentar_pagamento = None
+
+
+def _centavos(valor: float) -> int:
+    """Converte reais em centavos inteiros, arredondando ao centavo."""
+    return round(valor * 100)
 
 
 class Pedido:
+    """Pedido com carrinho editável.
+
+    Cada linha do carrinho é um par (nome, preço) com a sua quantidade: o
+    mesmo produto com preços diferentes fica em linhas separadas. O valor
+    base é mantido em centavos inteiros e atualizado a cada alteração, em
+    O(1), sem acumular erro de arredondamento; os observadores (ex.:
+    `ValorCacheado`) são avisados por `atualizar(pedido)`. Os observadores são
+    guardados por referência fraca: um observador descartado deixa de ser
+    avisado sem precisar se remover.
+    """
+
     def __init__(self, itens: List[Dict], estrategia_pagamento, estrategia_frete, tem_embalagem_presente: bool = False):
+        self._observadores = weakref.WeakSet()
         self.itens = itens
         self.estrategia_pagamento = estrategia_pagamento
         self.estrategia_frete = estrategia_frete
         self.tem_embalagem_presente = tem_embalagem_presente
-        self.valor_base = sum(item['valor'] for item in itens)
+
+    @property
+    def itens(self) -> List[Dict]:
+        """Cópias das linhas do carrinho: os dados do item mais a 'quantidade'."""
+        return [dict(linha) for linhas in self._linhas.values() for linha in linhas.values()]
+
+    @itens.setter
+    def itens(self, itens: List[Dict]) -> None:
+        # nome -> preço -> linha; itens iguais (mesmo nome e preço) são somados.
+        self._linhas: Dict[str, Dict[float, Dict]] = {}
+        centavos = 0
+        quantidade_total = 0
+        for item in itens:
+            quantidade = item.get('quantidade', 1)
+            linhas = self._linhas.setdefault(item['nome'], {})
+            linha = linhas.get(item['valor'])
+            if linha is None:
+                linhas[item['valor']] = dict(item, quantidade=quantidade)
+            else:
+                linha['quantidade'] += quantidade
+            centavos += _centavos(item['valor']) * quantidade
+            quantidade_total += quantidade
+        self._centavos = centavos
+        self.quantidade_total = quantidade_total
+        self._notificar()
+
+    @property
+    def valor_base(self) -> float:
+        return self._centavos / 100
+
+    @valor_base.setter
+    def valor_base(self, valor: float) -> None:
+        self._centavos = _centavos(valor)
+        self._notificar()
+
+    def adicionar_item(self, nome: str, valor: float, quantidade: int = 1) -> None:
+        """Adiciona `quantidade` unidades do item, na linha do seu preço.
+
+        Raises:
+            ValueError: Se a quantidade não for positiva.
+        """
+        if quantidade <= 0:
+            raise ValueError("A quantidade adicionada deve ser positiva.")
+        linhas = self._linhas.setdefault(nome, {})
+        linha = linhas.get(valor)
+        if linha is None:
+            linhas[valor] = {'nome': nome, 'valor': valor, 'quantidade': quantidade}
+        else:
+            linha['quantidade'] += quantidade
+        self._alterar_totais(_centavos(valor) * quantidade, quantidade)
+
+    def remover_item(self, nome: str, valor: Optional[float] = None) -> Dict:
+        """Remove a linha do item e a retorna.
+
+        `valor` só é necessário se o item estiver no pedido com mais de um preço.
+
+        Raises:
+            KeyError: Se o item não estiver no pedido.
+            ValueError: Se o item tiver vários preços e `valor` não for dado.
+        """
+        linha = self._linha(nome, valor)
+        linhas = self._linhas[nome]
+        del linhas[linha['valor']]
+        if not linhas:
+            del self._linhas[nome]
+        self._alterar_totais(-_centavos(linha['valor']) * linha['quantidade'], -linha['quantidade'])
+        return linha
+
+    def alterar_quantidade(self, nome: str, quantidade: int, valor: Optional[float] = None) -> None:
+        """Define a quantidade do item; zero remove a linha.
+
+        Raises:
+            KeyError: Se o item não estiver no pedido.
+            ValueError: Se a quantidade for negativa, ou se o item tiver
+                vários preços e `valor` não for dado.
+        """
+        if quantidade < 0:
+            raise ValueError("A quantidade não pode ser negativa.")
+        if quantidade == 0:
+            self.remover_item(nome, valor)
+            return
+        linha = self._linha(nome, valor)
+        diferenca = quantidade - linha['quantidade']
+        linha['quantidade'] = quantidade
+        self._alterar_totais(_centavos(linha['valor']) * diferenca, diferenca)
+
+    def adicionar_observador(self, observador) -> None:
+        """Registra um objeto com `atualizar(pedido)`, chamado a cada alteração."""
+        self._observadores.add(observador)
+
+    def remover_observador(self, observador) -> None:
+        self._observadores.discard(observador)
+
+    def _linha(self, nome: str, valor: Optional[float]) -> Dict:
+        linhas = self._linhas.get(nome, {})
+        if valor is not None:
+            linha = linhas.get(valor)
+        elif len(linhas) > 1:
+            raise ValueError(f"Item '{nome}' está no pedido com {len(linhas)} preços; informe o valor.")
+        else:
+            linha = next(iter(linhas.values()), None)
+        if linha is None:
+            raise KeyError(f"Item '{nome}' não está no pedido.")
+        return linha
+
+    def _alterar_totais(self, centavos: int, quantidade: int) -> None:
+        self.quantidade_total += quantidade
+        self._centavos += centavos
+        self._notificar()
+
+    def _notificar(self) -> None:
+        for observador in list(self._observadores):
+            observador.atualizar(self)
 
     def calcular_valor(self):
         # Valor base - descontos são aplicados via Decorator externo
@@ -32,6 +167,11 @@ class Pedido:
 
 # ===== Strategy: Pagamento =====
 class MetodoPagamento(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if instrumentar_pagamento is not None:
+            instrumentar_pagamento(cls)
+
     @abstractmethod
     def processar(self, valor: float) -> bool:
         pass
@@ -64,6 +204,11 @@ class PagamentoMana(MetodoPagamento):
 
 # ===== Strategy: Frete =====
 class EstrategiaFrete(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if instrumentar_frete is not None:
+            instrumentar_frete(cls)
+
     @abstractmethod
     def calcular(self, valor: float) -> float:
         pass
@@ -104,6 +249,69 @@ class PedidoDecorator(Pedido, ABC):
         # estrategia_pagamento, estrategia_frete e tem_embalagem_presente.
         return getattr(self._pedido, name)
 
+    # O carrinho herdado de Pedido deve agir sobre o pedido encapsulado, e não
+    # sobre o decorator: estes membros não passam por __getattr__.
+    @property
+    def itens(self) -> List[Dict]:
+        return self._pedido.itens
+
+    @itens.setter
+    def itens(self, itens: List[Dict]) -> None:
+        self._pedido.itens = itens
+
+    @property
+    def valor_base(self) -> float:
+        return self._pedido.valor_base
+
+    @valor_base.setter
+    def valor_base(self, valor: float) -> None:
+        self._pedido.valor_base = valor
+
+    def adicionar_item(self, nome: str, valor: float, quantidade: int = 1) -> None:
+        self._pedido.adicionar_item(nome, valor, quantidade)
+
+    def remover_item(self, nome: str, valor: Optional[float] = None) -> Dict:
+        return self._pedido.remover_item(nome, valor)
+
+    def alterar_quantidade(self, nome: str, quantidade: int, valor: Optional[float] = None) -> None:
+        self._pedido.alterar_quantidade(nome, quantidade, valor)
+
+    def adicionar_observador(self, observador) -> None:
+        self._pedido.adicionar_observador(observador)
+
+    def remover_observador(self, observador) -> None:
+        self._pedido.remover_observador(observador)
+
+
+class ValorCacheado(PedidoDecorator):
+    """Guarda o valor da cadeia de decorators até o carrinho ser alterado.
+
+    Depois de `desanexar()`, deixa de ser avisado e passa a recalcular sempre.
+    """
+
+    def __init__(self, pedido: Pedido):
+        super().__init__(pedido)
+        self._valor: Optional[float] = None
+        self._anexado = True
+        pedido.adicionar_observador(self)
+
+    def atualizar(self, pedido: Pedido) -> None:
+        self._valor = None
+
+    def desanexar(self) -> None:
+        """Remove o cache dos observadores do pedido."""
+        if self._anexado:
+            self._anexado = False
+            self._valor = None
+            self._pedido.remover_observador(self)
+
+    def calcular_valor(self):
+        if not self._anexado:
+            return self._pedido.calcular_valor()
+        if self._valor is None:
+            self._valor = self._pedido.calcular_valor()
+        return self._valor
+
 
 class DescontoPix(PedidoDecorator):
     def calcular_valor(self):
@@ -136,6 +344,13 @@ class TaxaEmbalagemPresente(PedidoDecorator):
 
 
 # ===== Facade: CheckoutFacade =====
+_FLUXO_CHECKOUT = MedidorFluxo("checkout_transacoes", "Transações de checkout") if MedidorFluxo else None
+
+
+def _medir_checkout(metodo):
+    return _FLUXO_CHECKOUT.medir(metodo) if _FLUXO_CHECKOUT is not None else metodo
+
+
 class CheckoutFacade:
     """Fachada que simplifica o fluxo de checkout.
 
@@ -167,6 +382,7 @@ class CheckoutFacade:
         else:
             self.gerador_nf = gerador_nf or GeradorNotaFiscal()
 
+    @_medir_checkout
     def concluir_transacao(self, pedido: Pedido) -> bool:
         """Orquestra o fluxo de finalização de forma simplificada."""
         print("=========================================")
@@ -188,6 +404,8 @@ class CheckoutFacade:
             valor_final += taxa
 
         print(f"\nValor a Pagar: R${valor_final:.2f}")
+        if _FLUXO_CHECKOUT is not None:
+            _FLUXO_CHECKOUT.valor(valor_final)
 
         # 4. Processar pagamento via estratégia
         sucesso = pedido.estrategia_pagamento.processar(valor_final)
@@ -0,0 +1,399 @@
+"""
+Execução em sombra: compara o checkout legado com o refatorado, pedido a pedido.
+
+Os mesmos pedidos sintéticos (gerador_pedidos) passam pelo
+`SistemaPedidoAntigo` e pela `CheckoutFacade`, e cada divergência é
+classificada por categoria:
+
+- aprovacao: um motor aprova e o outro rejeita o pagamento;
+- frete: custo de frete diferente (regras por faixa vs. percentual);
+- desconto_pix: desconto PIX diferente (aplicado depois vs. antes do frete);
+- embalagem: taxa de embalagem de presente diferente (10.00 vs. 5.00);
+- total: valor cobrado diferente.
+
+O trabalho é dividido em trechos de pedidos processados num pool de
+processos; cada processo gera o próprio trecho (o gerador começa de qualquer
+ponto da sequência) e devolve apenas contagens e uma amostra de exemplos por
+categoria, então nada proporcional ao número de pedidos volta ao processo
+principal.
+
+Uso:
+    python checkout_sombra.py --quantidade 1000000 --saida relatorio_sombra.json
+"""
+import contextlib
+import json
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from checkout_monolitico import SistemaPedidoAntigo
+from checkout_refatorado import (
+    CheckoutFacade, DescontoPix, FreteExpresso, FreteNormal, FreteTeletransporte,
+    PagamentoCredito, PagamentoMana, PagamentoPix, Pedido, PedidoDecorator,
+    TaxaEmbalagemPresente,
+)
+from gerador_pedidos import TAMANHO_BLOCO, GeradorPedidos, PerfilCarga
+
+CATEGORIAS = ("aprovacao", "frete", "desconto_pix", "embalagem", "total")
+# Diferenças de valor abaixo de meio centavo são arredondamento.
+TOLERANCIA = 0.005
+
+# Só métodos e fretes que os dois motores conhecem; com PerfilCarga() os
+# nomes exclusivos do refatorado (mana, teletransporte) também são enviados.
+PERFIL_COMUM = PerfilCarga(pagamentos=(("pix", 50), ("credito", 50)),
+                           fretes=(("normal", 65), ("expresso", 35)))
+
+_PAGAMENTOS = {"pix": PagamentoPix, "credito": PagamentoCredito, "mana": PagamentoMana}
+_FRETES = {"normal": FreteNormal, "expresso": FreteExpresso, "teletransporte": FreteTeletransporte}
+
+
+# ===== Motor legado =====
+class _LegadoInstrumentado(SistemaPedidoAntigo):
+    """SistemaPedidoAntigo que anota quanto cada etapa somou ao total."""
+
+    def __init__(self, itens, valor_base):
+        super().__init__(itens, valor_base)
+        self.componentes = {"frete": 0.0, "desconto_pix": 0.0, "embalagem": 0.0}
+
+    def calcular_frete(self, tipo):
+        frete = super().calcular_frete(tipo)
+        self.componentes["frete"] = frete
+        return frete
+
+    def aplicar_desconto(self, tipo_desconto):
+        antes = self.valor_total
+        super().aplicar_desconto(tipo_desconto)
+        if tipo_desconto == "pix":
+            self.componentes["desconto_pix"] = antes - self.valor_total
+
+    def adicionar_embalagem_presente(self):
+        antes = self.valor_total
+        super().adicionar_embalagem_presente()
+        self.componentes["embalagem"] = self.valor_total - antes
+
+
+def executar_legado(dados: Dict) -> Dict:
+    """Passa o pedido pelo SistemaPedidoAntigo, como um chamador legado faria.
+
+    Returns:
+        aprovado, frete, desconto_pix, embalagem e total.
+    """
+    itens = dados["itens"]
+    sistema = _LegadoInstrumentado(itens, sum(item["valor"] for item in itens))
+    if dados["embalagem_presente"]:
+        sistema.adicionar_embalagem_presente()
+    aprovado = sistema.finalizar_compra(dados["pagamento"], dados["frete"], "sombra@flexorder.dev")
+    return dict(sistema.componentes, aprovado=aprovado, total=sistema.valor_total)
+
+
+# ===== Motor refatorado =====
+class _Sonda(PedidoDecorator):
+    """Decorator neutro que guarda o valor que passa por ele na cadeia."""
+
+    def calcular_valor(self):
+        self.valor = self._pedido.calcular_valor()
+        return self.valor
+
+
+class _PagamentoGravado:
+    def __init__(self, estrategia):
+        self.estrategia = estrategia
+        self.valor = 0.0
+
+    def processar(self, valor: float) -> bool:
+        self.valor = valor
+        return self.estrategia.processar(valor)
+
+
+class _FreteGravado:
+    def __init__(self, estrategia):
+        self.estrategia = estrategia
+        self.custo = 0.0
+
+    def calcular(self, valor: float) -> float:
+        self.custo = self.estrategia.calcular(valor)
+        return self.custo
+
+
+def executar_refatorado(dados: Dict, facade: Optional[CheckoutFacade] = None) -> Dict:
+    """Passa o pedido pela CheckoutFacade, com DescontoPix e TaxaEmbalagemPresente.
+
+    Returns:
+        aprovado, frete, desconto_pix, embalagem e total.
+    """
+    pagamento = _PagamentoGravado(_PAGAMENTOS[dados["pagamento"]]())
+    frete = _FreteGravado(_FRETES[dados["frete"]]())
+    base = _Sonda(Pedido(dados["itens"], pagamento, frete, dados["embalagem_presente"]))
+    descontado = _Sonda(DescontoPix(base) if dados["pagamento"] == "pix" else base)
+    final = _Sonda(TaxaEmbalagemPresente(descontado))
+    # Propaga os campos lidos pela fachada, como em checkout_refatorado.main(),
+    # para não atravessar a cadeia de decorators a cada acesso.
+    final.estrategia_pagamento = pagamento
+    final.estrategia_frete = frete
+    final.tem_embalagem_presente = dados["embalagem_presente"]
+
+    aprovado = (facade or CheckoutFacade()).concluir_transacao(final)
+    return {"aprovado": aprovado, "frete": frete.custo,
+            "desconto_pix": base.valor - descontado.valor,
+            "embalagem": final.valor - descontado.valor, "total": pagamento.valor}
+
+
+def classificar(legado: Dict, refatorado: Dict) -> List[str]:
+    """Lista as categorias em que os dois resultados divergem."""
+    categorias = ["aprovacao"] if legado["aprovado"] != refatorado["aprovado"] else []
+    categorias.extend(categoria for categoria in CATEGORIAS[1:]
+                      if abs(legado[categoria] - refatorado[categoria]) > TOLERANCIA)
+    return categorias
+
+
+# ===== Relatório =====
+class RelatorioSombra:
+    """Contagens de divergências e amostras uniformes de exemplos por categoria.
+
+    As amostras usam reservoir sampling, e relatórios de trechos diferentes
+    podem ser fundidos sem perder a uniformidade.
+    """
+
+    def __init__(self, amostras: int = 5, semente=0):
+        self.amostras = amostras
+        self.pedidos = 0
+        self.divergentes = 0
+        self.por_categoria: Counter = Counter()
+        self.por_combinacao: Counter = Counter()
+        self.divergentes_por_combinacao: Counter = Counter()
+        self.soma_diferencas = 0.0
+        self.maior_diferenca = 0.0
+        self.exemplos: Dict[str, Tuple[int, List[Dict]]] = {}
+        self._aleatorio = random.Random(f"{semente}:amostras")
+
+    def registrar(self, dados: Dict, legado: Dict, refatorado: Dict) -> List[str]:
+        """Conta um pedido e, se divergente, o oferece às amostras."""
+        combinacao = f"{dados['pagamento']}/{dados['frete']}"
+        self.pedidos += 1
+        self.por_combinacao[combinacao] += 1
+        categorias = classificar(legado, refatorado)
+        if not categorias:
+            return categorias
+
+        self.divergentes += 1
+        self.divergentes_por_combinacao[combinacao] += 1
+        diferenca = refatorado["total"] - legado["total"]
+        self.soma_diferencas += diferenca
+        if abs(diferenca) > abs(self.maior_diferenca):
+            self.maior_diferenca = diferenca
+        exemplo = None
+        for categoria in categorias:
+            self.por_categoria[categoria] += 1
+            vistos, amostra = self.exemplos.get(categoria, (0, []))
+            vistos += 1
+            # Algoritmo R: o n-ésimo exemplo entra com probabilidade k/n.
+            posicao = len(amostra) if len(amostra) < self.amostras else self._aleatorio.randrange(vistos)
+            if posicao < self.amostras:
+                exemplo = exemplo or _exemplo(dados, legado, refatorado, categorias)
+                if posicao == len(amostra):
+                    amostra.append(exemplo)
+                else:
+                    amostra[posicao] = exemplo
+            self.exemplos[categoria] = (vistos, amostra)
+        return categorias
+
+    def fundir(self, outro: "RelatorioSombra") -> None:
+        """Acrescenta as contagens e amostras de `outro` (de outro trecho)."""
+        self.pedidos += outro.pedidos
+        self.divergentes += outro.divergentes
+        self.por_categoria.update(outro.por_categoria)
+        self.por_combinacao.update(outro.por_combinacao)
+        self.divergentes_por_combinacao.update(outro.divergentes_por_combinacao)
+        self.soma_diferencas += outro.soma_diferencas
+        if abs(outro.maior_diferenca) > abs(self.maior_diferenca):
+            self.maior_diferenca = outro.maior_diferenca
+        for categoria, (vistos_b, amostra_b) in outro.exemplos.items():
+            vistos_a, amostra_a = self.exemplos.get(categoria, (0, []))
+            self.exemplos[categoria] = (
+                vistos_a + vistos_b,
+                _fundir_amostras(vistos_a, amostra_a, vistos_b, amostra_b,
+                                 self.amostras, self._aleatorio))
+
+    def para_dict(self) -> Dict:
+        return {
+            "pedidos": self.pedidos,
+            "divergentes": self.divergentes,
+            "taxa_divergencia": self.divergentes / self.pedidos if self.pedidos else 0.0,
+            "por_categoria": {categoria: self.por_categoria[categoria] for categoria in CATEGORIAS},
+            "por_combinacao": {
+                combinacao: {"pedidos": total,
+                             "divergentes": self.divergentes_por_combinacao[combinacao]}
+                for combinacao, total in sorted(self.por_combinacao.items())},
+            "diferenca_total": {"soma": round(self.soma_diferencas, 2),
+                                "maior": round(self.maior_diferenca, 2)},
+            "amostras": {categoria: sorted(amostra, key=lambda exemplo: exemplo["id"])
+                         for categoria, (_, amostra) in sorted(self.exemplos.items())},
+        }
+
+
+def _exemplo(dados: Dict, legado: Dict, refatorado: Dict, categorias: List[str]) -> Dict:
+    return {"id": dados["id"], "pagamento": dados["pagamento"], "frete": dados["frete"],
+            "embalagem_presente": dados["embalagem_presente"],
+            "itens": len(dados["itens"]),
+            "valor_base": round(sum(item["valor"] for item in dados["itens"]), 2),
+            "categorias": categorias,
+            "legado": {chave: round(valor, 2) if isinstance(valor, float) else valor
+                       for chave, valor in legado.items()},
+            "refatorado": {chave: round(valor, 2) if isinstance(valor, float) else valor
+                           for chave, valor in refatorado.items()}}
+
+
+def _fundir_amostras(vistos_a: int, amostra_a: List[Dict], vistos_b: int, amostra_b: List[Dict],
+                     tamanho: int, aleatorio: random.Random) -> List[Dict]:
+    """Amostra uniforme da união de dois fluxos, a partir das amostras de cada um.
+
+    Cada vaga é sorteada de um dos fluxos com probabilidade proporcional aos
+    exemplos ainda não sorteados dele (amostragem sem reposição).
+    """
+    amostra_a, amostra_b = amostra_a[:], amostra_b[:]
+    aleatorio.shuffle(amostra_a)
+    aleatorio.shuffle(amostra_b)
+    resultado = []
+    while len(resultado) < tamanho and (amostra_a or amostra_b):
+        if amostra_a and aleatorio.random() * (vistos_a + vistos_b) < vistos_a:
+            resultado.append(amostra_a.pop())
+            vistos_a -= 1
+        elif amostra_b:
+            resultado.append(amostra_b.pop())
+            vistos_b -= 1
+        else:
+            resultado.append(amostra_a.pop())
+            vistos_a -= 1
+    return resultado
+
+
+# ===== Execução =====
+class _SaidaDescartada:
+    """stdout que descarta tudo; mais barato que escrever em os.devnull."""
+
+    def write(self, texto: str) -> int:
+        return len(texto)
+
+    def flush(self) -> None:
+        pass
+
+
+_GERADORES: Dict[Tuple[int, PerfilCarga], GeradorPedidos] = {}
+
+
+def comparar_pedidos(pedidos: Iterable[Dict], relatorio: Optional[RelatorioSombra] = None) -> RelatorioSombra:
+    """Passa cada pedido pelos dois motores, com a saída suprimida."""
+    relatorio = relatorio or RelatorioSombra()
+    facade = CheckoutFacade()
+    with contextlib.redirect_stdout(_SaidaDescartada()):
+        for dados in pedidos:
+            relatorio.registrar(dados, executar_legado(dados), executar_refatorado(dados, facade))
+    return relatorio
+
+
+def _verificar_trecho(semente: int, perfil: PerfilCarga, inicio: int, quantidade: int,
+                      amostras: int) -> RelatorioSombra:
+    """Tarefa de um processo do pool: gera e compara um trecho de pedidos."""
+    gerador = _GERADORES.get((semente, perfil))
+    if gerador is None:
+        gerador = _GERADORES[(semente, perfil)] = GeradorPedidos(semente, perfil)
+    return comparar_pedidos(gerador.gerar(quantidade, inicio),
+                            RelatorioSombra(amostras, semente=f"{semente}:{inicio}"))
+
+
+def verificar(quantidade: int, semente: int = 0, perfil: Optional[PerfilCarga] = None,
+              trabalhadores: Optional[int] = None, lote: int = 16 * TAMANHO_BLOCO,
+              amostras: int = 5, progresso=None) -> Dict:
+    """Compara os dois motores em `quantidade` pedidos gerados.
+
+    Args:
+        quantidade: Pedidos a comparar.
+        semente: Semente do gerador de pedidos.
+        perfil: Perfil da carga. Se None, usa PERFIL_COMUM.
+        trabalhadores: Processos do pool. Com 1, roda no próprio processo.
+            Se None, um por CPU.
+        lote: Pedidos por tarefa (múltiplo de TAMANHO_BLOCO evita gerar
+            blocos em dobro).
+        amostras: Exemplos guardados por categoria de divergência.
+        progresso: Função chamada com (pedidos comparados, total) a cada
+            trecho concluído.
+
+    Returns:
+        O relatório, como dicionário pronto para JSON.
+    """
+    perfil = perfil or PERFIL_COMUM
+    trechos = [(inicio, min(lote, quantidade - inicio)) for inicio in range(0, quantidade, lote)]
+    relatorio = RelatorioSombra(amostras, semente)
+    comeco = time.perf_counter()
+    if trabalhadores == 1:
+        for inicio, tamanho in trechos:
+            relatorio.fundir(_verificar_trecho(semente, perfil, inicio, tamanho, amostras))
+            if progresso:
+                progresso(relatorio.pedidos, quantidade)
+    else:
+        with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+            tarefas = [executor.submit(_verificar_trecho, semente, perfil, inicio, tamanho, amostras)
+                       for inicio, tamanho in trechos]
+            for tarefa in as_completed(tarefas):
+                relatorio.fundir(tarefa.result())
+                if progresso:
+                    progresso(relatorio.pedidos, quantidade)
+    duracao = time.perf_counter() - comeco
+
+    resultado = relatorio.para_dict()
+    resultado.update(semente=semente, perfil=asdict(perfil), segundos=round(duracao, 3),
+                     pedidos_por_segundo=round(relatorio.pedidos / duracao) if duracao else 0)
+    return resultado
+
+
+def imprimir_resumo(resultado: Dict) -> None:
+    print(f"\n{resultado['pedidos']:,} pedidos comparados em {resultado['segundos']:.1f}s "
+          f"({resultado['pedidos_por_segundo']:,} pedidos/s)")
+    print(f"Divergentes: {resultado['divergentes']:,} ({resultado['taxa_divergencia']:.1%})")
+    print(f"\n{'Categoria':<14}{'Pedidos':>12}")
+    for categoria, total in resultado["por_categoria"].items():
+        print(f"{categoria:<14}{total:>12,}")
+    print(f"\n{'Combinação':<26}{'Pedidos':>12}{'Divergentes':>14}")
+    for combinacao, contagem in resultado["por_combinacao"].items():
+        print(f"{combinacao:<26}{contagem['pedidos']:>12,}{contagem['divergentes']:>14,}")
+    diferenca = resultado["diferenca_total"]
+    print(f"\nDiferença no total cobrado (refatorado - legado): soma R$ {diferenca['soma']:,.2f}, "
+          f"maior R$ {diferenca['maior']:,.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Compara o checkout legado com o refatorado.")
+    parser.add_argument("--quantidade", type=int, default=100_000)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--skus", type=int, default=PerfilCarga.skus)
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="processos do pool (padrão: um por CPU)")
+    parser.add_argument("--lote", type=int, default=16 * TAMANHO_BLOCO, help="pedidos por tarefa")
+    parser.add_argument("--amostras", type=int, default=5, help="exemplos por categoria")
+    parser.add_argument("--todos-os-metodos", action="store_true",
+                        help="inclui pagamentos e fretes que só o refatorado conhece")
+    parser.add_argument("--saida", help="grava o relatório completo em JSON")
+    args = parser.parse_args()
+
+    if args.todos_os_metodos:
+        perfil = PerfilCarga(skus=args.skus)
+    else:
+        perfil = replace(PERFIL_COMUM, skus=args.skus)
+
+    def mostrar_progresso(feitos, total):
+        print(f"\r{feitos:,}/{total:,} pedidos", end="", file=sys.stderr, flush=True)
+
+    resultado = verificar(args.quantidade, args.semente, perfil, args.trabalhadores,
+                          args.lote, args.amostras, mostrar_progresso)
+    print(file=sys.stderr)
+    imprimir_resumo(resultado)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+        print(f"\nRelatório gravado em {args.saida}")
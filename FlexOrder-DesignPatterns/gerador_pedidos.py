@@ -0,0 +1,296 @@
+"""
+Gerador determinístico de pedidos sintéticos para testes de carga do checkout.
+
+Os pedidos seguem um perfil configurável: SKUs com popularidade Zipf, preços
+log-normais fixos por SKU, tamanho de cesta por pesos e mistura de formas de
+pagamento, fretes e embalagem de presente. A mesma semente sempre gera os
+mesmos pedidos, e qualquer trecho da sequência pode ser gerado sem gerar o
+que vem antes (útil para dividir a carga entre processos).
+
+Uso:
+    python gerador_pedidos.py --quantidade 1000000 --formato jsonl --saida pedidos.jsonl
+    python gerador_pedidos.py --quantidade 1000000 --formato colunas --saida pedidos/
+    python gerador_pedidos.py --quantidade 10000 --checkout
+"""
+import contextlib
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Os pedidos são gerados em blocos; cada bloco tem o seu próprio
+# random.Random, com semente derivada, o que permite começar de qualquer bloco.
+TAMANHO_BLOCO = 1024
+
+
+@dataclass(frozen=True)
+class PerfilCarga:
+    """Forma da carga gerada.
+
+    Attributes:
+        skus: Tamanho do catálogo.
+        expoente_zipf: Quanto maior, mais concentradas as vendas nos SKUs do topo.
+        preco_mediana: Preço mediano de um SKU.
+        preco_dispersao: Desvio padrão do log do preço (log-normal).
+        tamanhos_cesta: Pares (itens no pedido, peso relativo).
+        pagamentos: Pares (nome no registro de estratégias, peso relativo).
+        fretes: Pares (nome no registro de estratégias, peso relativo).
+        taxa_embalagem: Fração dos pedidos com embalagem de presente.
+    """
+    skus: int = 10_000
+    expoente_zipf: float = 1.1
+    preco_mediana: float = 60.0
+    preco_dispersao: float = 1.0
+    tamanhos_cesta: Tuple[Tuple[int, float], ...] = (
+        (1, 40), (2, 25), (3, 14), (4, 8), (5, 5), (6, 3), (8, 3), (12, 2))
+    pagamentos: Tuple[Tuple[str, float], ...] = (("pix", 45), ("credito", 45), ("mana", 10))
+    fretes: Tuple[Tuple[str, float], ...] = (("normal", 60), ("expresso", 30), ("teletransporte", 10))
+    taxa_embalagem: float = 0.08
+
+
+def _acumulados(pesos) -> List[float]:
+    """Pesos acumulados, no formato de `cum_weights` de random.choices."""
+    return list(itertools.accumulate(pesos))
+
+
+class GeradorPedidos:
+    """Gera pedidos sintéticos reprodutíveis a partir de uma semente."""
+
+    def __init__(self, semente: int = 0, perfil: Optional[PerfilCarga] = None):
+        """
+        Args:
+            semente: Define toda a sequência de pedidos e o catálogo.
+            perfil: A forma da carga. Se None, usa PerfilCarga().
+        """
+        self.semente = semente
+        self.perfil = perfil or PerfilCarga()
+        p = self.perfil
+
+        # Catálogo: nomes e preços fixos por SKU, e pesos Zipf acumulados.
+        aleatorio = random.Random(f"{semente}:catalogo")
+        mu = math.log(p.preco_mediana)
+        self.nomes = [f"SKU-{indice:07d}" for indice in range(p.skus)]
+        self.precos = array("d", (round(aleatorio.lognormvariate(mu, p.preco_dispersao), 2) or 0.01
+                                  for _ in range(p.skus)))
+        self._pesos_skus = _acumulados(1.0 / (posto ** p.expoente_zipf) for posto in range(1, p.skus + 1))
+
+        self._tamanhos = [tamanho for tamanho, _ in p.tamanhos_cesta]
+        self._pesos_tamanhos = _acumulados(peso for _, peso in p.tamanhos_cesta)
+        self._pagamentos = [nome for nome, _ in p.pagamentos]
+        self._pesos_pagamentos = _acumulados(peso for _, peso in p.pagamentos)
+        self._fretes = [nome for nome, _ in p.fretes]
+        self._pesos_fretes = _acumulados(peso for _, peso in p.fretes)
+
+    def catalogo(self):
+        """O catálogo do gerador como `subsistemas.catalogo.CatalogoProdutos`,
+        com o índice de cada SKU igual ao do gerador."""
+        from subsistemas.catalogo import CatalogoProdutos
+
+        catalogo = CatalogoProdutos()
+        catalogo.cadastrar_lote(self.nomes, self.nomes, self.precos)
+        return catalogo
+
+    def gerar(self, quantidade: int, inicio: int = 0) -> Iterator[Dict]:
+        """Gera os pedidos de número `inicio` a `inicio + quantidade - 1`.
+
+        Returns:
+            Iterador de dicionários com id, itens (sku, nome, valor),
+            pagamento, frete e embalagem_presente.
+        """
+        for indice, sku_itens, pagamento, frete, embalagem in self._gerar_bruto(quantidade, inicio):
+            yield {
+                "id": indice,
+                "itens": [{"sku": sku, "nome": self.nomes[sku], "valor": self.precos[sku]}
+                          for sku in sku_itens],
+                "pagamento": pagamento,
+                "frete": frete,
+                "embalagem_presente": embalagem,
+            }
+
+    def _gerar_bruto(self, quantidade: int, inicio: int) -> Iterator[Tuple[int, List[int], str, str, bool]]:
+        """Gera (id, índices dos SKUs, pagamento, frete, embalagem) sem montar dicionários."""
+        fim = inicio + quantidade
+        bloco = inicio // TAMANHO_BLOCO
+        populacao_skus = range(self.perfil.skus)
+        taxa_embalagem = self.perfil.taxa_embalagem
+        while bloco * TAMANHO_BLOCO < fim:
+            aleatorio = random.Random(f"{self.semente}:{bloco}")
+            escolher, sortear = aleatorio.choices, aleatorio.random
+            primeiro = bloco * TAMANHO_BLOCO
+            for indice in range(primeiro, min(primeiro + TAMANHO_BLOCO, fim)):
+                # Os sorteios acontecem sempre, para que o estado do gerador
+                # não dependa de onde o trecho pedido começa.
+                tamanho = escolher(self._tamanhos, cum_weights=self._pesos_tamanhos)[0]
+                skus = escolher(populacao_skus, cum_weights=self._pesos_skus, k=tamanho)
+                pagamento = escolher(self._pagamentos, cum_weights=self._pesos_pagamentos)[0]
+                frete = escolher(self._fretes, cum_weights=self._pesos_fretes)[0]
+                embalagem = sortear() < taxa_embalagem
+                if indice >= inicio:
+                    yield indice, skus, pagamento, frete, embalagem
+            bloco += 1
+
+    def escrever_jsonl(self, caminho: str, quantidade: int, inicio: int = 0) -> int:
+        """Grava um pedido por linha em JSON. Retorna quantos foram gravados."""
+        total = 0
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            for pedido in self.gerar(quantidade, inicio):
+                arquivo.write(json.dumps(pedido, ensure_ascii=False, separators=(",", ":")))
+                arquivo.write("\n")
+                total += 1
+        return total
+
+    def escrever_colunas(self, diretorio: str, quantidade: int, inicio: int = 0) -> int:
+        """Grava os pedidos em formato colunar: um arquivo binário por coluna.
+
+        Colunas por pedido: id, pagamento, frete, embalagem e fim_itens (o
+        índice, nas colunas de itens, logo após o último item do pedido).
+        Colunas por item: sku e valor. O arquivo `manifesto.json` descreve
+        tipos, códigos das categorias, o catálogo e o perfil usado.
+
+        Returns:
+            Quantos pedidos foram gravados.
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        codigos_pagamento = {nome: codigo for codigo, nome in enumerate(self._pagamentos)}
+        codigos_frete = {nome: codigo for codigo, nome in enumerate(self._fretes)}
+        colunas = {"id": array("q"), "pagamento": array("B"), "frete": array("B"),
+                   "embalagem": array("B"), "fim_itens": array("q"),
+                   "sku": array("I"), "valor": array("d")}
+        arquivos = {nome: open(os.path.join(diretorio, f"{nome}.bin"), "wb") for nome in colunas}
+        total = itens = 0
+        try:
+            for indice, skus, pagamento, frete, embalagem in self._gerar_bruto(quantidade, inicio):
+                colunas["id"].append(indice)
+                colunas["pagamento"].append(codigos_pagamento[pagamento])
+                colunas["frete"].append(codigos_frete[frete])
+                colunas["embalagem"].append(embalagem)
+                colunas["sku"].extend(skus)
+                colunas["valor"].extend(self.precos[sku] for sku in skus)
+                itens += len(skus)
+                colunas["fim_itens"].append(itens)
+                total += 1
+                if total % TAMANHO_BLOCO == 0:
+                    self._descarregar(colunas, arquivos)
+            self._descarregar(colunas, arquivos)
+        finally:
+            for arquivo in arquivos.values():
+                arquivo.close()
+
+        manifesto = {
+            "pedidos": total,
+            "itens": itens,
+            "inicio": inicio,
+            "semente": self.semente,
+            "ordem_bytes": sys.byteorder,
+            "tipos": {nome: coluna.typecode for nome, coluna in colunas.items()},
+            "pagamentos": self._pagamentos,
+            "fretes": self._fretes,
+            "nomes_skus": "SKU-{sku:07d}",
+            "perfil": asdict(self.perfil),
+        }
+        with open(os.path.join(diretorio, "manifesto.json"), "w", encoding="utf-8") as arquivo:
+            json.dump(manifesto, arquivo, indent=2)
+        return total
+
+    @staticmethod
+    def _descarregar(colunas: Dict[str, array], arquivos) -> None:
+        """Grava o conteúdo das colunas em memória e as esvazia."""
+        for nome, coluna in colunas.items():
+            coluna.tofile(arquivos[nome])
+            del coluna[:]
+
+
+def ler_colunas(diretorio: str) -> Iterator[Dict]:
+    """Lê de volta, como dicionários, os pedidos gravados por `escrever_colunas`."""
+    with open(os.path.join(diretorio, "manifesto.json"), encoding="utf-8") as arquivo:
+        manifesto = json.load(arquivo)
+    colunas = {}
+    for nome, tipo in manifesto["tipos"].items():
+        coluna = array(tipo)
+        with open(os.path.join(diretorio, f"{nome}.bin"), "rb") as arquivo:
+            coluna.frombytes(arquivo.read())
+        if manifesto["ordem_bytes"] != sys.byteorder:
+            coluna.byteswap()
+        colunas[nome] = coluna
+
+    anterior = 0
+    for posicao in range(manifesto["pedidos"]):
+        fim = colunas["fim_itens"][posicao]
+        yield {
+            "id": colunas["id"][posicao],
+            "itens": [{"sku": sku, "nome": manifesto["nomes_skus"].format(sku=sku), "valor": valor}
+                      for sku, valor in zip(colunas["sku"][anterior:fim], colunas["valor"][anterior:fim])],
+            "pagamento": manifesto["pagamentos"][colunas["pagamento"][posicao]],
+            "frete": manifesto["fretes"][colunas["frete"][posicao]],
+            "embalagem_presente": bool(colunas["embalagem"][posicao]),
+        }
+        anterior = fim
+
+
+def para_pedido(dados: Dict):
+    """Converte um pedido gerado num `sistema_pedidos.Pedido`, usando o registro
+    de estratégias para instanciar pagamento e frete pelo nome."""
+    from sistema_pedidos import Pedido
+    from sistema_pedidos.registro import obter_frete, obter_pagamento
+
+    return Pedido(dados["itens"], obter_pagamento(dados["pagamento"])(),
+                  obter_frete(dados["frete"])(), dados["embalagem_presente"])
+
+
+def enviar_para_checkout(pedidos, sistema=None) -> Dict[str, float]:
+    """Processa os pedidos no `SistemaPedidos`, com a saída suprimida.
+
+    Returns:
+        Pedidos, aprovados, rejeitados, segundos e pedidos por segundo.
+    """
+    if sistema is None:
+        from sistema_pedidos import SistemaPedidos
+        sistema = SistemaPedidos()
+    aprovados = rejeitados = 0
+    inicio = time.perf_counter()
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        for dados in pedidos:
+            if sistema.processar_pedido(para_pedido(dados)):
+                aprovados += 1
+            else:
+                rejeitados += 1
+    duracao = time.perf_counter() - inicio
+    total = aprovados + rejeitados
+    return {"pedidos": total, "aprovados": aprovados, "rejeitados": rejeitados,
+            "segundos": duracao, "pedidos_por_segundo": total / duracao if duracao else 0.0}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera pedidos sintéticos para testes de carga.")
+    parser.add_argument("--quantidade", type=int, default=10_000)
+    parser.add_argument("--inicio", type=int, default=0, help="número do primeiro pedido")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--skus", type=int, default=PerfilCarga.skus)
+    parser.add_argument("--formato", choices=("jsonl", "colunas"), default="jsonl")
+    parser.add_argument("--saida", help="arquivo (jsonl) ou diretório (colunas)")
+    parser.add_argument("--checkout", action="store_true",
+                        help="envia os pedidos ao SistemaPedidos em vez de gravar")
+    args = parser.parse_args()
+
+    gerador = GeradorPedidos(args.semente, PerfilCarga(skus=args.skus))
+    if args.checkout:
+        print(enviar_para_checkout(gerador.gerar(args.quantidade, args.inicio)))
+    elif args.saida is None:
+        for pedido in gerador.gerar(args.quantidade, args.inicio):
+            print(json.dumps(pedido, ensure_ascii=False))
+    else:
+        comeco = time.perf_counter()
+        if args.formato == "jsonl":
+            total = gerador.escrever_jsonl(args.saida, args.quantidade, args.inicio)
+        else:
+            total = gerador.escrever_colunas(args.saida, args.quantidade, args.inicio)
+        duracao = time.perf_counter() - comeco
+        print(f"{total} pedidos gravados em {args.saida} ({total / duracao:,.0f} pedidos/s)")
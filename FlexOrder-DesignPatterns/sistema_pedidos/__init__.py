@@ -1,21 +1,39 @@
 """
 Sistema de Pedidos - E-commerce Mágico
+
+Os nomes abaixo são importados sob demanda: `import sistema_pedidos` não
+carrega nenhuma estratégia, e `from sistema_pedidos import PagamentoPix`
+importa apenas o módulo de pagamentos.
 """
+import importlib
+
+_ORIGENS = {
+    'Pedido': '.pedido',
+    'MetodoPagamento': '.pedido',
+    'EstrategiaFrete': '.pedido',
+    'PagamentoPix': '.pagamentos',
+    'PagamentoCredito': '.pagamentos',
+    'PagamentoMana': '.pagamentos',
+    'FreteNormal': '.fretes',
+    'FreteExpresso': '.fretes',
+    'FreteTeletransporte': '.fretes',
+    'SistemaPedidos': '.sistema',
+    'REGISTRO': '.registro',
+    'obter_pagamento': '.registro',
+    'obter_frete': '.registro',
+}
+
+__all__ = list(_ORIGENS)
+
+
+def __getattr__(nome):
+    origem = _ORIGENS.get(nome)
+    if origem is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(origem, __name__), nome)
+    globals()[nome] = valor
+    return valor
 
-from .pedido import Pedido, MetodoPagamento, EstrategiaFrete
-from .pagamentos import PagamentoPix, PagamentoCredito, PagamentoMana
-from .fretes import FreteNormal, FreteExpresso, FreteTeletransporte
-from .sistema import SistemaPedidos
 
-__all__ = [
-    'Pedido',
-    'MetodoPagamento',
-    'EstrategiaFrete',
-    'PagamentoPix',
-    'PagamentoCredito',
-    'PagamentoMana',
-    'FreteNormal',
-    'FreteExpresso',
-    'FreteTeletransporte',
-    'SistemaPedidos',
-]
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
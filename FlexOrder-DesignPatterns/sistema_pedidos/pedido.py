@@ -1,12 +1,49 @@
 """
 Modelo base do pedido e interfaces de estratégia.
 """
+import importlib
+import threading
 from abc import ABC, abstractmethod
+from functools import wraps
 from typing import List, Dict
 
+_TRAVA_INSTRUMENTACAO = threading.Lock()
+
+
+def _instrumentar_sob_demanda(classe, metodo: str, instrumentador: str) -> None:
+    """Adia a instrumentação de `classe.metodo` até a primeira chamada.
+
+    Importar subsistemas.metricas carrega o pacote subsistemas inteiro; assim,
+    importar uma estratégia continua barato e só quem a usa paga pelas métricas.
+    Na primeira chamada, o método original volta ao lugar e é envolvido por
+    `subsistemas.metricas.<instrumentador>`.
+    """
+    original = classe.__dict__.get(metodo)
+    if original is None:
+        return
+
+    @wraps(original)
+    def primeira_chamada(self, *args, **kwargs):
+        with _TRAVA_INSTRUMENTACAO:
+            if classe.__dict__.get(metodo) is primeira_chamada:
+                setattr(classe, metodo, original)
+                metricas = importlib.import_module("subsistemas.metricas")
+                getattr(metricas, instrumentador)(classe)
+        return classe.__dict__[metodo](self, *args, **kwargs)
+
+    setattr(classe, metodo, primeira_chamada)
+
 
 class MetodoPagamento(ABC):
-    """Interface para estratégias de pagamento."""
+    """Interface para estratégias de pagamento.
+
+    Toda implementação é instrumentada automaticamente, no primeiro uso:
+    aprovações, rejeições, valores e latência ficam em subsistemas.metricas.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _instrumentar_sob_demanda(cls, "processar", "instrumentar_pagamento")
+
     @abstractmethod
     def processar(self, valor: float) -> bool:
         """Processa o pagamento e retorna se foi aprovado."""
@@ -14,7 +51,15 @@ class MetodoPagamento(ABC):
 
 
 class EstrategiaFrete(ABC):
-    """Interface para estratégias de cálculo de frete."""
+    """Interface para estratégias de cálculo de frete.
+
+    Toda implementação é instrumentada automaticamente, no primeiro uso: a
+    distribuição dos custos calculados fica em subsistemas.metricas.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _instrumentar_sob_demanda(cls, "calcular", "instrumentar_frete")
+
     @abstractmethod
     def calcular(self, valor: float) -> float:
         """Calcula o valor do frete baseado no valor do pedido."""
@@ -0,0 +1,168 @@
+"""
+Registro preguiçoso das estratégias de pagamento e frete.
+
+Cada estratégia é conhecida por um nome curto ("pix", "expresso", ...) e por
+um alvo no formato "modulo:Classe". O módulo só é importado na primeira vez
+em que a estratégia é pedida, de modo que um processo que usa apenas o PIX
+não paga a importação das demais.
+"""
+import importlib
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Grupos de entry points consultados para estratégias de pacotes externos.
+GRUPO_ENTRY_POINT = "sistema_pedidos.{grupo}"
+
+ESTRATEGIAS_PADRAO: Dict[str, Dict[str, str]] = {
+    "pagamento": {
+        "pix": ".pagamentos:PagamentoPix",
+        "credito": ".pagamentos:PagamentoCredito",
+        "mana": ".pagamentos:PagamentoMana",
+    },
+    "frete": {
+        "normal": ".fretes:FreteNormal",
+        "expresso": ".fretes:FreteExpresso",
+        "teletransporte": ".fretes:FreteTeletransporte",
+    },
+}
+
+
+class RegistroEstrategias:
+    """
+    Mapeia (grupo, nome) para classes importadas sob demanda.
+
+    Não usa travas: importlib já serializa a importação de cada módulo, e no
+    pior caso duas threads gravam a mesma classe no cache.
+    """
+
+    def __init__(self, entradas: Optional[Dict[str, Dict[str, str]]] = None,
+                 pacote: str = __package__, usar_entry_points: bool = True):
+        """
+        Args:
+            entradas: Para cada grupo, nome -> "modulo:Classe". Módulos que
+                começam com "." são relativos a `pacote`.
+            pacote: Pacote base dos alvos relativos.
+            usar_entry_points: Se True, nomes desconhecidos são procurados nos
+                entry points "sistema_pedidos.<grupo>" dos pacotes instalados.
+        """
+        self._alvos = {grupo: dict(nomes) for grupo, nomes in (entradas or {}).items()}
+        self._classes: Dict[Tuple[str, str], type] = {}
+        self._pacote = pacote
+        self._usar_entry_points = usar_entry_points
+        self._entry_points_lidos = set()
+
+    def registrar(self, grupo: str, nome: str, alvo) -> None:
+        """Registra uma estratégia por alvo "modulo:Classe" ou pela própria classe."""
+        self._classes.pop((grupo, nome), None)
+        if isinstance(alvo, str):
+            self._alvos.setdefault(grupo, {})[nome] = alvo
+        else:
+            self._alvos.setdefault(grupo, {})[nome] = f"{alvo.__module__}:{alvo.__qualname__}"
+            self._classes[(grupo, nome)] = alvo
+
+    def nomes(self, grupo: str) -> List[str]:
+        """Lista os nomes registrados no grupo, sem importar nada."""
+        self._ler_entry_points(grupo)
+        return sorted(self._alvos.get(grupo, {}))
+
+    def obter(self, grupo: str, nome: str) -> type:
+        """Retorna a classe da estratégia, importando o módulo se necessário.
+
+        Raises:
+            KeyError: Se o nome não estiver registrado no grupo.
+        """
+        classe = self._classes.get((grupo, nome))
+        if classe is not None:
+            return classe
+        if nome not in self._alvos.get(grupo, {}):
+            self._ler_entry_points(grupo)
+        try:
+            alvo = self._alvos[grupo][nome]
+        except KeyError:
+            raise KeyError(f"Estratégia de {grupo} desconhecida: '{nome}'.") from None
+
+        modulo, _, atributo = alvo.partition(":")
+        objeto = importlib.import_module(modulo, self._pacote if modulo.startswith(".") else None)
+        for parte in atributo.split("."):
+            objeto = getattr(objeto, parte)
+        self._classes[(grupo, nome)] = objeto
+        return objeto
+
+    def criar(self, grupo: str, nome: str, *args, **kwargs):
+        """Instancia a estratégia `nome` do grupo."""
+        return self.obter(grupo, nome)(*args, **kwargs)
+
+    def _ler_entry_points(self, grupo: str) -> None:
+        """Acrescenta os entry points do grupo (só os nomes; nada é importado)."""
+        if not self._usar_entry_points or grupo in self._entry_points_lidos:
+            return
+        self._entry_points_lidos.add(grupo)
+        from importlib import metadata  # caro de importar: só quando necessário
+
+        encontrados = metadata.entry_points(group=GRUPO_ENTRY_POINT.format(grupo=grupo))
+        nomes = self._alvos.setdefault(grupo, {})
+        for entry_point in encontrados:
+            nomes.setdefault(entry_point.name, entry_point.value)
+
+
+REGISTRO = RegistroEstrategias(ESTRATEGIAS_PADRAO)
+
+
+def obter_pagamento(nome: str) -> type:
+    """Retorna a classe do método de pagamento `nome` (ex.: "pix")."""
+    return REGISTRO.obter("pagamento", nome)
+
+
+def obter_frete(nome: str) -> type:
+    """Retorna a classe da estratégia de frete `nome` (ex.: "expresso")."""
+    return REGISTRO.obter("frete", nome)
+
+
+_LINHA_IMPORTTIME = r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)"
+
+
+def relatorio_importacao(codigo: str = "import sistema_pedidos",
+                         caminho: Optional[str] = None) -> List[Tuple[str, int, int]]:
+    """Mede as importações de `codigo` num interpretador novo com -X importtime.
+
+    Args:
+        codigo: O código executado no processo filho.
+        caminho: Diretório usado como diretório de trabalho (e sys.path[0]).
+
+    Returns:
+        Lista de (módulo, próprio em µs, acumulado em µs), do mais caro para o
+        mais barato pelo tempo acumulado.
+    """
+    import re
+    import subprocess
+
+    resultado = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                               cwd=caminho, capture_output=True, text=True, check=True)
+    medicoes = []
+    for linha in resultado.stderr.splitlines():
+        encontrado = re.match(_LINHA_IMPORTTIME, linha)
+        if encontrado:
+            proprio, acumulado, _, modulo = encontrado.groups()
+            medicoes.append((modulo, int(proprio), int(acumulado)))
+    medicoes.sort(key=lambda medicao: medicao[2], reverse=True)
+    return medicoes
+
+
+def imprimir_relatorio(codigo: str = "import sistema_pedidos", limite: int = 10,
+                       caminho: Optional[str] = None) -> None:
+    """Imprime os módulos mais caros de importar para `codigo`."""
+    medicoes = relatorio_importacao(codigo, caminho)
+    print(f"\n$ python -X importtime -c {codigo!r}")
+    print(f"{'acumulado (µs)':>15} {'próprio (µs)':>13}  módulo")
+    for modulo, proprio, acumulado in medicoes[:limite]:
+        print(f"{acumulado:>15} {proprio:>13}  {modulo}")
+
+
+if __name__ == "__main__":
+    import os
+
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for codigo in ("import sistema_pedidos",
+                   "from sistema_pedidos.registro import obter_pagamento; obter_pagamento('pix')",
+                   "from sistema_pedidos import SistemaPedidos, PagamentoPix, FreteNormal"):
+        imprimir_relatorio(codigo, limite=6, caminho=raiz)
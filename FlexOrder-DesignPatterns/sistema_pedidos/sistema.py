@@ -4,6 +4,10 @@ Fachada principal do sistema de pedidos.
 from .pedido import Pedido
 from typing import Optional
 
+from subsistemas.metricas import MedidorFluxo
+
+_FLUXO_PEDIDOS = MedidorFluxo("pedidos_processados", "Pedidos processados")
+
 
 class SistemaPedidos:
     """Fachada que simplifica todas as operações do pedido."""
@@ -11,6 +15,7 @@ class SistemaPedidos:
     def __init__(self):
         self._pedidos_processados = []
 
+    @_FLUXO_PEDIDOS.medir
     def processar_pedido(self, pedido: Pedido) -> bool:
         """Processa um pedido aplicando descontos, frete e pagamento."""
         print("=========================================")
@@ -38,6 +43,7 @@ class SistemaPedidos:
             print(f"Adicionando R${taxa:.2f} de Embalagem de Presente.")
 
         print(f"\nValor a Pagar: R${valor_final:.2f}")
+        _FLUXO_PEDIDOS.valor(valor_final)
 
         # 5. Processar pagamento
         sucesso = pedido.metodo_pagamento.processar(valor_final)
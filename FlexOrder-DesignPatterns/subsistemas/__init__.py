@@ -1,4 +1,5 @@
 from .estoque import SistemaEstoque
 from .nota_fiscal import GeradorNotaFiscal
+from .notificacao import ServicoEmail
 
-__all__ = ["SistemaEstoque", "GeradorNotaFiscal"]
+__all__ = ["SistemaEstoque", "GeradorNotaFiscal", "ServicoEmail"]
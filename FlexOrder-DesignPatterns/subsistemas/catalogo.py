@@ -0,0 +1,181 @@
+"""
+Catálogo de produtos: índice SKU -> preço/metadados e pedidos compactos.
+
+Cada SKU recebe um índice inteiro na ordem de cadastro; preços ficam num
+array contíguo e nomes/metadados em listas paralelas. Um `PedidoCompacto`
+guarda só os índices e as quantidades (dois arrays), em vez de repetir
+nome e preço em dicionários a cada pedido, e é precificado pelo catálogo.
+
+Os preços são arredondados ao centavo por unidade e somados em centavos
+inteiros, então o total de um pedido não depende da ordem da soma (item a
+item ou em lote).
+
+Toda alteração de preço incrementa a versão do catálogo e carimba os SKUs
+afetados. Um reajuste geral (`reajustar`) é uma única operação: muda o fator
+aplicado a todos os preços, sem percorrer o catálogo.
+"""
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele, os lotes são somados item a item.
+    np = None
+
+
+class CatalogoProdutos:
+    """Índice de produtos por SKU com preços versionados."""
+
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+        self.skus: List[str] = []
+        self.nomes: List[str] = []
+        self.metadados: List[Optional[Dict]] = []
+        self._precos = array("d")
+        # Versão do catálogo em que o preço de cada SKU mudou pela última vez.
+        self._versoes = array("Q")
+        self._fator = 1.0
+        self._versao_fator = 0
+        self.versao = 0
+
+    def __len__(self) -> int:
+        return len(self.skus)
+
+    def __contains__(self, sku: str) -> bool:
+        return sku in self._indices
+
+    def cadastrar(self, sku: str, nome: str, preco: float, **metadados) -> int:
+        """Cadastra um produto e retorna o seu índice.
+
+        Raises:
+            ValueError: Se o SKU já estiver cadastrado.
+        """
+        if sku in self._indices:
+            raise ValueError(f"SKU '{sku}' já cadastrado.")
+        sku = sys.intern(sku)
+        indice = len(self.skus)
+        self._indices[sku] = indice
+        self.skus.append(sku)
+        self.nomes.append(nome)
+        self.metadados.append(metadados or None)
+        self._precos.append(preco / self._fator)
+        self.versao += 1
+        self._versoes.append(self.versao)
+        return indice
+
+    def cadastrar_lote(self, skus: Iterable[str], nomes: Iterable[str], precos: Iterable[float]) -> None:
+        """Cadastra vários produtos de uma vez (sem metadados)."""
+        for sku, nome, preco in zip(skus, nomes, precos):
+            self.cadastrar(sku, nome, preco)
+
+    def indice(self, sku: str) -> int:
+        """Retorna o índice do SKU.
+
+        Raises:
+            KeyError: Se o SKU não estiver cadastrado.
+        """
+        try:
+            return self._indices[sku]
+        except KeyError:
+            raise KeyError(f"SKU '{sku}' não cadastrado.") from None
+
+    def preco(self, sku: str) -> float:
+        """Preço atual do SKU, já com o fator de reajuste."""
+        return self._centavos(self.indice(sku)) / 100
+
+    def _centavos(self, indice: int) -> int:
+        return round(self._precos[indice] * self._fator * 100)
+
+    def versao_preco(self, sku: str) -> int:
+        """Versão do catálogo em que o preço do SKU mudou pela última vez."""
+        return max(self._versoes[self.indice(sku)], self._versao_fator)
+
+    def alterar_preco(self, sku: str, preco: float) -> None:
+        """Define o preço de um SKU."""
+        indice = self.indice(sku)
+        self._precos[indice] = preco / self._fator
+        self.versao += 1
+        self._versoes[indice] = self.versao
+
+    def reajustar(self, fator: float) -> None:
+        """Multiplica todos os preços por `fator`, em O(1)."""
+        if fator <= 0:
+            raise ValueError("O fator de reajuste deve ser positivo.")
+        self._fator *= fator
+        self.versao += 1
+        self._versao_fator = self.versao
+
+    def item(self, indice: int) -> Dict:
+        """O produto no formato de item dos pedidos: nome, valor e sku."""
+        return {"sku": self.skus[indice], "nome": self.nomes[indice],
+                "valor": self._centavos(indice) / 100}
+
+    def precificar(self, indices: Sequence[int], quantidades: Sequence[int]) -> float:
+        """Soma preço x quantidade dos itens dados por índice."""
+        centavos = self._centavos
+        return sum(centavos(indice) * quantidade for indice, quantidade in zip(indices, quantidades)) / 100
+
+    def precificar_lote(self, pedidos: Sequence["PedidoCompacto"]) -> List[float]:
+        """Valor base de cada pedido, calculado para o lote inteiro de uma vez.
+
+        Com numpy, os itens de todos os pedidos são concatenados e somados
+        por pedido com `np.add.reduceat`; sem numpy, pedido a pedido.
+        """
+        if np is None or not pedidos:
+            return [self.precificar(pedido.indices, pedido.quantidades) for pedido in pedidos]
+        tamanhos = np.fromiter((len(pedido.indices) for pedido in pedidos), dtype=np.int64,
+                               count=len(pedidos))
+        indices, quantidades = array("I"), array("I")
+        for pedido in pedidos:
+            indices.extend(pedido.indices)
+            quantidades.extend(pedido.quantidades)
+        indices = np.frombuffer(indices, dtype=np.uintc)
+        quantidades = np.frombuffer(quantidades, dtype=np.uintc)
+        # Mesmas operações de _centavos (rint também arredonda o meio para o par).
+        centavos = np.rint(np.frombuffer(self._precos, dtype=float) * self._fator * 100).astype(np.int64)
+        valores = centavos[indices] * quantidades
+        # reduceat exige inícios válidos: pedidos vazios somam zero à parte.
+        inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+        totais = np.zeros(len(pedidos), dtype=np.int64)
+        cheios = tamanhos > 0
+        if valores.size:
+            totais[cheios] = np.add.reduceat(valores, inicios[cheios])
+        return [total / 100 for total in totais.tolist()]
+
+    def pedido(self, itens: Iterable[Tuple[str, int]]) -> "PedidoCompacto":
+        """Monta um pedido compacto a partir de pares (sku, quantidade)."""
+        return PedidoCompacto(self, ((self.indice(sku), quantidade) for sku, quantidade in itens))
+
+
+class PedidoCompacto:
+    """Pedido que guarda só índices de SKU e quantidades, precificado pelo catálogo.
+
+    O valor base fica em cache até a versão do catálogo mudar.
+    """
+    __slots__ = ("catalogo", "indices", "quantidades", "_valor", "_versao")
+
+    def __init__(self, catalogo: CatalogoProdutos, itens: Iterable[Tuple[int, int]] = ()):
+        self.catalogo = catalogo
+        self.indices = array("I")
+        self.quantidades = array("I")
+        for indice, quantidade in itens:
+            self.indices.append(indice)
+            self.quantidades.append(quantidade)
+        self._valor = 0.0
+        self._versao = -1
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @property
+    def valor_base(self) -> float:
+        if self._versao != self.catalogo.versao:
+            self._valor = self.catalogo.precificar(self.indices, self.quantidades)
+            self._versao = self.catalogo.versao
+        return self._valor
+
+    def itens(self) -> List[Dict]:
+        """Os itens por extenso (sku, nome, valor e quantidade), para o checkout."""
+        return [dict(self.catalogo.item(indice), quantidade=quantidade)
+                for indice, quantidade in zip(self.indices, self.quantidades)]
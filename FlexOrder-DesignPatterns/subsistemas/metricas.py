@@ -0,0 +1,470 @@
+"""
+Registro de métricas leve: contadores, medidores e histogramas.
+
+Contadores e histogramas são fragmentados por thread: cada thread escreve
+apenas no seu próprio fragmento, sem trava, e a leitura soma os fragmentos.
+Quando uma thread termina, o seu fragmento é somado a um fragmento base e
+descartado, então threads de vida curta não fazem a lista crescer.
+Registrar um evento custa algumas centenas de nanossegundos.
+
+Os histogramas usam baldes log-lineares, no estilo HDR: cada potência de 2
+é dividida em SUBBALDES baldes iguais, o que garante erro relativo de no
+máximo 1/SUBBALDES em qualquer escala (de nanossegundos a milhões de reais)
+sem configurar limites. Na exportação, os baldes internos são agrupados nos
+limites `le` configurados para a família (LIMITES_PADRAO, se nenhum for
+dado), para que cada série tenha poucas linhas.
+
+O conteúdo do registro pode ser exportado no formato texto do Prometheus e
+servido por HTTP em /metrics:
+
+    from subsistemas.metricas import REGISTRO
+    servidor = REGISTRO.servir(porta=9100)
+"""
+import bisect
+import math
+import threading
+import time
+import weakref
+from functools import wraps
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Resolução dos histogramas: baldes por potência de 2 (erro relativo <= 1/16).
+SUBBALDES = 16
+# Expoentes (de math.frexp) cobertos: de ~1e-9 a ~1e12; fora disso, satura.
+EXPOENTE_MINIMO = -30
+EXPOENTE_MAXIMO = 40
+_TOTAL_BALDES = (EXPOENTE_MAXIMO - EXPOENTE_MINIMO + 1) * SUBBALDES
+# (expoente - MIN) * SUB + int((mantissa - 0.5) * 2 * SUB), com as constantes
+# agrupadas: 2 (cabeçalho do fragmento) - MIN * SUB - SUB + int(mantissa * 2 * SUB).
+_ESCALA_MANTISSA = 2 * SUBBALDES
+_DESLOCAMENTO_BALDE = 2 - EXPOENTE_MINIMO * SUBBALDES - SUBBALDES
+
+# Limites `le` exportados. Os internos continuam finos; só a exportação agrupa.
+LIMITES_SEGUNDOS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIMITES_REAIS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0,
+                 5000.0, 10000.0)
+LIMITES_PADRAO = tuple(base * 10.0 ** expoente for expoente in range(-3, 5)
+                       for base in (1.0, 2.5, 5.0))
+
+
+class _Dono:
+    """Objeto guardado no thread-local; é coletado quando a thread termina."""
+    __slots__ = ("__weakref__",)
+
+
+class _Fragmentado:
+    """Base das métricas com um fragmento de estado por thread.
+
+    O primeiro fragmento é a base, que acumula os fragmentos das threads que
+    já terminaram.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._base = self._novo_fragmento()
+        self._fragmentos: List[list] = [self._base]
+        self._trava = threading.Lock()
+
+    def _novo_fragmento(self) -> list:
+        raise NotImplementedError
+
+    def _fragmento(self) -> list:
+        try:
+            return self._local.fragmento
+        except AttributeError:
+            fragmento = self._novo_fragmento()
+            with self._trava:
+                self._fragmentos.append(fragmento)
+            dono = _Dono()
+            weakref.finalize(dono, self._recolher, fragmento)
+            self._local.dono = dono
+            self._local.fragmento = fragmento
+            return fragmento
+
+    def _recolher(self, fragmento: list) -> None:
+        """Soma o fragmento de uma thread encerrada na base e o descarta."""
+        with self._trava:
+            base = self._base
+            for indice, valor in enumerate(fragmento):
+                if valor:
+                    base[indice] += valor
+            # Por identidade: fragmentos diferentes podem ter o mesmo conteúdo.
+            self._fragmentos = [f for f in self._fragmentos if f is not fragmento]
+
+
+class Contador(_Fragmentado):
+    """Valor que só cresce (ex.: pagamentos aprovados)."""
+
+    def _novo_fragmento(self) -> list:
+        return [0]
+
+    def inc(self, quantidade: float = 1) -> None:
+        """Soma `quantidade` ao contador."""
+        try:
+            self._local.fragmento[0] += quantidade
+        except AttributeError:
+            self._fragmento()[0] += quantidade
+
+    @property
+    def valor(self) -> float:
+        return sum(fragmento[0] for fragmento in self._fragmentos)
+
+
+class Medidor:
+    """Valor que sobe e desce (ex.: pedidos em andamento)."""
+
+    def __init__(self):
+        self._valor = 0.0
+        self._trava = threading.Lock()
+
+    def definir(self, valor: float) -> None:
+        self._valor = valor
+
+    def inc(self, quantidade: float = 1) -> None:
+        with self._trava:
+            self._valor += quantidade
+
+    def dec(self, quantidade: float = 1) -> None:
+        with self._trava:
+            self._valor -= quantidade
+
+    @property
+    def valor(self) -> float:
+        return self._valor
+
+
+def _indice_balde(valor: float) -> int:
+    """Balde log-linear de um valor positivo."""
+    mantissa, expoente = math.frexp(valor)  # valor = mantissa * 2**expoente, 0.5 <= mantissa < 1
+    if expoente < EXPOENTE_MINIMO:
+        return 0
+    if expoente > EXPOENTE_MAXIMO:
+        return _TOTAL_BALDES - 1
+    return (expoente - EXPOENTE_MINIMO) * SUBBALDES + int((mantissa - 0.5) * 2 * SUBBALDES)
+
+
+def limite_superior(indice: int) -> float:
+    """Maior valor que cai no balde `indice`."""
+    expoente, sub = divmod(indice, SUBBALDES)
+    return math.ldexp(0.5 + (sub + 1) / (2 * SUBBALDES), expoente + EXPOENTE_MINIMO)
+
+
+# Limite superior de cada balde interno, em ordem crescente.
+_SUPERIORES = [limite_superior(indice) for indice in range(_TOTAL_BALDES)]
+
+
+class Histograma(_Fragmentado):
+    """Distribuição de valores (ex.: latência, custo de frete) em baldes log-lineares.
+
+    Cada fragmento é [soma, zeros_ou_negativos, baldes...]; a contagem é
+    derivada dos baldes na leitura, para não custar nada no registro.
+    """
+
+    def _novo_fragmento(self) -> list:
+        return [0.0, 0] + [0] * _TOTAL_BALDES
+
+    def observar(self, valor: float, _frexp=math.frexp) -> None:
+        """Registra um valor. Valores <= 0 vão para um balde próprio."""
+        try:
+            fragmento = self._local.fragmento
+        except AttributeError:
+            fragmento = self._fragmento()
+        fragmento[0] += valor
+        if valor > 0:
+            # Mesmo cálculo de _indice_balde, em linha para poupar uma chamada.
+            mantissa, expoente = _frexp(valor)
+            if EXPOENTE_MINIMO <= expoente <= EXPOENTE_MAXIMO:
+                fragmento[_DESLOCAMENTO_BALDE + expoente * SUBBALDES
+                          + int(mantissa * _ESCALA_MANTISSA)] += 1
+            else:
+                fragmento[2 + _indice_balde(valor)] += 1
+        else:
+            fragmento[1] += 1
+
+    def resumo(self) -> Tuple[int, float, int, List[int]]:
+        """Soma os fragmentos: (contagem, soma, zeros_ou_negativos, baldes)."""
+        contagem, soma, zeros = 0, 0.0, 0
+        baldes = [0] * _TOTAL_BALDES
+        for fragmento in list(self._fragmentos):
+            soma += fragmento[0]
+            zeros += fragmento[1]
+            for indice, quantidade in enumerate(fragmento[2:]):
+                if quantidade:
+                    baldes[indice] += quantidade
+        contagem = zeros + sum(baldes)
+        return contagem, soma, zeros, baldes
+
+    @property
+    def contagem(self) -> int:
+        return sum(sum(fragmento[1:]) for fragmento in self._fragmentos)
+
+    def quantil(self, q: float) -> Optional[float]:
+        """Estimativa do quantil `q` (0 a 1) pelo limite superior do balde."""
+        contagem, _, zeros, baldes = self.resumo()
+        if contagem == 0:
+            return None
+        alvo = q * contagem
+        acumulado = zeros
+        if acumulado >= alvo:
+            return 0.0
+        for indice, quantidade in enumerate(baldes):
+            acumulado += quantidade
+            if quantidade and acumulado >= alvo:
+                return limite_superior(indice)
+        return limite_superior(_TOTAL_BALDES - 1)
+
+
+class Familia:
+    """Uma métrica com nome, ajuda e rótulos; cada combinação de valores dos
+    rótulos é uma série própria. Guarde a série retornada por `com` para
+    evitar a busca no dicionário a cada evento."""
+
+    _TIPOS = {"counter": Contador, "gauge": Medidor, "histogram": Histograma}
+
+    def __init__(self, nome: str, ajuda: str, tipo: str, rotulos: Iterable[str] = (),
+                 limites: Iterable[float] = ()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.tipo = tipo
+        self.rotulos = tuple(rotulos)
+        # Para histogramas: limites `le` exportados e, para cada um, quantos
+        # baldes internos cabem inteiros abaixo dele.
+        self.limites = tuple(sorted(float(limite) for limite in limites))
+        self._cortes = [bisect.bisect_right(_SUPERIORES, limite) for limite in self.limites]
+        self._series: Dict[tuple, object] = {}
+        self._trava = threading.Lock()
+
+    def com(self, **valores):
+        """Retorna a série para os valores de rótulos dados.
+
+        Raises:
+            ValueError: Se os rótulos não forem exatamente os da família.
+        """
+        chave = tuple(str(valores[rotulo]) for rotulo in self.rotulos) \
+            if set(valores) == set(self.rotulos) else None
+        if chave is None:
+            raise ValueError(f"A métrica '{self.nome}' espera os rótulos {self.rotulos}.")
+        serie = self._series.get(chave)
+        if serie is None:
+            with self._trava:
+                serie = self._series.setdefault(chave, self._TIPOS[self.tipo]())
+        return serie
+
+    def series(self) -> List[Tuple[tuple, object]]:
+        return list(self._series.items())
+
+
+def _formatar_rotulos(nomes: Tuple[str, ...], valores: tuple, extra: str = "") -> str:
+    partes = [f'{nome}="{_escapar(valor)}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        partes.append(extra)
+    return "{" + ",".join(partes) + "}" if partes else ""
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _numero(valor: float) -> str:
+    if valor == math.inf:
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+
+
+class RegistroMetricas:
+    """Conjunto de métricas de um processo, exportável para o Prometheus."""
+
+    def __init__(self):
+        self._familias: Dict[str, Familia] = {}
+        self._trava = threading.Lock()
+
+    def _obter(self, nome: str, ajuda: str, tipo: str, rotulos: Iterable[str],
+               limites: Iterable[float] = ()) -> Familia:
+        familia = self._familias.get(nome)
+        if familia is None:
+            with self._trava:
+                familia = self._familias.setdefault(nome, Familia(nome, ajuda, tipo, rotulos, limites))
+        if (familia.tipo != tipo or familia.rotulos != tuple(rotulos)
+                or familia.limites != tuple(sorted(float(limite) for limite in limites))):
+            raise ValueError(f"A métrica '{nome}' já existe com outro tipo, rótulos ou limites.")
+        return familia
+
+    def contador(self, nome: str, ajuda: str = "", rotulos: Iterable[str] = ()) -> Familia:
+        """Obtém (ou cria) uma família de contadores."""
+        return self._obter(nome, ajuda, "counter", rotulos)
+
+    def medidor(self, nome: str, ajuda: str = "", rotulos: Iterable[str] = ()) -> Familia:
+        """Obtém (ou cria) uma família de medidores."""
+        return self._obter(nome, ajuda, "gauge", rotulos)
+
+    def histograma(self, nome: str, ajuda: str = "", rotulos: Iterable[str] = (),
+                   limites: Iterable[float] = LIMITES_PADRAO) -> Familia:
+        """Obtém (ou cria) uma família de histogramas, exportada com os `limites` dados."""
+        return self._obter(nome, ajuda, "histogram", rotulos, limites)
+
+    def exportar_prometheus(self) -> str:
+        """Retrato de todas as métricas no formato texto do Prometheus (0.0.4).
+
+        Nos histogramas, os baldes internos são somados nos limites `le` da
+        família (cumulativos): um balde interno conta para o primeiro limite
+        que não seja menor que o seu limite superior, o que desloca no máximo
+        1/SUBBALDES do valor. As linhas são as mesmas em todo retrato, para que
+        `histogram_quantile` possa interpolar.
+        """
+        linhas = []
+        for nome, familia in sorted(self._familias.items()):
+            linhas.append(f"# HELP {nome} {familia.ajuda}")
+            linhas.append(f"# TYPE {nome} {familia.tipo}")
+            for valores, serie in sorted(familia.series()):
+                if familia.tipo != "histogram":
+                    linhas.append(f"{nome}{_formatar_rotulos(familia.rotulos, valores)} "
+                                  f"{_numero(serie.valor)}")
+                    continue
+                contagem, soma, zeros, baldes = serie.resumo()
+                acumulado, inicio = zeros, 0
+                rotulos = _formatar_rotulos(familia.rotulos, valores, 'le="0.0"')
+                linhas.append(f"{nome}_bucket{rotulos} {acumulado}")
+                for limite, corte in zip(familia.limites, familia._cortes):
+                    acumulado += sum(baldes[inicio:corte])
+                    inicio = corte
+                    rotulos = _formatar_rotulos(familia.rotulos, valores, f'le="{_numero(limite)}"')
+                    linhas.append(f"{nome}_bucket{rotulos} {acumulado}")
+                rotulos = _formatar_rotulos(familia.rotulos, valores, 'le="+Inf"')
+                linhas.append(f"{nome}_bucket{rotulos} {contagem}")
+                linhas.append(f"{nome}_sum{_formatar_rotulos(familia.rotulos, valores)} {_numero(soma)}")
+                linhas.append(f"{nome}_count{_formatar_rotulos(familia.rotulos, valores)} {contagem}")
+        return "\n".join(linhas) + "\n"
+
+    def servir(self, porta: int = 0, endereco: str = "127.0.0.1"):
+        """Serve `exportar_prometheus()` em http://endereco:porta/metrics numa thread.
+
+        Args:
+            porta: Porta TCP; 0 escolhe uma livre (veja `servidor.server_address`).
+            endereco: Interface de escuta. Por padrão, apenas local.
+
+        Returns:
+            O ThreadingHTTPServer em execução; chame `shutdown()` para parar.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registro = self
+
+        class _Manipulador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corpo = registro.exportar_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, formato, *args):
+                pass
+
+        servidor = ThreadingHTTPServer((endereco, porta), _Manipulador)
+        servidor.daemon_threads = True
+        threading.Thread(target=servidor.serve_forever, name="metricas-http", daemon=True).start()
+        return servidor
+
+
+REGISTRO = RegistroMetricas()
+
+
+def _nome_qualificado(classe) -> str:
+    return f"{classe.__module__}.{classe.__qualname__}"
+
+
+def instrumentar_pagamento(classe, registro: RegistroMetricas = REGISTRO) -> None:
+    """Envolve `classe.processar` para contar aprovações/rejeições e medir a latência.
+
+    Chamado pelo __init_subclass__ das interfaces de pagamento; só age se a
+    própria classe define `processar`. O rótulo `metodo` é o nome qualificado
+    (módulo.classe), para que classes homônimas não dividam a mesma série.
+    """
+    original = classe.__dict__.get("processar")
+    if original is None or getattr(original, "_instrumentado", False):
+        return
+    nome = _nome_qualificado(classe)
+    resultados = registro.contador("pagamentos_total", "Pagamentos processados por método e resultado",
+                                   ("metodo", "resultado"))
+    aprovados = resultados.com(metodo=nome, resultado="aprovado")
+    rejeitados = resultados.com(metodo=nome, resultado="rejeitado")
+    duracao = registro.histograma("pagamento_duracao_segundos", "Tempo de processamento do pagamento",
+                                  ("metodo",), LIMITES_SEGUNDOS).com(metodo=nome)
+    valores = registro.histograma("pagamento_valor_reais", "Valor cobrado por método de pagamento",
+                                  ("metodo",), LIMITES_REAIS).com(metodo=nome)
+
+    @wraps(original)
+    def processar(self, valor):
+        inicio = time.perf_counter()
+        aprovado = original(self, valor)
+        duracao.observar(time.perf_counter() - inicio)
+        valores.observar(valor)
+        (aprovados if aprovado else rejeitados).inc()
+        return aprovado
+
+    processar._instrumentado = True
+    classe.processar = processar
+
+
+def instrumentar_frete(classe, registro: RegistroMetricas = REGISTRO) -> None:
+    """Envolve `classe.calcular` para registrar a distribuição do custo de frete."""
+    original = classe.__dict__.get("calcular")
+    if original is None or getattr(original, "_instrumentado", False):
+        return
+    nome = _nome_qualificado(classe)
+    custos = registro.histograma("frete_custo_reais", "Custo de frete calculado por estratégia",
+                                 ("estrategia",), LIMITES_REAIS).com(estrategia=nome)
+
+    @wraps(original)
+    def calcular(self, valor):
+        custo = original(self, valor)
+        custos.observar(custo)
+        return custo
+
+    calcular._instrumentado = True
+    classe.calcular = calcular
+
+
+class MedidorFluxo:
+    """Mede uma operação de ponta a ponta (ex.: um checkout): quantas estão em
+    andamento, quanto duram e como terminaram."""
+
+    def __init__(self, prefixo: str, descricao: str, registro: RegistroMetricas = REGISTRO):
+        resultados = registro.contador(f"{prefixo}_total", f"{descricao} por resultado", ("resultado",))
+        self._sucesso = resultados.com(resultado="sucesso")
+        self._falha = resultados.com(resultado="falha")
+        self._erro = resultados.com(resultado="erro")
+        self._em_andamento = registro.medidor(f"{prefixo}_em_andamento", f"{descricao} em andamento").com()
+        self._duracao = registro.histograma(f"{prefixo}_duracao_segundos", f"Duração: {descricao}",
+                                            limites=LIMITES_SEGUNDOS).com()
+        self._valor = registro.histograma(f"{prefixo}_valor_reais", f"Valor final: {descricao}",
+                                          limites=LIMITES_REAIS).com()
+
+    def medir(self, funcao):
+        """Decorador para um método que retorna True/False (sucesso/falha)."""
+        @wraps(funcao)
+        def medido(*args, **kwargs):
+            self._em_andamento.inc()
+            inicio = time.perf_counter()
+            try:
+                sucesso = funcao(*args, **kwargs)
+            except Exception:
+                self._erro.inc()
+                raise
+            finally:
+                self._em_andamento.dec()
+                self._duracao.observar(time.perf_counter() - inicio)
+            (self._sucesso if sucesso else self._falha).inc()
+            return sucesso
+        return medido
+
+    def valor(self, valor: float) -> None:
+        """Registra o valor final da operação."""
+        self._valor.observar(valor)
@@ -0,0 +1,8 @@
+class ServicoEmail:
+    """Subsistema responsável pelo envio de e-mails ao cliente (simulado)."""
+
+    def enviar_confirmacao(self, email: str, numero_pedido: str) -> bool:
+        # Integração com um serviço de e-mail seria feita aqui.
+        print(f"Enviando e-mail de confirmação para {email}...")
+        print(f"Pedido #{numero_pedido} confirmado!")
+        return True
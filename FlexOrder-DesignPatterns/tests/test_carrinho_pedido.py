@@ -0,0 +1,97 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from checkout_refatorado import (
+    CheckoutFacade, DescontoPedidoGrande, FreteNormal, PagamentoPix, Pedido, ValorCacheado
+)
+
+
+def _pedido(itens=None):
+    return Pedido(itens or [], PagamentoPix(), FreteNormal())
+
+
+def test_totais_acompanham_o_carrinho():
+    pedido = _pedido([{'nome': 'Varinha', 'valor': 100.0}, {'nome': 'Varinha', 'valor': 100.0}])
+    assert pedido.itens == [{'nome': 'Varinha', 'valor': 100.0, 'quantidade': 2}]
+
+    pedido.adicionar_item('Grimório', 45.5, quantidade=3)
+    pedido.alterar_quantidade('Varinha', 1)
+    assert pedido.valor_base == pytest.approx(100.0 + 3 * 45.5)
+    assert pedido.quantidade_total == 4
+
+    assert pedido.remover_item('Grimório')['quantidade'] == 3
+    pedido.alterar_quantidade('Varinha', 0)
+    assert (pedido.itens, pedido.valor_base, pedido.quantidade_total) == ([], 0.0, 0)
+
+
+def test_erros_de_edicao():
+    pedido = _pedido([{'nome': 'Varinha', 'valor': 100.0}])
+    with pytest.raises(KeyError):
+        pedido.remover_item('Capa')
+    with pytest.raises(ValueError):
+        pedido.alterar_quantidade('Varinha', -1)
+    with pytest.raises(ValueError):
+        pedido.adicionar_item('Capa', 10.0, quantidade=0)
+
+
+def test_cache_invalidado_ao_editar_o_carrinho():
+    base = _pedido([{'nome': 'Cristal', 'valor': 400.0}])
+    pedido = ValorCacheado(DescontoPedidoGrande(base))
+    assert pedido.calcular_valor() == pytest.approx(400.0)
+
+    pedido.adicionar_item('Cristal', 400.0)
+    assert pedido.calcular_valor() == pytest.approx(720.0)
+    base.valor_base = 100.0
+    assert pedido.calcular_valor() == pytest.approx(100.0)
+    assert CheckoutFacade().concluir_transacao(pedido) is True
+
+
+def test_mesmo_nome_com_precos_diferentes_fica_em_linhas_separadas():
+    pedido = _pedido([{'nome': 'X', 'valor': 10.0}, {'nome': 'X', 'valor': 20.0}, {'nome': 'X', 'valor': 10.0}])
+    assert pedido.itens == [{'nome': 'X', 'valor': 10.0, 'quantidade': 2},
+                            {'nome': 'X', 'valor': 20.0, 'quantidade': 1}]
+    assert pedido.valor_base == 40.0
+
+    with pytest.raises(ValueError):
+        pedido.remover_item('X')
+    pedido.alterar_quantidade('X', 1, valor=10.0)
+    pedido.adicionar_item('Y', 5.0)
+    assert pedido.remover_item('X', 20.0)['quantidade'] == 1
+    assert pedido.valor_base == sum(linha['valor'] * linha['quantidade'] for linha in pedido.itens) == 15.0
+
+
+def test_itens_retorna_copias():
+    pedido = _pedido([{'nome': 'X', 'valor': 10.0}])
+    pedido.itens[0]['quantidade'] = 99
+    assert pedido.itens[0]['quantidade'] == 1
+    assert pedido.valor_base == 10.0
+
+
+def test_total_em_centavos_nao_acumula_erro():
+    pedido = _pedido()
+    for _ in range(1000):
+        pedido.adicionar_item('Bala', 0.1)
+    assert pedido.valor_base == 100.0
+    for _ in range(999):
+        pedido.alterar_quantidade('Bala', pedido.quantidade_total - 1)
+    assert pedido.valor_base == 0.1
+
+
+def test_cache_desanexado_ou_descartado_sai_dos_observadores():
+    import gc
+
+    base = _pedido([{'nome': 'Cristal', 'valor': 400.0}])
+    cache = ValorCacheado(base)
+    cache.desanexar()
+    base.adicionar_item('Cristal', 400.0)
+    assert cache.calcular_valor() == pytest.approx(800.0)
+
+    ValorCacheado(base)
+    gc.collect()
+    assert len(base._observadores) == 0
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from checkout_refatorado import CheckoutFacade, FreteNormal, PagamentoPix, Pedido
+from gerador_pedidos import GeradorPedidos, PerfilCarga
+from subsistemas.catalogo import CatalogoProdutos, PedidoCompacto
+
+
+def _catalogo():
+    catalogo = CatalogoProdutos()
+    catalogo.cadastrar("VAR-01", "Varinha", 100.0, material="azevinho")
+    catalogo.cadastrar("POC-02", "Poção de Voo", 80.0)
+    return catalogo
+
+
+def test_precos_versionados_e_reajuste_geral():
+    catalogo = _catalogo()
+    pedido = catalogo.pedido([("VAR-01", 2), ("POC-02", 1)])
+    assert pedido.valor_base == 280.0
+
+    catalogo.alterar_preco("POC-02", 90.0)
+    assert catalogo.versao_preco("POC-02") > catalogo.versao_preco("VAR-01")
+    assert pedido.valor_base == 290.0
+
+    catalogo.reajustar(1.10)
+    assert catalogo.preco("VAR-01") == 110.0
+    assert catalogo.versao_preco("VAR-01") == catalogo.versao
+    assert pedido.valor_base == 319.0
+
+    with pytest.raises(ValueError):
+        catalogo.cadastrar("VAR-01", "Outra varinha", 1.0)
+    with pytest.raises(KeyError):
+        catalogo.preco("XYZ")
+
+
+def test_precificacao_em_lote_igual_a_individual():
+    gerador = GeradorPedidos(11, PerfilCarga(skus=300))
+    catalogo = gerador.catalogo()
+    pedidos = [PedidoCompacto(catalogo, ((item["sku"], 1) for item in dados["itens"]))
+               for dados in gerador.gerar(200)]
+    pedidos.append(PedidoCompacto(catalogo))
+    catalogo.reajustar(0.9)
+
+    lote = catalogo.precificar_lote(pedidos)
+    assert lote == pytest.approx([pedido.valor_base for pedido in pedidos])
+    assert lote[-1] == 0.0
+
+
+def test_pedido_compacto_no_checkout():
+    compacto = _catalogo().pedido([("VAR-01", 1), ("POC-02", 2)])
+    pedido = Pedido(compacto.itens(), PagamentoPix(), FreteNormal())
+    assert pedido.valor_base == compacto.valor_base == 260.0
+    assert CheckoutFacade().concluir_transacao(pedido) is True
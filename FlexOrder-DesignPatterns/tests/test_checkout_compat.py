@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from checkout_compat import SistemaPedidoCompat
+from checkout_monolitico import SistemaPedidoAntigo
+
+ITENS = [{"nome": "Notebook", "quantidade": 1, "preco": 2500.00}]
+
+
+@pytest.mark.parametrize("valor_base", [80.0, 350.0, 2600.0])
+@pytest.mark.parametrize("metodo", ["pix", "credito", "boleto", "debito", "paypal"])
+@pytest.mark.parametrize("frete", ["normal", "expresso", "retirada", "sedex"])
+def test_mesmo_resultado_do_legado(metodo, frete, valor_base):
+    antigo = SistemaPedidoAntigo(ITENS, valor_base)
+    compat = SistemaPedidoCompat(ITENS, valor_base)
+
+    resultado = compat.finalizar_compra(metodo, frete, "cliente@email.com")
+
+    assert resultado == antigo.finalizar_compra(metodo, frete, "cliente@email.com")
+    assert compat.valor_total == pytest.approx(antigo.valor_total)
+    assert (compat.metodo_pagamento, compat.tipo_frete) == (antigo.metodo_pagamento, antigo.tipo_frete)
+
+
+def test_descontos_e_embalagem_avulsos():
+    antigo = SistemaPedidoAntigo(ITENS, 300.0)
+    compat = SistemaPedidoCompat(ITENS, 300.0)
+    for sistema in (antigo, compat):
+        sistema.calcular_frete("expresso")
+        sistema.aplicar_desconto("cupom_verao")
+        sistema.aplicar_desconto("primeira_compra")
+        sistema.adicionar_embalagem_presente()
+
+    assert compat.valor_total == pytest.approx(antigo.valor_total)
+    assert compat.processar_pagamento("boleto") is True
+    assert compat.processar_pagamento("cheque") is False
+
+
+def test_pagamento_estoque_e_nota_ficam_com_a_fachada(monkeypatch):
+    compat = SistemaPedidoCompat(ITENS, 300.0)
+    pedidos = []
+    original = compat.facade.concluir_transacao
+
+    def concluir(pedido):
+        pedidos.append(pedido)
+        return original(pedido)
+
+    monkeypatch.setattr(compat.facade, "concluir_transacao", concluir)
+    assert compat.finalizar_compra("pix", "expresso", "cliente@email.com") is True
+
+    [pedido] = pedidos
+    assert pedido.calcular_valor() == pytest.approx((300.0 + 35.0) * 0.95)
+    assert pedido.estrategia_frete.calcular(pedido.calcular_valor()) == 0.0
+    assert compat.facade.estoque is compat.estoque
+    assert compat.facade.gerador_nf is compat.gerador_nf
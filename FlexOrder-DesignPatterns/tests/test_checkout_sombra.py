@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from checkout_sombra import RelatorioSombra, classificar, executar_legado, executar_refatorado, verificar
+
+
+def test_divergencias_classificadas_por_categoria(capsys):
+    dados = {"id": 1, "itens": [{"nome": "Item", "valor": 100.0}],
+             "pagamento": "pix", "frete": "normal", "embalagem_presente": True}
+    legado, refatorado = executar_legado(dados), executar_refatorado(dados)
+
+    # Legado: (100 + 10 + 15) * 0.95; refatorado: (100 * 0.95 + 5) * 1.05.
+    assert legado["total"] == pytest.approx(118.75)
+    assert refatorado["total"] == pytest.approx(105.0)
+    assert classificar(legado, refatorado) == ["frete", "desconto_pix", "embalagem", "total"]
+
+
+def test_fundir_relatorios_soma_contagens_e_limita_amostras():
+    dados = {"id": 0, "itens": [{"nome": "Item", "valor": 2000.0}],
+             "pagamento": "credito", "frete": "expresso", "embalagem_presente": False}
+    partes = [RelatorioSombra(amostras=3, semente=parte) for parte in range(2)]
+    for parte, relatorio in enumerate(partes):
+        for indice in range(10):
+            dados["id"] = parte * 10 + indice
+            relatorio.registrar(dict(dados), {"aprovado": True, "frete": 20.0, "desconto_pix": 0.0,
+                                              "embalagem": 0.0, "total": 2020.0},
+                                {"aprovado": False, "frete": 215.0, "desconto_pix": 0.0,
+                                 "embalagem": 0.0, "total": 2215.0})
+    partes[0].fundir(partes[1])
+    resultado = partes[0].para_dict()
+
+    assert resultado["pedidos"] == resultado["divergentes"] == 20
+    assert resultado["por_categoria"]["aprovacao"] == 20
+    assert len(resultado["amostras"]["aprovacao"]) == 3
+
+
+def test_pool_de_processos_igual_a_execucao_serial():
+    serial = verificar(600, semente=7, trabalhadores=1, lote=256)
+    paralelo = verificar(600, semente=7, trabalhadores=2, lote=256)
+    for chave in ("pedidos", "divergentes", "por_categoria", "por_combinacao"):
+        assert serial[chave] == paralelo[chave]
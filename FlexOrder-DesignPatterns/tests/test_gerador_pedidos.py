@@ -0,0 +1,33 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from gerador_pedidos import GeradorPedidos, PerfilCarga, TAMANHO_BLOCO, ler_colunas, para_pedido
+
+
+def test_mesma_semente_gera_mesmos_pedidos():
+    assert list(GeradorPedidos(42).gerar(500)) == list(GeradorPedidos(42).gerar(500))
+    assert list(GeradorPedidos(42).gerar(50)) != list(GeradorPedidos(43).gerar(50))
+
+
+def test_trecho_igual_ao_da_sequencia_completa():
+    gerador = GeradorPedidos(1, PerfilCarga(skus=500))
+    completo = list(gerador.gerar(3 * TAMANHO_BLOCO))
+    inicio = TAMANHO_BLOCO - 10
+    assert list(gerador.gerar(100, inicio)) == completo[inicio:inicio + 100]
+
+
+def test_formato_colunar_ida_e_volta(tmp_path):
+    gerador = GeradorPedidos(3, PerfilCarga(skus=200))
+    assert gerador.escrever_colunas(str(tmp_path), 300) == 300
+    assert list(ler_colunas(str(tmp_path))) == list(gerador.gerar(300))
+
+
+def test_pedido_gerado_vira_pedido_do_sistema():
+    dados = next(GeradorPedidos(5).gerar(1))
+    pedido = para_pedido(dados)
+    assert pedido.valor_base == sum(item['valor'] for item in dados['itens'])
+    assert pedido.tem_embalagem_presente == dados['embalagem_presente']
@@ -0,0 +1,116 @@
+import gc
+import os
+import sys
+import threading
+import urllib.request
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from subsistemas.metricas import LIMITES_PADRAO, REGISTRO, SUBBALDES, RegistroMetricas
+
+
+def test_contador_soma_fragmentos_de_varias_threads():
+    contador = RegistroMetricas().contador("eventos_total").com()
+
+    def trabalhar():
+        for _ in range(10_000):
+            contador.inc()
+
+    threads = [threading.Thread(target=trabalhar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert contador.valor == 80_000
+
+
+def test_fragmentos_de_threads_encerradas_sao_recolhidos():
+    histograma = RegistroMetricas().histograma("latencia_segundos").com()
+    for _ in range(20):
+        thread = threading.Thread(target=histograma.observar, args=(0.5,))
+        thread.start()
+        thread.join()
+    gc.collect()
+    assert len(histograma._fragmentos) == 1
+    assert histograma.contagem == 20
+    assert histograma.resumo()[1] == 10.0
+
+
+def test_histograma_quantil_com_erro_relativo_limitado():
+    histograma = RegistroMetricas().histograma("latencia_segundos").com()
+    for i in range(1, 1001):
+        histograma.observar(i / 1000)
+    assert histograma.contagem == 1000
+    assert histograma.quantil(0.5) == pytest.approx(0.5, rel=1 / SUBBALDES)
+    assert histograma.quantil(0.99) == pytest.approx(0.99, rel=1 / SUBBALDES)
+
+
+def test_exportacao_prometheus_e_rotulos():
+    registro = RegistroMetricas()
+    registro.contador("pagamentos_total", "Pagamentos", ("metodo",)).com(metodo="pix").inc(3)
+    registro.histograma("frete_custo_reais", "Frete").com().observar(12.5)
+    texto = registro.exportar_prometheus()
+    assert '# TYPE pagamentos_total counter' in texto
+    assert 'pagamentos_total{metodo="pix"} 3' in texto
+    assert 'frete_custo_reais_bucket{le="+Inf"} 1' in texto
+    assert 'frete_custo_reais_bucket{le="0.0"} 0' in texto
+    assert texto.count("frete_custo_reais_bucket") == len(LIMITES_PADRAO) + 2
+    assert 'frete_custo_reais_sum 12.5' in texto
+    with pytest.raises(ValueError):
+        registro.medidor("pagamentos_total")
+
+
+def test_estrategias_do_sistema_sao_instrumentadas():
+    from sistema_pedidos.pagamentos import PagamentoCredito
+
+    serie = REGISTRO.contador("pagamentos_total", rotulos=("metodo", "resultado"))
+    rejeitados = serie.com(metodo="sistema_pedidos.pagamentos.PagamentoCredito", resultado="rejeitado")
+    antes = rejeitados.valor
+    assert PagamentoCredito().processar(5000.0) is False
+    assert rejeitados.valor == antes + 1
+
+
+
+def test_exportacao_agrupa_baldes_nos_limites_configurados():
+    registro = RegistroMetricas()
+    histograma = registro.histograma("espera_segundos", limites=(1, 0.1, 10)).com()
+    for valor in (0, 0.05, 0.5, 0.6, 3, 50):
+        histograma.observar(valor)
+    linhas = [linha for linha in registro.exportar_prometheus().splitlines()
+              if linha.startswith("espera_segundos_bucket")]
+    assert linhas == ['espera_segundos_bucket{le="0.0"} 1',
+                      'espera_segundos_bucket{le="0.1"} 2',
+                      'espera_segundos_bucket{le="1.0"} 4',
+                      'espera_segundos_bucket{le="10.0"} 5',
+                      'espera_segundos_bucket{le="+Inf"} 6']
+    with pytest.raises(ValueError):
+        registro.histograma("espera_segundos", limites=(1, 2))
+
+
+def test_endpoint_http_serve_metricas():
+    registro = RegistroMetricas()
+    registro.medidor("em_andamento").com().definir(2)
+    servidor = registro.servir(porta=0)
+    try:
+        endereco, porta = servidor.server_address
+        with urllib.request.urlopen(f"http://{endereco}:{porta}/metrics", timeout=5) as resposta:
+            assert "em_andamento 2" in resposta.read().decode("utf-8")
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def test_classes_homonimas_tem_series_separadas():
+    from checkout_refatorado import PagamentoPix as PixRefatorado
+    from sistema_pedidos.pagamentos import PagamentoPix
+
+    familia = REGISTRO.contador("pagamentos_total", rotulos=("metodo", "resultado"))
+    series = [familia.com(metodo=f"{classe.__module__}.PagamentoPix", resultado="aprovado")
+              for classe in (PixRefatorado, PagamentoPix)]
+    antes = [serie.valor for serie in series]
+    PixRefatorado().processar(10.0)
+    assert [serie.valor for serie in series] == [antes[0] + 1, antes[1]]
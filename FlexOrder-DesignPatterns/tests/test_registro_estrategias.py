@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from sistema_pedidos.registro import RegistroEstrategias, obter_frete, obter_pagamento
+
+
+def test_import_do_pacote_nao_carrega_estrategias():
+    codigo = ("import sys, sistema_pedidos; "
+              "print(sorted(m for m in sys.modules if m.startswith('sistema_pedidos')))")
+    saida = subprocess.run([sys.executable, "-c", codigo], cwd=ROOT,
+                           capture_output=True, text=True, check=True).stdout
+    assert saida.strip() == "['sistema_pedidos']"
+
+
+
+def test_importar_estrategia_nao_carrega_subsistemas():
+    codigo = ("import sys; from sistema_pedidos.registro import obter_pagamento; "
+              "obter_pagamento('pix'); "
+              "print(sorted(m for m in sys.modules if m.startswith('subsistemas')))")
+    saida = subprocess.run([sys.executable, "-c", codigo], cwd=ROOT,
+                           capture_output=True, text=True, check=True).stdout
+    assert saida.strip() == "[]"
+
+
+def test_obter_retorna_as_classes_do_pacote():
+    from sistema_pedidos.fretes import FreteExpresso
+    from sistema_pedidos.pagamentos import PagamentoPix
+
+    assert obter_pagamento("pix") is PagamentoPix
+    assert obter_frete("expresso") is FreteExpresso
+
+
+def test_nome_desconhecido_gera_keyerror():
+    with pytest.raises(KeyError):
+        obter_pagamento("boleto_magico")
+
+
+def test_registrar_alvo_proprio():
+    registro = RegistroEstrategias(usar_entry_points=False)
+    registro.registrar("frete", "normal", "sistema_pedidos.fretes:FreteNormal")
+    assert registro.nomes("frete") == ["normal"]
+    assert registro.criar("frete", "normal").calcular(100.0) == pytest.approx(5.0)
@@ -1,23 +1,14 @@
-class NovaAPIEnvio:
-    def enviar_dados(self, dados):
-        raise NotImplementedError
+# O Adapter vem da implementação em padroes/estruturais/adapter: a tradução
+# para o formato legado é feita por um esquema de campos compilado
+# (padroes/estruturais/adapter/esquema.py), e não por uma f-string avulsa.
+from padroes.estruturais.adapter.esquema import EsquemaTraducao
+from padroes.estruturais.adapter.implementacao import AdaptadorEnvio, APIAntigaEnvio
 
-
-class APIAntigaEnvio:
-    def enviar_dados_legado(self, dados_antigos):
-        print(f"Enviando: {dados_antigos}")
-
-
-class AdaptadorEnvio(NovaAPIEnvio):
-    def __init__(self, api_antiga):
-        self._api_antiga = api_antiga
-
-    def enviar_dados(self, dados):
-        dados_antigos = f"LEGADO_{dados}"
-        self._api_antiga.enviar_dados_legado(dados_antigos)
+# Formato legado deste exemplo: "LEGADO_<dados>".
+ESQUEMA_LEGADO = EsquemaTraducao([("LEGADO", "dados")], separador_valor="_")
 
 
 # Uso
 api_antiga = APIAntigaEnvio()
-adaptador = AdaptadorEnvio(api_antiga)
-adaptador.enviar_dados("Dados novos")
\ No newline at end of file
+adaptador = AdaptadorEnvio(api_antiga, ESQUEMA_LEGADO)
+adaptador.enviar_dados({"dados": "Dados novos"})
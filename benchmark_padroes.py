@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmarks repetíveis para os exemplos de Padrões de Projeto.
+
+O script descobre os módulos `implementacao` de cada padrão em `padroes/`,
+executa cenários parametrizados (profundidade da cadeia de decoradores,
+número de assinantes do observer, tamanho da árvore do composite, tamanho
+do lote do adapter, ...) com a saída padrão suprimida, grava os resultados
+em JSON e pode compará-los com uma linha de base salva, usando o teste de
+Mann-Whitney para dizer se a diferença é estatisticamente significativa.
+
+Uso:
+    python benchmark_padroes.py --saida base.json
+    python benchmark_padroes.py --comparar base.json
+    python benchmark_padroes.py --padrao decorator --repeticoes 30
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import math
+import os
+import pkgutil
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import padroes
+
+# Cenários registrados: padrão -> lista de (nome, parâmetros, preparo).
+CENARIOS = {}
+
+# Duração mínima de cada amostra; chamadas rápidas são repetidas em laço.
+DURACAO_MINIMA_AMOSTRA = 0.005
+
+
+def cenario(padrao, nome, parametros):
+    """Registra uma função de preparo como cenário de benchmark.
+
+    A função recebe as classes de `implementacao` do padrão (um dicionário
+    nome -> classe) e um valor de parâmetro, e retorna a função sem
+    argumentos que será cronometrada. O que acontece no preparo não é medido.
+
+    Args:
+        padrao (str): O nome do pacote do padrão, ex.: 'decorator'.
+        nome (str): O nome do parâmetro variado, ex.: 'profundidade'.
+        parametros (list): Os valores do parâmetro.
+    """
+    def registrar(preparo):
+        CENARIOS.setdefault(padrao, []).append((nome, list(parametros), preparo))
+        return preparo
+    return registrar
+
+
+def descobrir_implementacoes():
+    """Encontra as classes definidas em cada `padroes.<tipo>.<padrao>.implementacao`.
+
+    Returns:
+        dict: padrão -> {nome da classe: classe}.
+    """
+    encontradas = {}
+    # 'padroes' e as categorias são pacotes de namespace (sem __init__.py),
+    # então percorremos as categorias e listamos os pacotes de cada uma.
+    for raiz in padroes.__path__:
+        for categoria in sorted(os.scandir(raiz), key=lambda entrada: entrada.name):
+            if not categoria.is_dir() or categoria.name.startswith(("_", ".")):
+                continue
+            for info in pkgutil.iter_modules([categoria.path]):
+                caminho = os.path.join(categoria.path, info.name, "implementacao.py")
+                if not info.ispkg or not os.path.exists(caminho):
+                    continue
+                modulo = importlib.import_module(f"padroes.{categoria.name}.{info.name}.implementacao")
+                encontradas[info.name] = {
+                    nome: classe for nome, classe in inspect.getmembers(modulo, inspect.isclass)
+                    if classe.__module__ == modulo.__name__
+                }
+    return encontradas
+
+
+@cenario("adapter", "tamanho_lote", [1, 10, 100, 1000])
+def _adapter_lote(classes, tamanho):
+    adaptador = classes["AdaptadorEnvio"](classes["APIAntigaEnvio"]())
+    mensagens = [{"usuario": f"usuario{i}", "mensagem": f"mensagem {i}"} for i in range(tamanho)]
+    return lambda: adaptador.traduzir_lote(mensagens)
+
+
+@cenario("composite", "arquivos", [10, 100, 1000, 10000])
+def _composite_arvore(classes, total):
+    Pasta, Arquivo = classes["Pasta"], classes["Arquivo"]
+
+    def construir_e_agregar():
+        raiz = Pasta("raiz")
+        pastas = [Pasta(f"p{i}") for i in range(max(1, total // 50))]
+        for pasta in pastas:
+            raiz.adicionar(pasta)
+        for i in range(total):
+            pastas[i % len(pastas)].adicionar(Arquivo(f"a{i}.txt", i))
+        return raiz.get_tamanho(), raiz.contar_arquivos()
+    return construir_e_agregar
+
+
+@cenario("decorator", "profundidade", [1, 10, 100, 1000])
+def _decorator_cadeia(classes, profundidade):
+    CafeSimples, Leite, Acucar = classes["CafeSimples"], classes["Leite"], classes["Acucar"]
+
+    def montar_cadeia():
+        cafe = CafeSimples()
+        for nivel in range(profundidade):
+            cafe = (Leite if nivel % 2 else Acucar)(cafe)
+        return cafe.get_custo(), cafe.get_descricao()
+    return montar_cadeia
+
+
+@cenario("facade", "filmes_na_sessao", [1, 10, 100])
+def _facade_sessao(classes, filmes):
+    def assistir():
+        fachada = classes["HomeTheaterFacade"](classes["Amplificador"](), classes["DVDPlayer"](),
+                                               classes["Projetor"](), max_trabalhadores=1)
+        with fachada.sessao():
+            for i in range(filmes):
+                fachada.assistir_filme(f"Filme {i}")
+                fachada.parar_filme()
+    return assistir
+
+
+@cenario("observer", "assinantes", [1, 10, 100, 1000])
+def _observer_notificacao(classes, total):
+    editor = classes["Editor"]()
+    for i in range(total):
+        editor.adicionar_assinante(classes["Assinante"](f"assinante{i}"))
+    return lambda: editor.publicar_noticia("Nova versão publicada")
+
+
+@cenario("strategy", "pedidos", [1, 100, 10000])
+def _strategy_pedidos(classes, total):
+    estrategias = [classes[nome]() for nome in ("FreteNormal", "FreteExpresso", "FreteRetiradaLocal")]
+    pedido = classes["Pedido"](1.0, estrategias[0])
+
+    def calcular():
+        for i in range(total):
+            pedido.peso = i % 30 + 0.5
+            pedido.definir_estrategia_frete(estrategias[i % 3])
+            pedido.calcular_custo_total()
+    return calcular
+
+
+def medir(funcao, repeticoes=15):
+    """Mede o tempo por chamada de `funcao`, com a saída padrão descartada.
+
+    O número de chamadas por amostra é calibrado para que cada amostra dure
+    pelo menos DURACAO_MINIMA_AMOSTRA, reduzindo o peso da resolução do relógio.
+
+    Args:
+        funcao (callable): A função a cronometrar.
+        repeticoes (int, optional): Número de amostras. Defaults to 15.
+
+    Returns:
+        list: Segundos por chamada, uma entrada por amostra.
+    """
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        laco = 1
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(laco):
+                funcao()
+            if time.perf_counter() - inicio >= DURACAO_MINIMA_AMOSTRA or laco >= 1 << 20:
+                break
+            laco *= 2
+
+        amostras = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            for _ in range(laco):
+                funcao()
+            amostras.append((time.perf_counter() - inicio) / laco)
+    return amostras
+
+
+def executar(padroes_escolhidos=None, repeticoes=15):
+    """Executa os cenários e monta o documento de resultados.
+
+    Args:
+        padroes_escolhidos (list, optional): Restringe a estes padrões. Defaults to None (todos).
+        repeticoes (int, optional): Amostras por cenário. Defaults to 15.
+
+    Returns:
+        dict: Metadados do ambiente e, por cenário, as amostras e a mediana.
+    """
+    implementacoes = descobrir_implementacoes()
+    resultados = {}
+    for padrao, cenarios in sorted(CENARIOS.items()):
+        if padroes_escolhidos and padrao not in padroes_escolhidos:
+            continue
+        if padrao not in implementacoes:
+            print(f"Aviso: o padrão '{padrao}' não foi encontrado em padroes/.", file=sys.stderr)
+            continue
+        for nome, parametros, preparo in cenarios:
+            for valor in parametros:
+                chave = f"{padrao}/{nome}={valor}"
+                with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+                    funcao = preparo(implementacoes[padrao], valor)
+                amostras = medir(funcao, repeticoes)
+                resultados[chave] = {"amostras": amostras, "mediana": statistics.median(amostras)}
+                print(f"{chave:<40} {_formatar_tempo(resultados[chave]['mediana']):>12}")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementacao": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "repeticoes": repeticoes,
+        },
+        "resultados": resultados,
+    }
+
+
+def mann_whitney(a, b):
+    """Teste U de Mann-Whitney bilateral, pela aproximação normal.
+
+    Com correção para empates e de continuidade; adequado a partir de cerca
+    de 8 amostras por grupo.
+
+    Args:
+        a (list): Primeira amostra.
+        b (list): Segunda amostra.
+
+    Returns:
+        tuple: (U de `a`, valor-p bilateral).
+    """
+    n1, n2 = len(a), len(b)
+    combinados = sorted([(valor, 0) for valor in a] + [(valor, 1) for valor in b])
+    postos = [0.0] * len(combinados)
+    correcao_empates = 0.0
+    i = 0
+    while i < len(combinados):
+        j = i
+        while j + 1 < len(combinados) and combinados[j + 1][0] == combinados[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            postos[k] = (i + j) / 2 + 1
+        empatados = j - i + 1
+        correcao_empates += empatados ** 3 - empatados
+        i = j + 1
+
+    soma_a = sum(posto for posto, (_, grupo) in zip(postos, combinados) if grupo == 0)
+    u = soma_a - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    media = n1 * n2 / 2
+    variancia = n1 * n2 / 12 * ((n + 1) - correcao_empates / (n * (n - 1)))
+    if variancia <= 0:
+        return u, 1.0
+    z = (abs(u - media) - 0.5) / math.sqrt(variancia)
+    return u, min(1.0, 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+def comparar(atual, base, alfa=0.01, limiar=0.05):
+    """Compara dois documentos de resultados, cenário a cenário.
+
+    Uma diferença só é apontada se for estatisticamente significativa e
+    também maior que `limiar`: entre execuções separadas, o ruído da máquina
+    costuma produzir diferenças "significativas" de poucos por cento.
+
+    Args:
+        atual (dict): Resultados novos.
+        base (dict): Resultados da linha de base.
+        alfa (float, optional): Nível de significância. Defaults to 0.01.
+        limiar (float, optional): Variação relativa mínima das medianas.
+            Defaults to 0.05 (5%).
+
+    Returns:
+        list: Para cada cenário presente nos dois: (chave, razão das
+            medianas atual/base, valor-p, veredito).
+    """
+    linhas = []
+    for chave, novo in atual["resultados"].items():
+        antigo = base["resultados"].get(chave)
+        if antigo is None:
+            continue
+        _, p = mann_whitney(novo["amostras"], antigo["amostras"])
+        razao = novo["mediana"] / antigo["mediana"] if antigo["mediana"] else float("inf")
+        if p >= alfa or abs(razao - 1) < limiar:
+            veredito = "sem diferença"
+        else:
+            veredito = "mais lento" if razao > 1 else "mais rápido"
+        linhas.append((chave, razao, p, veredito))
+    return linhas
+
+
+def _formatar_tempo(segundos):
+    """Formata uma duração com a unidade mais legível."""
+    for unidade, fator in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if segundos >= fator:
+            return f"{segundos / fator:.3f} {unidade}"
+    return f"{segundos / 1e-9:.1f} ns"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks dos Padrões de Projeto.")
+    parser.add_argument("--padrao", action="append",
+                        help="executa apenas este padrão (pode repetir)")
+    parser.add_argument("--repeticoes", type=int, default=15, help="amostras por cenário (padrão: 15)")
+    parser.add_argument("--saida", help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--comparar", metavar="BASE", help="compara com uma linha de base em JSON")
+    parser.add_argument("--alfa", type=float, default=0.01, help="nível de significância (padrão: 0.01)")
+    parser.add_argument("--limiar", type=float, default=0.05,
+                        help="variação relativa mínima para apontar diferença (padrão: 0.05)")
+    args = parser.parse_args()
+
+    documento = executar(args.padrao, args.repeticoes)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(documento, arquivo, indent=2)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        linhas = comparar(documento, base, args.alfa, args.limiar)
+        print(f"\n{'Cenário':<40}{'atual/base':>11}{'valor-p':>10}  veredito")
+        for chave, razao, p, veredito in linhas:
+            print(f"{chave:<40}{razao:>11.3f}{p:>10.4f}  {veredito}")
+        sys.exit(1 if any(veredito == "mais lento" for *_, veredito in linhas) else 0)
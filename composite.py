@@ -22,6 +22,34 @@ class ComponenteSistemaArquivos(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_tamanho(self):
+        """
+        Retorna o tamanho total do componente.
+        """
+        pass
+
+    @abstractmethod
+    def contar_arquivos(self):
+        """
+        Retorna quantos arquivos existem no componente.
+        """
+        pass
+
+    @abstractmethod
+    def contar_pastas(self):
+        """
+        Retorna quantas pastas existem no componente, incluindo ele mesmo.
+        """
+        pass
+
+    @abstractmethod
+    def get_profundidade(self):
+        """
+        Retorna a altura da subárvore a partir do componente (folha = 0).
+        """
+        pass
+
 
 class Arquivo(ComponenteSistemaArquivos):
     """
@@ -29,11 +57,53 @@ class Arquivo(ComponenteSistemaArquivos):
     Uma folha não pode ter filhos.
     """
 
-    def __init__(self, nome):
+    def __init__(self, nome, tamanho=0):
         """
-        Inicializa o arquivo com um nome.
+        Inicializa o arquivo com um nome e um tamanho em bytes.
         """
         self.nome = nome
+        self._tamanho = tamanho
+        self.pai = None
+
+    @property
+    def tamanho(self):
+        """
+        O tamanho do arquivo em bytes.
+        """
+        return self._tamanho
+
+    @tamanho.setter
+    def tamanho(self, valor):
+        """
+        Altera o tamanho e invalida o resumo das pastas acima do arquivo.
+        """
+        self._tamanho = valor
+        if self.pai is not None:
+            self.pai._invalidar()
+
+    def get_tamanho(self):
+        """
+        Retorna o tamanho do arquivo em bytes.
+        """
+        return self._tamanho
+
+    def contar_arquivos(self):
+        """
+        Um arquivo conta a si mesmo.
+        """
+        return 1
+
+    def contar_pastas(self):
+        """
+        Um arquivo não contém pastas.
+        """
+        return 0
+
+    def get_profundidade(self):
+        """
+        Uma folha tem altura zero.
+        """
+        return 0
 
     def exibir(self, nivel=0):
         """
@@ -47,6 +117,10 @@ class Pasta(ComponenteSistemaArquivos):
     A classe Composite representa os componentes complexos que podem ter filhos.
     Normalmente, os objetos Composite delegam o trabalho real para seus filhos
     e, em seguida, "resumem" o resultado.
+
+    O resumo (tamanho, arquivos, pastas e profundidade) fica em cache na
+    pasta e só é invalidado no caminho até a raiz quando um componente é
+    adicionado ou removido, ou quando o tamanho de um arquivo muda.
     """
 
     def __init__(self, nome):
@@ -55,12 +129,91 @@ class Pasta(ComponenteSistemaArquivos):
         """
         self.nome = nome
         self.componentes = []
+        self.pai = None
+        self._resumo = None
 
     def adicionar(self, componente):
         """
         Adiciona um componente (arquivo ou pasta) a esta pasta.
+
+        Levanta ValueError se o componente já pertencer a uma pasta: remova-o
+        de lá antes de adicioná-lo aqui.
         """
+        if componente.pai is not None:
+            raise ValueError(f"'{componente.nome}' já pertence à pasta '{componente.pai.nome}'.")
         self.componentes.append(componente)
+        componente.pai = self
+        self._invalidar()
+
+    def remover(self, componente):
+        """
+        Remove um componente desta pasta.
+        """
+        self.componentes.remove(componente)
+        componente.pai = None
+        self._invalidar()
+
+    def _invalidar(self):
+        """
+        Descarta o resumo desta pasta e dos ancestrais que ainda o tenham.
+        """
+        pasta = self
+        while pasta is not None and pasta._resumo is not None:
+            pasta._resumo = None
+            pasta = pasta.pai
+
+    def _resumir(self):
+        """
+        Calcula (tamanho, arquivos, pastas, profundidade) e guarda o
+        resultado, sem recursão: uma pós-ordem com pilha explícita refaz só
+        as pastas sem resumo.
+        """
+        pilha = [(self, False)]
+        while pilha and self._resumo is None:
+            pasta, filhos_prontos = pilha.pop()
+            if not filhos_prontos:
+                pilha.append((pasta, True))
+                for c in pasta.componentes:
+                    if isinstance(c, Pasta) and c._resumo is None:
+                        pilha.append((c, False))
+                continue
+            tamanho, arquivos, pastas, profundidade = 0, 0, 1, 0
+            for c in pasta.componentes:
+                if isinstance(c, Pasta):
+                    t, a, p, h = c._resumo
+                else:
+                    t, a = c.get_tamanho(), c.contar_arquivos()
+                    p, h = c.contar_pastas(), c.get_profundidade()
+                tamanho += t
+                arquivos += a
+                pastas += p
+                profundidade = max(profundidade, h + 1)
+            pasta._resumo = (tamanho, arquivos, pastas, profundidade)
+        return self._resumo
+
+    def get_tamanho(self):
+        """
+        Retorna a soma dos tamanhos da subárvore.
+        """
+        return self._resumir()[0]
+
+    def contar_arquivos(self):
+        """
+        Retorna o total de arquivos da subárvore.
+        """
+        return self._resumir()[1]
+
+    def contar_pastas(self):
+        """
+        Retorna o total de pastas da subárvore, incluindo esta.
+        """
+        return self._resumir()[2]
+
+    def get_profundidade(self):
+        """
+        Retorna a altura da subárvore.
+        """
+        return self._resumir()[3]
 
     def exibir(self, nivel=0):
         """
@@ -79,9 +232,11 @@ class Pasta(ComponenteSistemaArquivos):
 #     relatorio.pdf
 raiz = Pasta("MeuDrive")
 docs = Pasta("Documentos")
-docs.adicionar(Arquivo("relatorio.pdf"))
+docs.adicionar(Arquivo("relatorio.pdf", 2048))
 raiz.adicionar(docs)
 
 # Exibindo a estrutura de arquivos a partir da raiz
 # O cliente não precisa saber se está interagindo com um arquivo ou uma pasta.
 raiz.exibir()
+print(f"{raiz.contar_arquivos()} arquivo(s), {raiz.contar_pastas()} pasta(s), "
+      f"{raiz.get_tamanho()} bytes, profundidade {raiz.get_profundidade()}")
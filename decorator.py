@@ -1,38 +1,7 @@
-class Cafe:
-    def get_custo(self):
-        raise NotImplementedError
-
-    def get_descricao(self):
-        raise NotImplementedError
-
-
-class CafeSimples(Cafe):
-    def get_custo(self):
-        return 5.0
-
-    def get_descricao(self):
-        return "Café Simples"
-
-
-class DecoradorCafe(Cafe):
-    def __init__(self, cafe):
-        self._cafe = cafe
-
-
-class Leite(DecoradorCafe):
-    def get_custo(self):
-        return self._cafe.get_custo() + 2.0
-
-    def get_descricao(self):
-        return self._cafe.get_descricao() + ", com Leite"
-
-
-class Acucar(DecoradorCafe):
-    def get_custo(self):
-        return self._cafe.get_custo() + 0.5
-
-    def get_descricao(self):
-        return self._cafe.get_descricao() + ", com Açúcar"
+# Os cafés e decoradores vêm da implementação em padroes/estruturais/decorator:
+# cada decorador envolve o café e delega a ele, guardando o custo e a
+# descrição acumulados para não percorrer a cadeia a cada consulta.
+from padroes.estruturais.decorator.implementacao import Acucar, CafeSimples, Leite
 
 
 # Composição em cascata
@@ -42,4 +11,4 @@ meu_cafe = Acucar(meu_cafe)
 
 print(f"{meu_cafe.get_descricao()}: R${meu_cafe.get_custo():.2f}")
 
-# Saída: Café Simples, com Leite, com Açúcar: R$7.50
\ No newline at end of file
+# Saída: Café Simples, com Leite, com Açúcar: R$8.00
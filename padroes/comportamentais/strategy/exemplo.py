@@ -1,4 +1,6 @@
 from .implementacao import Pedido, FreteNormal, FreteExpresso, FreteRetiradaLocal
+from .selecao import selecionar_frete_mais_barato
+from .tabela import TARIFAS_EXEMPLO, FreteTabelado, TabelaFrete
 
 def main():
     """Função principal para demonstrar o uso do padrão Strategy."""
@@ -22,4 +24,21 @@ def main():
     pedido.definir_estrategia_frete(frete_retirada)
     pedido.calcular_custo_total()
 
+    # Frete por faixas de peso, lido de um arquivo de tarifas
+    tabela = TabelaFrete.carregar(TARIFAS_EXEMPLO)
+    pedido.definir_estrategia_frete(FreteTabelado(tabela, "nordeste"))
+    pedido.calcular_custo_total()
+
+    # Cotação de vários envios de uma vez
+    pesos = [0.3, 1.2, 4.8, 25.0]
+    precos = FreteTabelado(tabela, "sudeste").calcular_lote(pesos)
+    for peso, preco in zip(pesos, precos):
+        print(f"  {peso:>5.1f} kg para o sudeste: R${float(preco):.2f}")
+
+    # O frete mais barato para vários pedidos, com uma chamada por estratégia
+    candidatas = [FreteNormal(), FreteExpresso(), FreteTabelado(tabela, "sudeste")]
+    escolhidas, custos = selecionar_frete_mais_barato(pesos, candidatas)
+    for peso, estrategia, custo in zip(pesos, escolhidas, custos):
+        print(f"  {peso:>5.1f} kg: {estrategia.__class__.__name__} (R${float(custo):.2f})")
+
     print("---------------------\n")
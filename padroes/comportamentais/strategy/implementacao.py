@@ -1,38 +1,85 @@
+import inspect
 from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Tuple, Type
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele, os lotes são calculados item a item.
+    np = None
 
 # Estratégia Abstrata (Interface)
 class EstrategiaCalculoFrete(ABC):
-    """Define a interface para as estratégias de cálculo de frete."""
-    @abstractmethod
-    def calcular(self, peso: float) -> float:
-        """Calcula o frete com base no peso.
+    """
+    Define a interface para as estratégias de cálculo de frete.
+
+    Toda subclasse concreta é registrada automaticamente, na ordem de
+    definição, para que a seleção do frete mais barato possa avaliar todas.
+    Classes intermediárias ainda abstratas ficam de fora. Estratégias que
+    dependem de configuração no construtor, ou classes auxiliares (de testes,
+    por exemplo), se excluem com
+    `class MinhaEstrategia(EstrategiaCalculoFrete, registrar=False)` e podem
+    ser registradas depois, explicitamente, com `registrar_classe`.
+
+    `retirada` marca as que dispensam entrega (a seleção só as considera se
+    forem pedidas).
+    """
+    _registradas = []
+
+    retirada = False
+
+    def __init_subclass__(cls, registrar: bool = True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if registrar and not inspect.isabstract(cls):
+            EstrategiaCalculoFrete._registradas.append(cls)
+
+    @classmethod
+    def registradas(cls) -> Tuple[Type["EstrategiaCalculoFrete"], ...]:
+        """Retorna as estratégias registradas, na ordem de definição.
+
+        Returns:
+            Tuple[Type[EstrategiaCalculoFrete], ...]: As classes registradas.
+        """
+        return tuple(EstrategiaCalculoFrete._registradas)
+
+    @staticmethod
+    def registrar_classe(classe: Type["EstrategiaCalculoFrete"]) -> Type["EstrategiaCalculoFrete"]:
+        """Registra explicitamente uma estratégia criada com `registrar=False`.
+
+        Pode ser usado como decorador de classe.
 
         Args:
-            peso (float): O peso do produto.
+            classe (Type[EstrategiaCalculoFrete]): A estratégia concreta.
 
         Returns:
-            float: O valor do frete.
+            Type[EstrategiaCalculoFrete]: A própria classe.
+
+        Raises:
+            TypeError: Se a classe for abstrata.
         """
+        if inspect.isabstract(classe):
+            raise TypeError(f"{classe.__name__} é abstrata e não pode ser registrada.")
+        if classe not in EstrategiaCalculoFrete._registradas:
+            EstrategiaCalculoFrete._registradas.append(classe)
+        return classe
 
-# Estratégias Concretas
-class FreteNormal(EstrategiaCalculoFrete):
-    """Estratégia de frete normal."""
-    def calcular(self, peso: float) -> float:
-        """Calcula o frete normal.
+    def calcular_lote(self, pesos: Sequence[float]):
+        """Calcula o frete de muitos pesos de uma vez.
+
+        A implementação padrão chama `calcular` para cada peso; as
+        estratégias podem sobrescrevê-la com uma forma vetorizada.
 
         Args:
-            peso (float): O peso do produto.
+            pesos (Sequence[float]): Os pesos.
 
         Returns:
-            float: O valor do frete.
+            Os valores do frete: um array numpy (se disponível) ou uma lista.
         """
-        # Custo de R$ 5.0 por kg
-        return peso * 5.0
+        custos = [self.calcular(peso) for peso in pesos]
+        return np.asarray(custos, dtype=float) if np is not None else custos
 
-class FreteExpresso(EstrategiaCalculoFrete):
-    """Estratégia de frete expresso."""
+    @abstractmethod
     def calcular(self, peso: float) -> float:
-        """Calcula o frete expresso.
+        """Calcula o frete com base no peso.
 
         Args:
             peso (float): O peso do produto.
@@ -40,13 +87,20 @@ class FreteExpresso(EstrategiaCalculoFrete):
         Returns:
             float: O valor do frete.
         """
-        # Custo de R$ 10.0 por kg + taxa fixa de R$ 10.0
-        return peso * 10.0 + 10.0
 
-class FreteRetiradaLocal(EstrategiaCalculoFrete):
-    """Estratégia de retirada local."""
+class FreteLinear(EstrategiaCalculoFrete, registrar=False):
+    """
+    Base das tarifas lineares: `custo_por_kg` por quilo mais `taxa_fixa`.
+
+    Com numpy, `calcular_lote` resolve todos os pesos numa só operação, mas
+    apenas se a subclasse não sobrescreveu `calcular`; caso contrário, o lote
+    usa o `calcular` dela, para que os dois caminhos deem sempre o mesmo valor.
+    """
+    custo_por_kg = 0.0
+    taxa_fixa = 0.0
+
     def calcular(self, peso: float) -> float:
-        """Calcula o frete para retirada local.
+        """Calcula o frete linear.
 
         Args:
             peso (float): O peso do produto.
@@ -54,8 +108,34 @@ class FreteRetiradaLocal(EstrategiaCalculoFrete):
         Returns:
             float: O valor do frete.
         """
-        # Sem custo
-        return 0.0
+        return peso * self.custo_por_kg + self.taxa_fixa
+
+    def calcular_lote(self, pesos: Sequence[float]):
+        """Calcula o frete linear de muitos pesos de uma vez.
+
+        Args:
+            pesos (Sequence[float]): Os pesos.
+
+        Returns:
+            Os valores do frete: um array numpy (se disponível) ou uma lista.
+        """
+        if np is None or type(self).calcular is not FreteLinear.calcular:
+            return super().calcular_lote(pesos)
+        return np.asarray(pesos, dtype=float) * self.custo_por_kg + self.taxa_fixa
+
+# Estratégias Concretas
+class FreteNormal(FreteLinear):
+    """Estratégia de frete normal: R$ 5.0 por kg."""
+    custo_por_kg = 5.0
+
+class FreteExpresso(FreteLinear):
+    """Estratégia de frete expresso: R$ 10.0 por kg + taxa fixa de R$ 10.0."""
+    custo_por_kg = 10.0
+    taxa_fixa = 10.0
+
+class FreteRetiradaLocal(FreteLinear):
+    """Estratégia de retirada local: sem custo."""
+    retirada = True
 
 # Contexto (utiliza a Estratégia)
 class Pedido:
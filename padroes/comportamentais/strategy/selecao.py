@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Escolha do frete mais barato entre várias estratégias, para muitos pedidos."""
+
+from typing import List, Optional, Sequence, Tuple
+
+from .implementacao import EstrategiaCalculoFrete
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele, comparamos item a item.
+    np = None
+
+
+def estrategias_registradas(incluir_retirada: bool = False) -> List[EstrategiaCalculoFrete]:
+    """Instancia as estratégias registradas.
+
+    Args:
+        incluir_retirada (bool, optional): Se inclui as de retirada no local,
+            que custam zero e venceriam sempre. Defaults to False.
+
+    Returns:
+        List[EstrategiaCalculoFrete]: Uma instância de cada estratégia registrada.
+    """
+    return [classe() for classe in EstrategiaCalculoFrete.registradas()
+            if incluir_retirada or not classe.retirada]
+
+
+def selecionar_frete_mais_barato(pesos: Sequence[float],
+                                 estrategias: Optional[Sequence[EstrategiaCalculoFrete]] = None,
+                                 incluir_retirada: bool = False
+                                 ) -> Tuple[List[EstrategiaCalculoFrete], list]:
+    """Escolhe, para cada pedido, a estratégia de frete mais barata.
+
+    Cada estratégia é chamada uma única vez, com `calcular_lote` sobre todos os
+    pesos: são M chamadas em vez de N x M. Com numpy, os custos formam uma
+    matriz estratégias x pedidos e a escolha é um `argmin` por coluna. Em caso
+    de empate vence a estratégia que aparece primeiro.
+
+    Args:
+        pesos (Sequence[float]): O peso de cada pedido.
+        estrategias (Optional[Sequence[EstrategiaCalculoFrete]], optional): As
+            candidatas, usadas como vieram. Defaults to None (todas as
+            registradas).
+        incluir_retirada (bool, optional): Sem `estrategias`, se a retirada
+            no local entra na comparação. Defaults to False.
+
+    Returns:
+        Tuple[List[EstrategiaCalculoFrete], list]: A estratégia escolhida e o
+            custo correspondente, para cada pedido (os custos são um array
+            numpy, ou uma lista sem numpy).
+
+    Raises:
+        ValueError: Se não houver estratégias candidatas.
+    """
+    candidatas = (list(estrategias) if estrategias is not None
+                  else estrategias_registradas(incluir_retirada))
+    if not candidatas:
+        raise ValueError("Nenhuma estratégia de frete para comparar.")
+
+    if np is not None:
+        custos = np.vstack([np.asarray(e.calcular_lote(pesos), dtype=float) for e in candidatas])
+        escolhas = custos.argmin(axis=0)
+        return [candidatas[i] for i in escolhas.tolist()], custos[escolhas, np.arange(custos.shape[1])]
+
+    colunas = [list(e.calcular_lote(pesos)) for e in candidatas]
+    escolhidas, melhores = [], []
+    for custos_pedido in zip(*colunas):
+        indice = min(range(len(candidatas)), key=custos_pedido.__getitem__)
+        escolhidas.append(candidatas[indice])
+        melhores.append(custos_pedido[indice])
+    return escolhidas, melhores
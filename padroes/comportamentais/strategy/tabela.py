@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Estratégia de frete guiada por uma tabela de tarifas por faixa de peso."""
+
+import bisect
+import csv
+import os
+from array import array
+from typing import Dict, Iterable, Sequence, Tuple
+
+from .implementacao import EstrategiaCalculoFrete
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele, usamos bisect item a item.
+    np = None
+
+# Tabela de exemplo distribuída junto com o módulo.
+TARIFAS_EXEMPLO = os.path.join(os.path.dirname(__file__), "tarifas.csv")
+
+
+class TabelaFrete:
+    """
+    Tarifas por região, em faixas de peso ordenadas.
+
+    Cada região guarda dois arrays paralelos e ordenados: o peso máximo de
+    cada faixa e o preço correspondente. Uma cotação é a primeira faixa cujo
+    peso máximo é maior ou igual ao peso, encontrada com busca binária
+    (`bisect`), ou com `numpy.searchsorted` para um lote inteiro de pesos.
+    """
+
+    def __init__(self, faixas: Dict[str, Iterable[Tuple[float, float]]]):
+        """Monta a tabela.
+
+        Args:
+            faixas (Dict[str, Iterable[Tuple[float, float]]]): Para cada região,
+                pares (peso máximo, preço). A ordem não importa; use
+                float("inf") para a última faixa sem limite.
+
+        Raises:
+            ValueError: Se uma região não tiver faixas ou repetir um peso máximo.
+        """
+        self._limites: Dict[str, array] = {}
+        self._precos: Dict[str, array] = {}
+        self._vetores: Dict[str, tuple] = {}
+        for regiao, pares in faixas.items():
+            ordenados = sorted(pares)
+            if not ordenados:
+                raise ValueError(f"A região '{regiao}' não tem faixas.")
+            limites = [limite for limite, _ in ordenados]
+            if len(set(limites)) != len(limites):
+                raise ValueError(f"A região '{regiao}' repete um peso máximo.")
+            self._limites[regiao] = array("d", limites)
+            self._precos[regiao] = array("d", (preco for _, preco in ordenados))
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "TabelaFrete":
+        """Lê um CSV com o cabeçalho `regiao,peso_max,preco`.
+
+        Args:
+            caminho (str): O arquivo de tarifas.
+
+        Returns:
+            TabelaFrete: A tabela carregada.
+        """
+        faixas: Dict[str, list] = {}
+        with open(caminho, newline="", encoding="utf-8") as arquivo:
+            for linha in csv.DictReader(arquivo):
+                faixas.setdefault(linha["regiao"].strip(), []).append(
+                    (float(linha["peso_max"]), float(linha["preco"])))
+        return cls(faixas)
+
+    @property
+    def regioes(self) -> Tuple[str, ...]:
+        """Tuple[str, ...]: As regiões da tabela."""
+        return tuple(self._limites)
+
+    def cotar(self, peso: float, regiao: str) -> float:
+        """Retorna o preço de um envio.
+
+        Args:
+            peso (float): O peso do envio.
+            regiao (str): A região de destino.
+
+        Returns:
+            float: O preço da faixa do peso.
+
+        Raises:
+            KeyError: Se a região não estiver na tabela.
+            ValueError: Se o peso passar da última faixa da região.
+        """
+        limites = self._limites[regiao]
+        indice = bisect.bisect_left(limites, peso)
+        if indice == len(limites):
+            raise ValueError(f"Peso {peso} acima da última faixa da região '{regiao}'.")
+        return self._precos[regiao][indice]
+
+    def cotar_lote(self, pesos: Sequence[float], regiao: str):
+        """Retorna o preço de muitos envios para a mesma região.
+
+        Args:
+            pesos (Sequence[float]): Os pesos (array numpy ou sequência).
+            regiao (str): A região de destino.
+
+        Returns:
+            Os preços: um array numpy, ou uma lista sem numpy.
+
+        Raises:
+            KeyError: Se a região não estiver na tabela.
+            ValueError: Se algum peso passar da última faixa da região.
+        """
+        if np is None:
+            return [self.cotar(peso, regiao) for peso in pesos]
+        limites, precos = self._vetor(regiao)
+        indices = np.searchsorted(limites, np.asarray(pesos, dtype=float), side="left")
+        if indices.size and indices.max() == len(limites):
+            raise ValueError(f"Há pesos acima da última faixa da região '{regiao}'.")
+        return precos[indices]
+
+    def _vetor(self, regiao: str) -> tuple:
+        """Arrays numpy da região, criados uma vez sobre os buffers dos arrays."""
+        vetor = self._vetores.get(regiao)
+        if vetor is None:
+            vetor = (np.frombuffer(self._limites[regiao], dtype=float),
+                     np.frombuffer(self._precos[regiao], dtype=float))
+            self._vetores[regiao] = vetor
+        return vetor
+
+
+class FreteTabelado(EstrategiaCalculoFrete, registrar=False):
+    """
+    Estratégia de frete que consulta uma tabela de tarifas para uma região.
+
+    Não entra no registro automático, pois precisa de tabela e região; passe
+    instâncias explicitamente para `selecionar_frete_mais_barato`.
+    """
+
+    def __init__(self, tabela: TabelaFrete, regiao: str):
+        """Inicializa a estratégia.
+
+        Args:
+            tabela (TabelaFrete): As tarifas.
+            regiao (str): A região de destino.
+
+        Raises:
+            KeyError: Se a região não estiver na tabela.
+        """
+        if regiao not in tabela.regioes:
+            raise KeyError(regiao)
+        self.tabela = tabela
+        self.regiao = regiao
+
+    def calcular(self, peso: float) -> float:
+        """Calcula o frete pela tabela.
+
+        Args:
+            peso (float): O peso do produto.
+
+        Returns:
+            float: O valor do frete.
+        """
+        return self.tabela.cotar(peso, self.regiao)
+
+    def calcular_lote(self, pesos: Sequence[float]):
+        """Calcula o frete de muitos pesos de uma vez.
+
+        Args:
+            pesos (Sequence[float]): Os pesos.
+
+        Returns:
+            Os valores do frete: um array numpy, ou uma lista sem numpy.
+        """
+        return self.tabela.cotar_lote(pesos, self.regiao)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Variante assíncrona do Adapter, com limite de concorrência e retentativas."""
+
+import asyncio
+import contextvars
+import inspect
+import random
+import time
+from typing import Iterable, List, Optional, Tuple, Type
+
+from .esquema import ESQUEMA_PADRAO, EsquemaTraducao
+
+# Falhas que costumam passar sozinhas e valem nova tentativa (o timeout de
+# cada tentativa chega como asyncio.TimeoutError).
+ERROS_TRANSITORIOS: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError,
+                                                        asyncio.TimeoutError)
+
+
+class NovaAPIEnvioAssincrona:
+    """Define a interface moderna, assíncrona, esperada pelo cliente."""
+
+    async def enviar_dados(self, dados: dict):
+        """Envia os dados sem bloquear o laço de eventos.
+
+        Args:
+            dados (dict): Os dados a serem enviados.
+        """
+        raise NotImplementedError("Este método deve ser implementado por subclasses.")
+
+
+class AdaptadorEnvioAssincrono(NovaAPIEnvioAssincrona):
+    """
+    Adapta uma API antiga (síncrona ou assíncrona) para a interface assíncrona.
+
+    - No máximo `max_concorrencia` chamadas ao legado ficam em andamento; os
+      demais produtores esperam no semáforo, sem bloquear o laço de eventos.
+    - Cada tentativa tem `timeout` segundos.
+    - Falhas transitórias (`erros_transitorios`: por padrão, erros de conexão
+      e timeouts) são repetidas até `tentativas` vezes, com espera
+      exponencial com jitter completo: uniforme entre 0 e
+      min(atraso_maximo, atraso_base * 2**n). O semáforo é liberado durante a
+      espera, para não ocupar vaga de quem pode ser atendido. Qualquer outra
+      exceção é relançada na hora, sem nova tentativa.
+
+    Uma API antiga síncrona é executada numa thread do executor padrão. Nesse
+    caso o timeout libera o produtor, mas não interrompe a chamada em curso:
+    a vaga no semáforo só é devolvida quando a thread termina, de modo que
+    nunca há mais de `max_concorrencia` chamadas ao legado em andamento.
+
+    O semáforo é criado no laço de eventos em execução, na primeira chamada,
+    e recriado se o adaptador passar a ser usado em outro laço (por exemplo,
+    em chamadas sucessivas de `asyncio.run`).
+    """
+
+    def __init__(self, api_antiga, max_concorrencia: int = 10, tentativas: int = 3,
+                 timeout: Optional[float] = 2.0, atraso_base: float = 0.05,
+                 atraso_maximo: float = 2.0, esquema: Optional[EsquemaTraducao] = None,
+                 aleatorio: Optional[random.Random] = None,
+                 erros_transitorios: Tuple[Type[BaseException], ...] = ERROS_TRANSITORIOS):
+        """Inicializa o adaptador assíncrono.
+
+        Args:
+            api_antiga: Objeto com `enviar_dados_legado(str)`, síncrono ou `async`.
+            max_concorrencia (int, optional): Chamadas simultâneas ao legado. Defaults to 10.
+            tentativas (int, optional): Total de tentativas por mensagem. Defaults to 3.
+            timeout (Optional[float], optional): Segundos por tentativa; None
+                desativa. Defaults to 2.0.
+            atraso_base (float, optional): Espera base entre tentativas. Defaults to 0.05.
+            atraso_maximo (float, optional): Teto da espera. Defaults to 2.0.
+            esquema (Optional[EsquemaTraducao], optional): Como traduzir os
+                campos. Defaults to None (ESQUEMA_PADRAO).
+            aleatorio (Optional[random.Random], optional): Fonte do jitter, útil
+                para testes reprodutíveis. Defaults to None.
+            erros_transitorios (Tuple[Type[BaseException], ...], optional): As
+                exceções que merecem nova tentativa. Defaults to ERROS_TRANSITORIOS.
+
+        Raises:
+            ValueError: Se `max_concorrencia` ou `tentativas` forem menores que 1.
+        """
+        if max_concorrencia < 1 or tentativas < 1:
+            raise ValueError("max_concorrencia e tentativas devem ser pelo menos 1.")
+        self._api_antiga = api_antiga
+        self._esquema = esquema if esquema is not None else ESQUEMA_PADRAO
+        self.max_concorrencia = max_concorrencia
+        self._semaforo: Optional[asyncio.Semaphore] = None
+        self._laco: Optional[asyncio.AbstractEventLoop] = None
+        self._assincrona = inspect.iscoroutinefunction(api_antiga.enviar_dados_legado)
+        self._aleatorio = aleatorio or random.Random()
+        self.tentativas = tentativas
+        self.erros_transitorios = tuple(erros_transitorios)
+        self.timeout = timeout
+        self.atraso_base = atraso_base
+        self.atraso_maximo = atraso_maximo
+        self.sucessos = 0
+        self.falhas = 0
+        self.retentativas = 0
+
+    async def enviar_dados(self, dados: dict):
+        """Traduz e envia os dados, repetindo em caso de falha.
+
+        Args:
+            dados (dict): Os dados a serem enviados no formato novo.
+
+        Raises:
+            Exception: A última falha transitória, se todas as tentativas se
+                esgotarem, ou a primeira falha de qualquer outro tipo.
+        """
+        dados_antigos = self._esquema.traduzir(dados)
+        for tentativa in range(self.tentativas):
+            try:
+                await self._chamar_legado(dados_antigos)
+                self.sucessos += 1
+                return
+            except self.erros_transitorios:
+                if tentativa == self.tentativas - 1:
+                    self.falhas += 1
+                    raise
+            except Exception:
+                self.falhas += 1
+                raise
+            self.retentativas += 1
+            await asyncio.sleep(self._atraso(tentativa))
+
+    async def enviar_varios(self, lista_dados: Iterable[dict]) -> List[Optional[BaseException]]:
+        """Envia várias mensagens concorrentemente.
+
+        Args:
+            lista_dados (Iterable[dict]): As mensagens no formato novo.
+
+        Returns:
+            List[Optional[BaseException]]: Para cada mensagem, None em caso de
+                sucesso ou a exceção final.
+        """
+        resultados = await asyncio.gather(*(self.enviar_dados(dados) for dados in lista_dados),
+                                          return_exceptions=True)
+        return [r if isinstance(r, BaseException) else None for r in resultados]
+
+    def _semaforo_do_laco(self) -> asyncio.Semaphore:
+        """Retorna o semáforo do laço em execução, criando-o se preciso."""
+        laco = asyncio.get_running_loop()
+        if self._laco is not laco:
+            self._semaforo = asyncio.Semaphore(self.max_concorrencia)
+            self._laco = laco
+        return self._semaforo
+
+    async def _chamar_legado(self, dados_antigos: str):
+        """Faz uma tentativa, com timeout, sem bloquear o laço de eventos."""
+        semaforo = self._semaforo_do_laco()
+        if self._assincrona:
+            async with semaforo:
+                await asyncio.wait_for(self._api_antiga.enviar_dados_legado(dados_antigos),
+                                       self.timeout)
+            return
+
+        await semaforo.acquire()
+        try:
+            # Como asyncio.to_thread, mas a vaga é devolvida pelo próprio
+            # futuro ao terminar, e não por quem desistiu de esperar por ele.
+            futuro = asyncio.get_running_loop().run_in_executor(
+                None, contextvars.copy_context().run,
+                self._api_antiga.enviar_dados_legado, dados_antigos)
+        except BaseException:
+            semaforo.release()
+            raise
+        futuro.add_done_callback(lambda concluido: _liberar_vaga(semaforo, concluido))
+        await asyncio.wait_for(asyncio.shield(futuro), self.timeout)
+
+    def _atraso(self, tentativa: int) -> float:
+        """Calcula a espera antes da próxima tentativa (jitter completo)."""
+        teto = min(self.atraso_maximo, self.atraso_base * (2 ** tentativa))
+        return self._aleatorio.uniform(0, teto)
+
+
+def _liberar_vaga(semaforo: asyncio.Semaphore, futuro: asyncio.Future) -> None:
+    """Devolve a vaga de uma chamada síncrona quando a thread termina."""
+    semaforo.release()
+    if not futuro.cancelled():
+        # Marca a exceção como lida: após um timeout, ninguém mais a espera.
+        futuro.exception()
+
+
+class APIAntigaSimulada:
+    """
+    Legado simulado, local e assíncrono, para testes de carga.
+
+    Cada chamada espera `latencia` segundos (mais um jitter opcional) e falha
+    com probabilidade `taxa_falha`. O pico de chamadas simultâneas fica
+    registrado em `pico_concorrencia`.
+    """
+
+    def __init__(self, latencia: float = 0.05, jitter: float = 0.0, taxa_falha: float = 0.0,
+                 aleatorio: Optional[random.Random] = None):
+        """Inicializa o legado simulado.
+
+        Args:
+            latencia (float, optional): Segundos por chamada. Defaults to 0.05.
+            jitter (float, optional): Variação máxima somada à latência. Defaults to 0.0.
+            taxa_falha (float, optional): Probabilidade de erro, de 0 a 1. Defaults to 0.0.
+            aleatorio (Optional[random.Random], optional): Fonte de aleatoriedade. Defaults to None.
+        """
+        self.latencia = latencia
+        self.jitter = jitter
+        self.taxa_falha = taxa_falha
+        self._aleatorio = aleatorio or random.Random()
+        self.recebidos: List[str] = []
+        self.chamadas = 0
+        self.em_andamento = 0
+        self.pico_concorrencia = 0
+
+    async def enviar_dados_legado(self, dados_antigos: str):
+        """Simula o envio no formato legado.
+
+        Args:
+            dados_antigos (str): Os dados a serem enviados.
+
+        Raises:
+            ConnectionError: Quando a falha simulada é sorteada.
+        """
+        self.chamadas += 1
+        self.em_andamento += 1
+        self.pico_concorrencia = max(self.pico_concorrencia, self.em_andamento)
+        try:
+            await asyncio.sleep(self.latencia + self._aleatorio.uniform(0, self.jitter))
+            if self._aleatorio.random() < self.taxa_falha:
+                raise ConnectionError("(API Antiga Simulada) Falha simulada.")
+            self.recebidos.append(dados_antigos)
+        finally:
+            self.em_andamento -= 1
+
+
+async def teste_de_carga(adaptador: AdaptadorEnvioAssincrono, total: int = 1000) -> dict:
+    """Dispara `total` mensagens pelo adaptador e mede a vazão.
+
+    Args:
+        adaptador (AdaptadorEnvioAssincrono): O adaptador sob teste.
+        total (int, optional): Quantidade de mensagens. Defaults to 1000.
+
+    Returns:
+        dict: Mensagens, falhas, retentativas, segundos e mensagens por segundo.
+    """
+    mensagens = ({"usuario": f"usuario{i}", "mensagem": f"mensagem {i}"} for i in range(total))
+    inicio = time.perf_counter()
+    resultados = await adaptador.enviar_varios(mensagens)
+    duracao = time.perf_counter() - inicio
+    return {
+        "mensagens": total,
+        "falhas": sum(1 for r in resultados if r is not None),
+        "retentativas": adaptador.retentativas,
+        "segundos": duracao,
+        "mensagens_por_segundo": total / duracao if duracao else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    legado = APIAntigaSimulada(latencia=0.05, jitter=0.02, taxa_falha=0.05, aleatorio=random.Random(1))
+    adaptador = AdaptadorEnvioAssincrono(legado, max_concorrencia=50, aleatorio=random.Random(2))
+    print(asyncio.run(teste_de_carga(adaptador, 2000)))
+    print(f"Pico de concorrência no legado: {legado.pico_concorrencia}")
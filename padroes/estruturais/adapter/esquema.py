@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tradução declarativa, guiada por um esquema de campos, para o Adapter."""
+
+import io
+from typing import Iterable, Sequence, Tuple, Union
+
+
+class EsquemaTraducao:
+    """
+    Descreve como um dicionário do formato novo vira a string do formato legado.
+
+    O esquema é uma lista de pares (rótulo legado, campo novo). Na construção
+    ele é compilado em funções especializadas, geradas uma única vez, cujo
+    corpo é uma f-string com os rótulos já embutidos, por exemplo:
+
+        def traduzir(dados, _c0='usuario', _c1='mensagem'):
+            return f"user:{dados.get(_c0)};msg:{dados.get(_c1)}"
+
+    Traduzir uma mensagem custa o mesmo que a f-string escrita à mão: os
+    valores vão direto para o resultado, sem strings intermediárias por campo
+    e sem percorrer o esquema a cada chamada.
+    """
+
+    def __init__(self, campos: Sequence[Tuple[str, str]], separador_campos: str = ";",
+                 separador_valor: str = ":", prefixo: str = "", sufixo: str = ""):
+        """Compila o esquema.
+
+        Args:
+            campos (Sequence[Tuple[str, str]]): Pares (rótulo legado, chave no dicionário novo).
+            separador_campos (str, optional): Texto entre campos. Defaults to ";".
+            separador_valor (str, optional): Texto entre rótulo e valor. Defaults to ":".
+            prefixo (str, optional): Texto antes do primeiro campo. Defaults to "".
+            sufixo (str, optional): Texto após o último campo. Defaults to "".
+
+        Raises:
+            ValueError: Se o esquema não tiver campos.
+        """
+        if not campos:
+            raise ValueError("O esquema precisa de pelo menos um campo.")
+        self.campos = tuple(campos)
+
+        def literal(texto: str) -> str:
+            return texto.replace("{", "{{").replace("}", "}}")
+
+        # Os nomes dos campos entram como valores padrão (_c0, _c1, ...), e não
+        # no código-fonte, para que qualquer chave seja aceita com segurança.
+        molde = literal(prefixo) + literal(separador_campos).join(
+            literal(rotulo + separador_valor) + "{dados.get(_c%d)}" % indice
+            for indice, (rotulo, _) in enumerate(self.campos)
+        ) + literal(sufixo)
+        parametros = ", ".join("_c%d=%r" % (indice, chave)
+                               for indice, (_, chave) in enumerate(self.campos))
+        expressao = "f" + repr(molde)
+        fonte = (
+            f"def traduzir(dados, {parametros}):\n"
+            f"    return {expressao}\n"
+            f"def traduzir_lote(lista_dados, separador, {parametros}):\n"
+            f"    return separador.join([{expressao} for dados in lista_dados])\n"
+            f"def escrever_lote(lista_dados, escrever, separador, {parametros}):\n"
+            f"    primeiro = True\n"
+            f"    for dados in lista_dados:\n"
+            f"        if primeiro:\n"
+            f"            primeiro = False\n"
+            f"        else:\n"
+            f"            escrever(separador)\n"
+            f"        escrever({expressao}.encode('utf-8'))\n"
+        )
+        funcoes: dict = {}
+        exec(compile(fonte, f"<esquema {self.campos!r}>", "exec"), funcoes)
+        self._traduzir = funcoes["traduzir"]
+        self._traduzir_lote = funcoes["traduzir_lote"]
+        self._escrever_lote = funcoes["escrever_lote"]
+
+    def traduzir(self, dados: dict) -> str:
+        """Traduz uma mensagem. Campos ausentes aparecem como "None".
+
+        Args:
+            dados (dict): Os dados no formato novo.
+
+        Returns:
+            str: Os dados no formato legado.
+        """
+        return self._traduzir(dados)
+
+    def traduzir_lote(self, lista_dados: Iterable[dict], separador: str = "\n") -> str:
+        """Traduz várias mensagens e as une numa única string.
+
+        Args:
+            lista_dados (Iterable[dict]): As mensagens no formato novo.
+            separador (str, optional): Texto entre as mensagens. Defaults to "\\n".
+
+        Returns:
+            str: As mensagens traduzidas, unidas por `separador`.
+        """
+        return self._traduzir_lote(lista_dados, separador)
+
+    def escrever_lote(self, lista_dados: Iterable[dict], destino: Union[bytearray, io.BytesIO],
+                      separador: str = "\n") -> int:
+        """Escreve o lote traduzido, em UTF-8, num buffer reutilizável.
+
+        Cada mensagem é codificada e anexada ao buffer assim que é traduzida:
+        o lote inteiro nunca existe como `str` nem como `bytes` à parte, só no
+        destino. O chamador pode reaproveitar o mesmo `bytearray` (limpando-o
+        com `clear()`) ou `io.BytesIO` entre lotes, evitando alocar um buffer
+        novo a cada envio.
+
+        Args:
+            lista_dados (Iterable[dict]): As mensagens no formato novo.
+            destino (Union[bytearray, io.BytesIO]): O buffer que recebe os bytes.
+            separador (str, optional): Texto entre as mensagens. Defaults to "\\n".
+
+        Returns:
+            int: O número de bytes escritos.
+        """
+        escrever = destino.extend if isinstance(destino, bytearray) else destino.write
+        inicio = len(destino) if isinstance(destino, bytearray) else destino.tell()
+        self._escrever_lote(lista_dados, escrever, separador.encode("utf-8"))
+        fim = len(destino) if isinstance(destino, bytearray) else destino.tell()
+        return fim - inicio
+
+
+# Esquema usado pelo AdaptadorEnvio: "user:<usuario>;msg:<mensagem>".
+ESQUEMA_PADRAO = EsquemaTraducao([("user", "usuario"), ("msg", "mensagem")])
@@ -3,6 +3,10 @@
 
 """Implementação do Padrão de Projeto Adapter."""
 
+from typing import Iterable, Optional
+
+from .esquema import ESQUEMA_PADRAO, EsquemaTraducao
+
 
 class NovaAPIEnvio:
     """Define a interface moderna e esperada pelo cliente para envio de dados."""
@@ -34,13 +38,16 @@ class AdaptadorEnvio(NovaAPIEnvio):
     Este é o coração do padrão Adapter.
     """
 
-    def __init__(self, api_antiga: APIAntigaEnvio):
+    def __init__(self, api_antiga: APIAntigaEnvio, esquema: Optional[EsquemaTraducao] = None):
         """Inicializa o adaptador com uma instância da API antiga.
 
         Args:
             api_antiga (APIAntigaEnvio): A instância da API antiga.
+            esquema (Optional[EsquemaTraducao], optional): Como traduzir os
+                campos. Defaults to None (ESQUEMA_PADRAO, "user:...;msg:...").
         """
         self._api_antiga = api_antiga
+        self._esquema = esquema if esquema is not None else ESQUEMA_PADRAO
 
     def enviar_dados(self, dados: dict):
         """
@@ -50,6 +57,30 @@ class AdaptadorEnvio(NovaAPIEnvio):
             dados (dict): Os dados a serem enviados no formato novo.
         """
         print("(Adaptador) Recebeu dados no formato novo. Traduzindo para o formato antigo...")
-        # Lógica de tradução: converte o dicionário para uma string formatada.
-        dados_antigos = f"user:{dados.get('usuario')};msg:{dados.get('mensagem')}"
+        dados_antigos = self.traduzir(dados)
         self._api_antiga.enviar_dados_legado(dados_antigos)
+
+    def traduzir(self, dados: dict) -> str:
+        """Converte os dados do formato novo para a string esperada pela API antiga.
+
+        Args:
+            dados (dict): Os dados no formato novo.
+
+        Returns:
+            str: Os dados no formato legado.
+        """
+        # Lógica de tradução: o esquema compilado converte o dicionário para
+        # uma string formatada.
+        return self._esquema.traduzir(dados)
+
+    def traduzir_lote(self, lista_dados: Iterable[dict], separador: str = "\n") -> str:
+        """Traduz várias mensagens de uma vez, unindo-as com `separador`.
+
+        Args:
+            lista_dados (Iterable[dict]): As mensagens no formato novo.
+            separador (str, optional): Texto entre as mensagens. Defaults to "\\n".
+
+        Returns:
+            str: As mensagens no formato legado.
+        """
+        return self._esquema.traduzir_lote(lista_dados, separador)
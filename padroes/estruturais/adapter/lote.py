@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Adaptador que agrupa vários envios numa única chamada à API antiga."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+from .esquema import EsquemaTraducao
+from .implementacao import AdaptadorEnvio, APIAntigaEnvio
+
+MOTIVO_TAMANHO = "tamanho"
+MOTIVO_IDADE = "idade"
+MOTIVO_MANUAL = "manual"
+MOTIVO_FECHAMENTO = "fechamento"
+
+
+@dataclass(frozen=True)
+class MetricasLote:
+    """Métricas de um lote enviado à API antiga.
+
+    Attributes:
+        quantidade (int): Número de mensagens no lote.
+        tamanho_bytes (int): Tamanho, em bytes UTF-8, da carga enviada.
+        motivo (str): O que disparou o envio (tamanho, idade, manual ou fechamento).
+        idade (float): Segundos entre a primeira mensagem do lote e o envio.
+        duracao (float): Segundos gastos na chamada à API antiga.
+        erro (Optional[str]): A exceção levantada pela API antiga, se a
+            chamada falhou; nesse caso o lote voltou para o buffer.
+    """
+
+    quantidade: int
+    tamanho_bytes: int
+    motivo: str
+    idade: float
+    duracao: float
+    erro: Optional[str] = None
+
+
+class AdaptadorEnvioEmLote(AdaptadorEnvio):
+    """
+    Adaptador que traduz cada mensagem na hora, mas acumula as traduções e
+    as envia juntas, numa única chamada a `enviar_dados_legado`.
+
+    O lote é enviado quando atinge `tamanho_lote` mensagens, quando a
+    mensagem mais antiga completa `idade_maxima` segundos (um temporizador
+    cuida disso mesmo sem novos envios), em `flush()` ou na saída do bloco
+    `with`. As mensagens de um lote são unidas por `separador`.
+
+    Se a API antiga falhar, o lote volta para o início do buffer (nada se
+    perde), a falha fica registrada em `historico` e a exceção é relançada;
+    o temporizador é rearmado para tentar de novo. Quando quem falha é o
+    envio disparado pelo temporizador, numa thread à parte, a exceção é
+    guardada e relançada no próximo `enviar_dados` ou `fechar`.
+
+    `historico` guarda só as métricas dos últimos `limite_historico` lotes;
+    os totais de `chamadas_legado` e `mensagens_enviadas` são contadores.
+    """
+
+    def __init__(self, api_antiga: APIAntigaEnvio, tamanho_lote: int = 100,
+                 idade_maxima: Optional[float] = 1.0, separador: str = "\n",
+                 esquema: Optional[EsquemaTraducao] = None, limite_historico: int = 1000):
+        """Inicializa o adaptador em lote.
+
+        Args:
+            api_antiga (APIAntigaEnvio): A instância da API antiga.
+            tamanho_lote (int, optional): Mensagens por lote. Defaults to 100.
+            idade_maxima (Optional[float], optional): Segundos até um lote
+                incompleto ser enviado; None desativa o limite. Defaults to 1.0.
+            separador (str, optional): Texto entre as mensagens. Defaults to "\\n".
+            esquema (Optional[EsquemaTraducao], optional): Como traduzir os
+                campos. Defaults to None (ESQUEMA_PADRAO).
+            limite_historico (int, optional): Quantos lotes recentes manter
+                em `historico`. Defaults to 1000.
+
+        Raises:
+            ValueError: Se `tamanho_lote` for menor que 1.
+        """
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser pelo menos 1.")
+        super().__init__(api_antiga, esquema)
+        self.tamanho_lote = tamanho_lote
+        self.idade_maxima = idade_maxima
+        self.separador = separador
+        self.historico: Deque[MetricasLote] = deque(maxlen=limite_historico)
+        self._chamadas = 0
+        self._mensagens = 0
+        self._erro_temporizador: Optional[Exception] = None
+        self._pendentes: List[str] = []
+        self._inicio_lote = 0.0
+        self._temporizador: Optional[threading.Timer] = None
+        # _trava protege o buffer; _trava_envio mantém os lotes em ordem.
+        self._trava = threading.Lock()
+        self._trava_envio = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        self.fechar()
+        return False
+
+    @property
+    def chamadas_legado(self) -> int:
+        """int: Quantas chamadas foram feitas à API antiga."""
+        return self._chamadas
+
+    @property
+    def mensagens_enviadas(self) -> int:
+        """int: Quantas mensagens já foram entregues à API antiga."""
+        return self._mensagens
+
+    def enviar_dados(self, dados: dict):
+        """Traduz os dados e os coloca no lote atual.
+
+        Args:
+            dados (dict): Os dados a serem enviados no formato novo.
+
+        Raises:
+            Exception: O erro de um envio anterior disparado pelo temporizador;
+                nesse caso estes dados não entram no lote.
+        """
+        self._relancar_erro_temporizador()
+        traduzido = self.traduzir(dados)
+        with self._trava:
+            if not self._pendentes:
+                self._inicio_lote = time.monotonic()
+                self._armar_temporizador()
+            self._pendentes.append(traduzido)
+            cheio = len(self._pendentes) >= self.tamanho_lote
+        if cheio:
+            self.flush(MOTIVO_TAMANHO)
+
+    def flush(self, motivo: str = MOTIVO_MANUAL) -> Optional[MetricasLote]:
+        """Envia imediatamente o lote pendente, se houver.
+
+        Args:
+            motivo (str, optional): Registrado nas métricas. Defaults to "manual".
+
+        Returns:
+            Optional[MetricasLote]: As métricas do lote, ou None se estava vazio.
+
+        Raises:
+            Exception: O erro da API antiga, depois de devolver o lote ao buffer.
+        """
+        with self._trava_envio:
+            with self._trava:
+                lote, self._pendentes = self._pendentes, []
+                inicio = self._inicio_lote
+                if self._temporizador is not None:
+                    self._temporizador.cancel()
+                    self._temporizador = None
+            if not lote:
+                return None
+
+            carga = self.separador.join(lote)
+            comeco = time.monotonic()
+            self._chamadas += 1
+            try:
+                self._api_antiga.enviar_dados_legado(carga)
+            except Exception as erro:
+                self.historico.append(MetricasLote(len(lote), len(carga.encode("utf-8")), motivo,
+                                                   comeco - inicio, time.monotonic() - comeco,
+                                                   repr(erro)))
+                with self._trava:
+                    # Devolve o lote à frente das mensagens que chegaram nesse meio tempo.
+                    self._pendentes[:0] = lote
+                    self._inicio_lote = inicio
+                    if self._temporizador is None:
+                        self._armar_temporizador()
+                raise
+            fim = time.monotonic()
+            metricas = MetricasLote(len(lote), len(carga.encode("utf-8")), motivo,
+                                    comeco - inicio, fim - comeco)
+            self.historico.append(metricas)
+            self._mensagens += len(lote)
+            return metricas
+
+    def fechar(self) -> None:
+        """Envia o que estiver pendente e desarma o temporizador.
+
+        Raises:
+            Exception: O erro do envio, ou o de um envio anterior disparado
+                pelo temporizador que ainda não tinha sido relançado.
+        """
+        self.flush(MOTIVO_FECHAMENTO)
+        self._relancar_erro_temporizador()
+
+    def _flush_por_idade(self) -> None:
+        """Envio disparado pelo temporizador; guarda a exceção em vez de perdê-la."""
+        try:
+            self.flush(MOTIVO_IDADE)
+        except Exception as erro:
+            with self._trava:
+                self._erro_temporizador = erro
+
+    def _relancar_erro_temporizador(self) -> None:
+        """Relança, uma única vez, o erro guardado por `_flush_por_idade`."""
+        with self._trava:
+            erro, self._erro_temporizador = self._erro_temporizador, None
+        if erro is not None:
+            raise erro
+
+    def _armar_temporizador(self) -> None:
+        """Agenda o envio do lote por idade. Deve ser chamado com a trava."""
+        if self.idade_maxima is None:
+            return
+        self._temporizador = threading.Timer(self.idade_maxima, self._flush_por_idade)
+        self._temporizador.daemon = True
+        self._temporizador.start()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Adaptador que distribui os envios entre várias instâncias da API antiga."""
+
+import bisect
+import hashlib
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from .esquema import ESQUEMA_PADRAO, EsquemaTraducao
+from .implementacao import APIAntigaEnvio, NovaAPIEnvio
+
+MENOS_PENDENTES = "menos_pendentes"
+HASH_CONSISTENTE = "hash_consistente"
+
+
+class SemBackendDisponivel(RuntimeError):
+    """Nenhum backend do pool aceitou a mensagem; a última falha fica em __cause__."""
+
+
+class BackendLegado:
+    """Uma instância da API antiga e o seu estado de saúde dentro do pool."""
+
+    def __init__(self, nome: str, api: APIAntigaEnvio):
+        """Inicializa o backend.
+
+        Args:
+            nome (str): Identificação usada nos relatórios e no anel de hash.
+            api (APIAntigaEnvio): A instância da API antiga.
+        """
+        self.nome = nome
+        self.api = api
+        self.pendentes = 0
+        self.enviados = 0
+        self.falhas = 0
+        self.falhas_consecutivas = 0
+        self.latencia_media: Optional[float] = None
+        self.ejecoes = 0
+        self.ejetado_ate = 0.0
+
+    def disponivel(self, agora: float) -> bool:
+        """Indica se o backend pode receber chamadas."""
+        return agora >= self.ejetado_ate
+
+
+class PoolAdaptadores(NovaAPIEnvio):
+    """
+    Adapter que espalha `enviar_dados` por N instâncias da API antiga.
+
+    Roteamento:
+      - "menos_pendentes": escolhe o backend com menos chamadas em andamento
+        (empate decidido pela menor latência média).
+      - "hash_consistente": a chave da mensagem (por padrão, o usuário) é
+        mapeada num anel com réplicas virtuais; a mesma chave vai sempre para
+        o mesmo backend enquanto ele estiver saudável.
+
+    Saúde: cada backend mantém a latência média móvel exponencial e as falhas
+    consecutivas. Se passar de `limite_latencia` ou de `max_falhas`, ele é
+    ejetado por `tempo_ejecao` segundos e depois volta a receber tráfego com
+    uma latência presumida pessimista (o `limite_latencia`, ou a mediana dos
+    outros backends), para não ser o preferido antes de provar que melhorou.
+    Uma chamada que falha é repetida uma vez em cada outro backend disponível.
+    Se todos estiverem ejetados, o pool usa todos mesmo assim.
+    """
+
+    def __init__(self, apis: Sequence[APIAntigaEnvio], roteamento: str = MENOS_PENDENTES,
+                 chave: str = "usuario", limite_latencia: Optional[float] = None,
+                 max_falhas: int = 3, tempo_ejecao: float = 5.0, alfa: float = 0.2,
+                 replicas_virtuais: int = 100, esquema: Optional[EsquemaTraducao] = None):
+        """Inicializa o pool.
+
+        Args:
+            apis (Sequence[APIAntigaEnvio]): As instâncias da API antiga.
+            roteamento (str, optional): MENOS_PENDENTES ou HASH_CONSISTENTE.
+                Defaults to MENOS_PENDENTES.
+            chave (str, optional): Campo usado no hash consistente. Defaults to "usuario".
+            limite_latencia (Optional[float], optional): Latência média (s) que
+                causa ejeção; None desativa. Defaults to None.
+            max_falhas (int, optional): Falhas seguidas que causam ejeção. Defaults to 3.
+            tempo_ejecao (float, optional): Segundos fora do pool. Defaults to 5.0.
+            alfa (float, optional): Peso da amostra nova na média móvel. Defaults to 0.2.
+            replicas_virtuais (int, optional): Pontos por backend no anel. Defaults to 100.
+            esquema (Optional[EsquemaTraducao], optional): Como traduzir os
+                campos. Defaults to None (ESQUEMA_PADRAO).
+
+        Raises:
+            ValueError: Se não houver APIs ou o roteamento for desconhecido.
+        """
+        if not apis:
+            raise ValueError("O pool precisa de pelo menos uma API antiga.")
+        if roteamento not in (MENOS_PENDENTES, HASH_CONSISTENTE):
+            raise ValueError(f"Roteamento desconhecido: '{roteamento}'.")
+        self.backends = [BackendLegado(f"legado-{i}", api) for i, api in enumerate(apis)]
+        self.roteamento = roteamento
+        self.chave = chave
+        self.limite_latencia = limite_latencia
+        self.max_falhas = max_falhas
+        self.tempo_ejecao = tempo_ejecao
+        self.alfa = alfa
+        self._esquema = esquema if esquema is not None else ESQUEMA_PADRAO
+        self._trava = threading.Lock()
+
+        pontos = []
+        for backend in self.backends:
+            for replica in range(replicas_virtuais):
+                pontos.append((self._hash(f"{backend.nome}#{replica}"), backend))
+        pontos.sort(key=lambda ponto: ponto[0])
+        self._anel_hashes = [h for h, _ in pontos]
+        self._anel_backends = [b for _, b in pontos]
+
+    def enviar_dados(self, dados: dict):
+        """Traduz os dados e os envia pelo backend escolhido.
+
+        Args:
+            dados (dict): Os dados a serem enviados no formato novo.
+
+        Raises:
+            SemBackendDisponivel: Se nenhum backend aceitar a mensagem.
+        """
+        dados_antigos = self._esquema.traduzir(dados)
+        tentados = []
+        erro: Optional[Exception] = None
+        while True:
+            with self._trava:
+                backend = self._escolher(dados, tentados)
+                if backend is None:
+                    raise SemBackendDisponivel(
+                        f"Nenhum dos {len(self.backends)} backends aceitou a mensagem.") from erro
+                backend.pendentes += 1
+            inicio = time.perf_counter()
+            try:
+                backend.api.enviar_dados_legado(dados_antigos)
+            except Exception as falha:
+                erro = falha
+                self._registrar(backend, time.perf_counter() - inicio, sucesso=False)
+                tentados.append(backend)
+                continue
+            self._registrar(backend, time.perf_counter() - inicio, sucesso=True)
+            return
+
+    def estado(self) -> List[dict]:
+        """Retorna um retrato da saúde de cada backend.
+
+        Returns:
+            List[dict]: Nome, enviados, falhas, pendentes, latência média,
+                ejeções e se está disponível agora.
+        """
+        agora = time.monotonic()
+        with self._trava:
+            return [{
+                "nome": b.nome,
+                "enviados": b.enviados,
+                "falhas": b.falhas,
+                "pendentes": b.pendentes,
+                "latencia_media": b.latencia_media,
+                "ejecoes": b.ejecoes,
+                "disponivel": b.disponivel(agora),
+            } for b in self.backends]
+
+    @staticmethod
+    def _hash(texto: str) -> int:
+        """Hash estável entre processos (ao contrário de hash())."""
+        return int.from_bytes(hashlib.md5(texto.encode("utf-8")).digest()[:8], "big")
+
+    def _escolher(self, dados: dict, tentados: List[BackendLegado]) -> Optional[BackendLegado]:
+        """Escolhe o backend da próxima tentativa. Deve ser chamado com a trava."""
+        agora = time.monotonic()
+        candidatos = [b for b in self.backends if b not in tentados and b.disponivel(agora)]
+        if not candidatos and not tentados:
+            # Todos ejetados: melhor tentar do que recusar a mensagem.
+            candidatos = list(self.backends)
+        if not candidatos:
+            return None
+
+        if self.roteamento == MENOS_PENDENTES:
+            return min(candidatos, key=lambda b: (b.pendentes, b.latencia_media or 0.0))
+
+        posicao = bisect.bisect(self._anel_hashes, self._hash(str(dados.get(self.chave))))
+        total = len(self._anel_backends)
+        for passo in range(total):
+            backend = self._anel_backends[(posicao + passo) % total]
+            if backend in candidatos:
+                return backend
+        return None
+
+    def _registrar(self, backend: BackendLegado, duracao: float, sucesso: bool) -> None:
+        """Atualiza as estatísticas do backend e decide sobre a ejeção."""
+        with self._trava:
+            backend.pendentes -= 1
+            if backend.latencia_media is None:
+                backend.latencia_media = duracao
+            else:
+                backend.latencia_media += self.alfa * (duracao - backend.latencia_media)
+            if sucesso:
+                backend.enviados += 1
+                backend.falhas_consecutivas = 0
+            else:
+                backend.falhas += 1
+                backend.falhas_consecutivas += 1
+
+            lento = self.limite_latencia is not None and backend.latencia_media > self.limite_latencia
+            if lento or backend.falhas_consecutivas >= self.max_falhas:
+                backend.ejetado_ate = time.monotonic() + self.tempo_ejecao
+                backend.ejecoes += 1
+                # Ao voltar, o backend parte de uma latência pessimista, não de zero.
+                backend.latencia_media = self._latencia_de_retorno(backend)
+                backend.falhas_consecutivas = 0
+
+    def _latencia_de_retorno(self, ejetado: BackendLegado) -> Optional[float]:
+        """Latência presumida de um backend ejetado quando ele voltar ao pool."""
+        if self.limite_latencia is not None:
+            return self.limite_latencia
+        outras = [b.latencia_media for b in self.backends
+                  if b is not ejetado and b.latencia_media is not None]
+        if not outras:
+            return ejetado.latencia_media
+        return max(statistics.median(outras), ejetado.latencia_media or 0.0)
+
+
+class APIAntigaComLatencia(APIAntigaEnvio):
+    """API antiga simulada, silenciosa, que demora `latencia` segundos por chamada."""
+
+    def __init__(self, latencia: float):
+        """Inicializa o backend simulado.
+
+        Args:
+            latencia (float): Segundos por chamada.
+        """
+        self.latencia = latencia
+
+    def enviar_dados_legado(self, dados_antigos: str):
+        """Simula o envio bloqueando pela latência configurada.
+
+        Args:
+            dados_antigos (str): Os dados a serem enviados.
+        """
+        time.sleep(self.latencia)
+
+
+def benchmark(latencias: Sequence[float] = (0.001, 0.005, 0.05), mensagens: int = 2000,
+              produtores: int = 32, **opcoes_pool) -> dict:
+    """Mede o pool com backends simulados de latências diferentes.
+
+    Args:
+        latencias (Sequence[float], optional): Latência de cada backend.
+            Defaults to (0.001, 0.005, 0.05).
+        mensagens (int, optional): Total de mensagens enviadas. Defaults to 2000.
+        produtores (int, optional): Threads produzindo ao mesmo tempo. Defaults to 32.
+        **opcoes_pool: Repassadas para PoolAdaptadores.
+
+    Returns:
+        dict: Segundos, mensagens por segundo e o estado final dos backends.
+    """
+    pool = PoolAdaptadores([APIAntigaComLatencia(l) for l in latencias], **opcoes_pool)
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=produtores) as executor:
+        list(executor.map(pool.enviar_dados,
+                          ({"usuario": f"usuario{i % 500}", "mensagem": str(i)} for i in range(mensagens))))
+    duracao = time.perf_counter() - inicio
+    return {"segundos": duracao, "mensagens_por_segundo": mensagens / duracao,
+            "backends": pool.estado()}
+
+
+if __name__ == "__main__":
+    for roteamento, extras in ((MENOS_PENDENTES, {}),
+                               (MENOS_PENDENTES, {"limite_latencia": 0.02}),
+                               (HASH_CONSISTENTE, {}),
+                               (HASH_CONSISTENTE, {"limite_latencia": 0.02})):
+        resultado = benchmark(roteamento=roteamento, **extras)
+        print(f"\n{roteamento} {extras or ''}: {resultado['mensagens_por_segundo']:.0f} msg/s "
+              f"({resultado['segundos']:.2f}s)")
+        for backend in resultado["backends"]:
+            print(f"  {backend['nome']}: {backend['enviados']} enviados, "
+                  f"{backend['ejecoes']} ejeções")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Carregamento de uma árvore Composite a partir de um diretório real."""
+
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from .implementacao import Arquivo, Pasta
+
+
+# (nome, é pasta, tamanho em bytes, caminho completo)
+Entrada = Tuple[str, bool, int, str]
+
+
+def _listar(caminho: str) -> List[Entrada]:
+    """Lista um diretório com os.scandir, ignorando entradas inacessíveis.
+
+    Args:
+        caminho (str): O diretório a ser listado.
+
+    Returns:
+        List[Entrada]: As entradas do diretório, ordenadas por nome.
+    """
+    entradas = []
+    try:
+        with os.scandir(caminho) as iterador:
+            for entrada in iterador:
+                try:
+                    if entrada.is_dir(follow_symlinks=False):
+                        entradas.append((entrada.name, True, 0, entrada.path))
+                    else:
+                        tamanho = entrada.stat(follow_symlinks=False).st_size
+                        entradas.append((entrada.name, False, tamanho, entrada.path))
+                except OSError:
+                    continue
+    except OSError:
+        # Sem permissão ou removido durante a leitura: a pasta fica vazia.
+        return []
+    entradas.sort()
+    return entradas
+
+
+def _nome_raiz(caminho: str) -> str:
+    """Nome da pasta raiz para um caminho absoluto e normalizado.
+
+    A raiz do sistema de arquivos ("/" ou "C:\\") não tem nome próprio: usa
+    a letra da unidade, se houver, ou "raiz". Nomes nunca contêm o separador.
+    """
+    nome = os.path.basename(caminho)
+    if not nome:
+        nome = os.path.splitdrive(caminho)[0] or "raiz"
+    return nome.replace(Pasta.SEPARADOR, "_")
+
+
+def carregar_diretorio(caminho: str, max_trabalhadores: Optional[int] = None) -> Pasta:
+    """Monta uma árvore de Pasta/Arquivo espelhando um diretório do disco.
+
+    A listagem dos diretórios (chamadas de sistema que liberam o GIL) é feita
+    em paralelo por um pool de threads. A montagem da árvore acontece apenas
+    na thread chamadora, que consome os resultados de uma fila; assim
+    adicionar() e o índice de caminhos nunca são acessados concorrentemente.
+    Links simbólicos não são seguidos.
+
+    Args:
+        caminho (str): O diretório raiz a ser carregado.
+        max_trabalhadores (Optional[int], optional): Número de threads do pool.
+            Defaults to None (padrão do ThreadPoolExecutor).
+
+    Returns:
+        Pasta: A pasta raiz, com o mesmo nome do diretório ("raiz" para o
+            diretório raiz do sistema de arquivos).
+    """
+    caminho = os.path.normpath(os.path.abspath(caminho))
+    raiz = Pasta(_nome_raiz(caminho))
+    resultados: "queue.SimpleQueue[Tuple[Pasta, List[Entrada]]]" = queue.SimpleQueue()
+
+    def tarefa(pasta: Pasta, caminho_pasta: str) -> None:
+        entradas: List[Entrada] = []
+        try:
+            entradas = _listar(caminho_pasta)
+        finally:
+            # Sempre responde, para que o laço principal não espere para sempre.
+            resultados.put((pasta, entradas))
+
+    with ThreadPoolExecutor(max_workers=max_trabalhadores) as pool:
+        pendentes = 1
+        pool.submit(tarefa, raiz, caminho)
+        while pendentes:
+            pasta, entradas = resultados.get()
+            pendentes -= 1
+            for nome, eh_pasta, tamanho, caminho_filho in entradas:
+                if eh_pasta:
+                    subpasta = Pasta(nome)
+                    pasta.adicionar(subpasta)
+                    pool.submit(tarefa, subpasta, caminho_filho)
+                    pendentes += 1
+                else:
+                    pasta.adicionar(Arquivo(nome, tamanho))
+    return raiz
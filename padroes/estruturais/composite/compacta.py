@@ -0,0 +1,486 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Representação compacta, baseada em arrays, de árvores Composite.
+
+Cada `Arquivo`/`Pasta` comum é um objeto Python completo, com `__dict__` e,
+no caso das pastas, uma lista de filhos. Para hierarquias com milhões de nós
+isso custa centenas de bytes por nó. A `ArvoreCompacta` guarda os nós em
+arrays paralelos (pai, primeiro filho, último filho, próximo irmão, tipo,
+tamanho e posição do nome num buffer único de bytes), gastando algumas
+dezenas de bytes por nó.
+
+O cliente continua usando a interface `ComponenteSistemaArquivos`: as
+classes `VisaoArquivo` e `VisaoPasta` são objetos leves (dois campos, sem
+`__dict__`) criados sob demanda que leem e escrevem diretamente nos arrays.
+Para colocar um nó compacto numa `Pasta` comum, converta-o antes com
+`ArvoreCompacta.para_componente()`; `Pasta.adicionar` recusa visões.
+"""
+
+from array import array
+from typing import Iterator, Optional, Tuple
+
+from .implementacao import Arquivo, ComponenteSistemaArquivos, Pasta
+from .percurso import renderizar
+
+# Marcador de ausência nos arrays de índices.
+NENHUM = -1
+
+TIPO_ARQUIVO = 0
+TIPO_PASTA = 1
+
+
+class ArvoreCompacta:
+    """
+    Armazena uma árvore de arquivos e pastas em arrays paralelos.
+
+    O nó 0 é sempre a pasta raiz. Os filhos de uma pasta formam uma lista
+    encadeada (primeiro filho -> próximo irmão), o que permite adicionar em
+    O(1) sem listas por nó. Nós removidos deixam de ser alcançáveis a partir
+    da raiz, mas seus espaços nos arrays não são reaproveitados. Como em
+    `Pasta`, dois filhos da mesma pasta não podem ter o mesmo nome.
+
+    As colunas também podem ser buffers somente leitura (por exemplo,
+    memoryviews sobre um arquivo mapeado em memória); nesse caso elas só são
+    copiadas para arrays na primeira operação de escrita, e o recurso que as
+    sustenta é liberado logo em seguida. Enquanto isso não acontece, use
+    `fechar()` (ou um bloco `with`) para liberá-lo.
+    """
+
+    # (atributo, código de tipo do array) de cada coluna, na ordem de gravação.
+    COLUNAS = (
+        ("_pai", "i"),
+        ("_primeiro_filho", "i"),
+        ("_ultimo_filho", "i"),
+        ("_proximo_irmao", "i"),
+        ("_tipo", "B"),
+        ("_tamanho", "q"),
+        ("_nome_inicio", "I"),
+        ("_nome_tamanho", "I"),
+    )
+
+    def __init__(self, nome_raiz: str):
+        """Cria a árvore com uma pasta raiz.
+
+        Args:
+            nome_raiz (str): O nome da pasta raiz.
+        """
+        for atributo, codigo in self.COLUNAS:
+            setattr(self, atributo, array(codigo))
+        self._nomes = bytearray()
+        self._recurso = None
+        self._novo_no(NENHUM, nome_raiz, TIPO_PASTA, 0)
+
+    @classmethod
+    def de_colunas(cls, colunas: dict, nomes, recurso=None) -> "ArvoreCompacta":
+        """Cria a árvore diretamente a partir de colunas já preenchidas.
+
+        Args:
+            colunas (dict): Atributo -> sequência de inteiros (array ou memoryview).
+            nomes: O buffer de nomes em UTF-8 (bytearray, bytes ou memoryview).
+            recurso (optional): Objeto com `close()` que sustenta os buffers
+                (por exemplo, um mmap), fechado por `fechar()`. Defaults to None.
+
+        Returns:
+            ArvoreCompacta: A árvore que usa os buffers recebidos, sem cópia.
+        """
+        arvore = cls.__new__(cls)
+        for atributo, _ in cls.COLUNAS:
+            setattr(arvore, atributo, colunas[atributo])
+        arvore._nomes = nomes
+        arvore._recurso = recurso
+        return arvore
+
+    def __enter__(self) -> "ArvoreCompacta":
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        self.fechar()
+        return False
+
+    def fechar(self) -> None:
+        """Libera o recurso (ex.: o arquivo mapeado) que sustenta as colunas.
+
+        Se as colunas ainda forem buffers somente leitura, elas deixam de ser
+        utilizáveis: qualquer acesso posterior levanta ValueError. Uma árvore
+        que já foi modificada (e copiada para a memória) continua funcionando.
+        Chamar mais de uma vez não tem efeito.
+        """
+        recurso, self._recurso = self._recurso, None
+        if recurso is None:
+            return
+        for buffer in [getattr(self, atributo) for atributo, _ in self.COLUNAS] + [self._nomes]:
+            if isinstance(buffer, memoryview):
+                buffer.release()
+        recurso.close()
+
+    def __len__(self) -> int:
+        """Retorna o número de nós já alocados, incluindo os removidos."""
+        return len(self._tipo)
+
+    @property
+    def raiz(self) -> "VisaoPasta":
+        """VisaoPasta: A visão da pasta raiz."""
+        return VisaoPasta(self, 0)
+
+    @classmethod
+    def de_componente(cls, pasta: ComponenteSistemaArquivos) -> "ArvoreCompacta":
+        """Converte uma árvore de objetos (ou outra visão) para a forma compacta.
+
+        Args:
+            pasta (ComponenteSistemaArquivos): A pasta raiz a ser convertida.
+
+        Returns:
+            ArvoreCompacta: A nova árvore compacta.
+        """
+        arvore = cls(pasta.nome)
+        arvore._copiar_filhos(pasta, 0)
+        return arvore
+
+    def para_componente(self, indice: int = 0) -> ComponenteSistemaArquivos:
+        """Materializa o nó (e sua subárvore) como objetos Pasta/Arquivo.
+
+        Args:
+            indice (int, optional): O nó inicial. Defaults to 0 (raiz).
+
+        Returns:
+            ComponenteSistemaArquivos: A cópia em objetos comuns.
+        """
+        if self._tipo[indice] == TIPO_ARQUIVO:
+            return Arquivo(self.nome_de(indice), self._tamanho[indice])
+        raiz = Pasta(self.nome_de(indice))
+        pilha = [(indice, raiz)]
+        while pilha:
+            atual, pasta = pilha.pop()
+            for filho in self.filhos_de(atual):
+                if self._tipo[filho] == TIPO_PASTA:
+                    subpasta = Pasta(self.nome_de(filho))
+                    pasta.adicionar(subpasta)
+                    pilha.append((filho, subpasta))
+                else:
+                    pasta.adicionar(Arquivo(self.nome_de(filho), self._tamanho[filho]))
+        return raiz
+
+    def adicionar_no(self, pai: int, nome: str, eh_pasta: bool, tamanho: int = 0) -> int:
+        """Adiciona um nó como último filho de `pai`.
+
+        Args:
+            pai (int): O índice da pasta que receberá o nó.
+            nome (str): O nome do nó.
+            eh_pasta (bool): True para pasta, False para arquivo.
+            tamanho (int, optional): Tamanho em bytes (arquivos). Defaults to 0.
+
+        Returns:
+            int: O índice do novo nó.
+
+        Raises:
+            ValueError: Se `pai` não for uma pasta, se o nome contiver "/" ou
+                se `pai` já tiver um filho com esse nome.
+        """
+        if self._tipo[pai] != TIPO_PASTA:
+            raise ValueError(f"O nó '{self.nome_de(pai)}' não é uma pasta.")
+        if Pasta.SEPARADOR in nome:
+            raise ValueError(f"O nome '{nome}' não pode conter '{Pasta.SEPARADOR}'.")
+        if self._filho_chamado(pai, nome.encode("utf-8")) != NENHUM:
+            raise ValueError(f"Já existe um componente chamado '{nome}' em '{self.nome_de(pai)}'.")
+        self._garantir_gravavel()
+        return self._anexar_no(pai, nome, eh_pasta, tamanho)
+
+    def _anexar_no(self, pai: int, nome: str, eh_pasta: bool, tamanho: int) -> int:
+        """Acrescenta o nó ao fim da lista de filhos de `pai`, sem validar."""
+        indice = self._novo_no(pai, nome, TIPO_PASTA if eh_pasta else TIPO_ARQUIVO, tamanho)
+        ultimo = self._ultimo_filho[pai]
+        if ultimo == NENHUM:
+            self._primeiro_filho[pai] = indice
+        else:
+            self._proximo_irmao[ultimo] = indice
+        self._ultimo_filho[pai] = indice
+        return indice
+
+    def remover_no(self, pai: int, indice: int) -> None:
+        """Desliga o nó `indice` da lista de filhos de `pai`.
+
+        Args:
+            pai (int): O índice da pasta.
+            indice (int): O índice do filho a ser removido.
+
+        Raises:
+            ValueError: Se o nó não for filho de `pai`.
+        """
+        self._garantir_gravavel()
+        anterior = NENHUM
+        atual = self._primeiro_filho[pai]
+        while atual != NENHUM and atual != indice:
+            anterior = atual
+            atual = self._proximo_irmao[atual]
+        if atual == NENHUM:
+            raise ValueError(f"'{self.nome_de(indice)}' não é filho de '{self.nome_de(pai)}'.")
+
+        seguinte = self._proximo_irmao[indice]
+        if anterior == NENHUM:
+            self._primeiro_filho[pai] = seguinte
+        else:
+            self._proximo_irmao[anterior] = seguinte
+        if self._ultimo_filho[pai] == indice:
+            self._ultimo_filho[pai] = anterior
+        self._pai[indice] = NENHUM
+        self._proximo_irmao[indice] = NENHUM
+
+    def filhos_de(self, indice: int) -> Iterator[int]:
+        """Gera os índices dos filhos diretos de um nó."""
+        filho = self._primeiro_filho[indice]
+        while filho != NENHUM:
+            yield filho
+            filho = self._proximo_irmao[filho]
+
+    def _filho_chamado(self, pai: int, alvo: bytes) -> int:
+        """Retorna o filho de `pai` cujo nome em UTF-8 é `alvo`, ou NENHUM."""
+        nomes, inicios, tamanhos = self._nomes, self._nome_inicio, self._nome_tamanho
+        for filho in self.filhos_de(pai):
+            inicio = inicios[filho]
+            if tamanhos[filho] == len(alvo) and nomes[inicio:inicio + len(alvo)] == alvo:
+                return filho
+        return NENHUM
+
+    def nome_de(self, indice: int) -> str:
+        """Decodifica o nome de um nó a partir do buffer de nomes."""
+        inicio = self._nome_inicio[indice]
+        return str(self._nomes[inicio:inicio + self._nome_tamanho[indice]], "utf-8")
+
+    def visao(self, indice: int) -> ComponenteSistemaArquivos:
+        """Cria a visão adequada (arquivo ou pasta) para um nó."""
+        if self._tipo[indice] == TIPO_PASTA:
+            return VisaoPasta(self, indice)
+        return VisaoArquivo(self, indice)
+
+    def agregar(self, indice: int) -> Tuple[int, int, int, int]:
+        """Calcula (tamanho, arquivos, pastas, profundidade) da subárvore.
+
+        Ao contrário de `Pasta`, nada fica em cache: o cálculo percorre a
+        subárvore de forma iterativa a cada chamada.
+        """
+        if self._tipo[indice] == TIPO_ARQUIVO:
+            return self._tamanho[indice], 1, 0, 0
+        tamanho, arquivos, pastas, profundidade = 0, 0, 0, 0
+        tipo, tamanhos = self._tipo, self._tamanho
+        pilha = [(indice, 0)]
+        while pilha:
+            atual, nivel = pilha.pop()
+            if nivel > profundidade:
+                profundidade = nivel
+            if tipo[atual] == TIPO_ARQUIVO:
+                tamanho += tamanhos[atual]
+                arquivos += 1
+                continue
+            pastas += 1
+            filho = self._primeiro_filho[atual]
+            while filho != NENHUM:
+                pilha.append((filho, nivel + 1))
+                filho = self._proximo_irmao[filho]
+        return tamanho, arquivos, pastas, profundidade
+
+    def _garantir_gravavel(self) -> None:
+        """Copia para arrays as colunas que ainda forem buffers somente leitura."""
+        if isinstance(self._nomes, bytearray):
+            return
+        for atributo, codigo in self.COLUNAS:
+            coluna = array(codigo)
+            coluna.frombytes(memoryview(getattr(self, atributo)).cast("B"))
+            setattr(self, atributo, coluna)
+        nomes = bytearray(self._nomes)
+        # As cópias não dependem mais do recurso: o arquivo mapeado pode ser liberado.
+        self.fechar()
+        self._nomes = nomes
+
+    def _novo_no(self, pai: int, nome: str, tipo: int, tamanho: int) -> int:
+        """Acrescenta um nó isolado aos arrays e retorna seu índice."""
+        codificado = nome.encode("utf-8")
+        self._pai.append(pai)
+        self._primeiro_filho.append(NENHUM)
+        self._ultimo_filho.append(NENHUM)
+        self._proximo_irmao.append(NENHUM)
+        self._tipo.append(tipo)
+        self._tamanho.append(tamanho)
+        self._nome_inicio.append(len(self._nomes))
+        self._nome_tamanho.append(len(codificado))
+        self._nomes += codificado
+        return len(self._tipo) - 1
+
+    def _copiar_filhos(self, origem: ComponenteSistemaArquivos, destino: int) -> None:
+        """Copia os filhos de `origem` para baixo do nó `destino`, sem recursão.
+
+        Os nomes não são conferidos um a um: irmãos de uma pasta de origem já
+        têm nomes distintos e `destino` acabou de ser criado vazio.
+        """
+        self._garantir_gravavel()
+        pilha = [(origem, destino)]
+        while pilha:
+            pasta, indice = pilha.pop()
+            for filho in pasta.iterar_filhos():
+                nome = filho.nome
+                if Pasta.SEPARADOR in nome:
+                    raise ValueError(f"O nome '{nome}' não pode conter '{Pasta.SEPARADOR}'.")
+                if _eh_pasta(filho):
+                    novo = self._anexar_no(indice, nome, True, 0)
+                    pilha.append((filho, novo))
+                else:
+                    self._anexar_no(indice, nome, False, filho.get_tamanho())
+
+
+def _eh_pasta(componente: ComponenteSistemaArquivos) -> bool:
+    """Indica se o componente é uma pasta, em qualquer representação."""
+    return isinstance(componente, (Pasta, VisaoPasta))
+
+
+class _VisaoNo(ComponenteSistemaArquivos):
+    """Base das visões: referencia um nó de uma ArvoreCompacta pelo índice."""
+
+    __slots__ = ("_arvore", "_indice")
+
+    def __init__(self, arvore: ArvoreCompacta, indice: int):
+        """Inicializa a visão.
+
+        Args:
+            arvore (ArvoreCompacta): A árvore que contém o nó.
+            indice (int): O índice do nó.
+        """
+        self._arvore = arvore
+        self._indice = indice
+
+    def __eq__(self, outro):
+        return (isinstance(outro, _VisaoNo) and self._arvore is outro._arvore
+                and self._indice == outro._indice)
+
+    def __hash__(self):
+        return hash((id(self._arvore), self._indice))
+
+    @property
+    def nome(self) -> str:
+        """str: O nome do nó."""
+        return self._arvore.nome_de(self._indice)
+
+    def exibir(self, nivel: int = 0):
+        """Exibe o nó (e seus descendentes) com indentação.
+
+        Args:
+            nivel (int, optional): O nível de indentação. Defaults to 0.
+        """
+        renderizar(self, nivel_inicial=nivel)
+
+
+class VisaoArquivo(_VisaoNo):
+    """Visão de um arquivo (folha) armazenado numa ArvoreCompacta."""
+
+    __slots__ = ()
+
+    @property
+    def tamanho(self) -> int:
+        """int: O tamanho do arquivo em bytes."""
+        return self._arvore._tamanho[self._indice]
+
+    @tamanho.setter
+    def tamanho(self, valor: int) -> None:
+        self._arvore._garantir_gravavel()
+        self._arvore._tamanho[self._indice] = valor
+
+    def descrever(self) -> str:
+        """Retorna a linha que identifica o arquivo."""
+        return f"- [Arquivo] {self.nome}"
+
+    def get_tamanho(self) -> int:
+        """Retorna o tamanho do arquivo."""
+        return self._arvore._tamanho[self._indice]
+
+    def contar_arquivos(self) -> int:
+        """Um arquivo conta a si mesmo."""
+        return 1
+
+    def contar_pastas(self) -> int:
+        """Um arquivo não contém pastas."""
+        return 0
+
+    def get_profundidade(self) -> int:
+        """Uma folha tem altura zero."""
+        return 0
+
+
+class VisaoPasta(_VisaoNo):
+    """Visão de uma pasta (composto) armazenada numa ArvoreCompacta."""
+
+    __slots__ = ()
+
+    @property
+    def filhos(self) -> Tuple[ComponenteSistemaArquivos, ...]:
+        """Tuple[ComponenteSistemaArquivos, ...]: Visões dos filhos diretos."""
+        arvore = self._arvore
+        return tuple(arvore.visao(filho) for filho in arvore.filhos_de(self._indice))
+
+    def iterar_filhos(self) -> Iterator[ComponenteSistemaArquivos]:
+        """Gera as visões dos filhos diretos uma a uma, sem montar a tupla."""
+        arvore = self._arvore
+        return (arvore.visao(filho) for filho in arvore.filhos_de(self._indice))
+
+    def descrever(self) -> str:
+        """Retorna a linha que identifica a pasta."""
+        return f"+ [Pasta] {self.nome}/"
+
+    def adicionar(self, componente: ComponenteSistemaArquivos) -> None:
+        """Copia um componente (e sua subárvore) para dentro desta pasta.
+
+        Args:
+            componente (ComponenteSistemaArquivos): O componente a ser adicionado.
+        """
+        arvore = self._arvore
+        if _eh_pasta(componente):
+            novo = arvore.adicionar_no(self._indice, componente.nome, True)
+            arvore._copiar_filhos(componente, novo)
+        else:
+            arvore.adicionar_no(self._indice, componente.nome, False, componente.get_tamanho())
+
+    def remover(self, componente: ComponenteSistemaArquivos) -> None:
+        """Remove um filho desta pasta.
+
+        Args:
+            componente (ComponenteSistemaArquivos): A visão do filho a ser removido.
+
+        Raises:
+            ValueError: Se o componente não for filho desta pasta.
+        """
+        if not isinstance(componente, _VisaoNo) or componente._arvore is not self._arvore:
+            raise ValueError(f"'{componente.nome}' não é filho de '{self.nome}'.")
+        self._arvore.remover_no(self._indice, componente._indice)
+
+    def buscar(self, caminho: str) -> Optional[ComponenteSistemaArquivos]:
+        """Localiza um descendente pelo caminho relativo, nível a nível.
+
+        Args:
+            caminho (str): Caminho separado por "/".
+
+        Returns:
+            Optional[ComponenteSistemaArquivos]: A visão do nó ou None.
+        """
+        arvore = self._arvore
+        atual = self._indice
+        for parte in caminho.strip(Pasta.SEPARADOR).split(Pasta.SEPARADOR):
+            if not parte:
+                continue
+            atual = arvore._filho_chamado(atual, parte.encode("utf-8"))
+            if atual == NENHUM:
+                return None
+        return arvore.visao(atual)
+
+    def get_tamanho(self) -> int:
+        """Retorna a soma dos tamanhos da subárvore."""
+        return self._arvore.agregar(self._indice)[0]
+
+    def contar_arquivos(self) -> int:
+        """Retorna o total de arquivos da subárvore."""
+        return self._arvore.agregar(self._indice)[1]
+
+    def contar_pastas(self) -> int:
+        """Retorna o total de pastas da subárvore, incluindo esta."""
+        return self._arvore.agregar(self._indice)[2]
+
+    def get_profundidade(self) -> int:
+        """Retorna a altura da subárvore."""
+        return self._arvore.agregar(self._indice)[3]
@@ -23,10 +23,10 @@ def main():
     raiz.adicionar(fotos)
 
     # Criando arquivos (folhas)
-    arquivo_relatorio = Arquivo("relatorio_final.docx")
-    arquivo_tese = Arquivo("tese.pdf")
-    foto_ferias = Arquivo("ferias_2024.jpg")
-    foto_familia = Arquivo("familia.png")
+    arquivo_relatorio = Arquivo("relatorio_final.docx", tamanho=48_000)
+    arquivo_tese = Arquivo("tese.pdf", tamanho=2_300_000)
+    foto_ferias = Arquivo("ferias_2024.jpg", tamanho=3_100_000)
+    foto_familia = Arquivo("familia.png", tamanho=1_800_000)
 
     # Adicionando arquivos às pastas
     documentos.adicionar(arquivo_relatorio)
@@ -37,7 +37,7 @@ def main():
     # Criando uma sub-subpasta
     trabalhos_faculdade = Pasta("Faculdade")
     documentos.adicionar(trabalhos_faculdade)
-    trabalhos_faculdade.adicionar(Arquivo("eng_software_patterns.pdf"))
+    trabalhos_faculdade.adicionar(Arquivo("eng_software_patterns.pdf", tamanho=950_000))
 
     # O código cliente pode agora tratar toda a estrutura de forma uniforme.
     # Ele não precisa saber se está lidando com um arquivo ou uma pasta.
@@ -47,6 +47,22 @@ def main():
     print("\nExibindo a estrutura a partir de uma subpasta (Documentos):")
     documentos.exibir()
 
+    # Os agregados são calculados uma vez e ficam em cache em cada pasta.
+    print("\nResumo da raiz:")
+    print(f"  Arquivos: {raiz.contar_arquivos()}")
+    print(f"  Pastas: {raiz.contar_pastas()}")
+    print(f"  Tamanho total: {raiz.get_tamanho()} bytes")
+    print(f"  Profundidade: {raiz.get_profundidade()}")
+
+    # O índice de caminhos da raiz localiza qualquer nó sem percorrer a árvore.
+    tese = raiz.buscar("Documentos/tese.pdf")
+    print(f"\nBusca por 'Documentos/tese.pdf': {tese.nome} ({tese.get_tamanho()} bytes)")
+
+    # Remover um arquivo invalida apenas o caminho Fotos -> home.
+    fotos.remover(foto_familia)
+    print(f"\nApós remover '{foto_familia.nome}': {raiz.contar_arquivos()} arquivos, "
+          f"{raiz.get_tamanho()} bytes")
+
 
 if __name__ == "__main__":
     main()
@@ -4,7 +4,9 @@
 """Implementação do Padrão de Projeto Composite."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .percurso import renderizar
 
 
 class ComponenteSistemaArquivos(ABC):
@@ -14,6 +16,9 @@ class ComponenteSistemaArquivos(ABC):
     de composição de maneira uniforme.
     """
 
+    # Sem __dict__ na interface, para que implementações leves possam usar __slots__.
+    __slots__ = ()
+
     @abstractmethod
     def exibir(self, nivel: int = 0):
         """Método que será implementado por folhas e compostos para exibir a estrutura.
@@ -23,6 +28,74 @@ class ComponenteSistemaArquivos(ABC):
         """
         pass
 
+    @abstractmethod
+    def descrever(self) -> str:
+        """Retorna a linha que representa o componente, sem indentação.
+
+        Returns:
+            str: A descrição do componente.
+        """
+        pass
+
+    @property
+    def filhos(self) -> Tuple["ComponenteSistemaArquivos", ...]:
+        """Tuple[ComponenteSistemaArquivos, ...]: Os filhos diretos (vazio numa folha)."""
+        return ()
+
+    def iterar_filhos(self) -> Iterator["ComponenteSistemaArquivos"]:
+        """Itera sobre os filhos diretos sem montar uma tupla nova.
+
+        É o que os percursos usam; a árvore não deve ser alterada enquanto o
+        iterador estiver em uso.
+
+        Returns:
+            Iterator[ComponenteSistemaArquivos]: Os filhos, na ordem de inserção.
+        """
+        return iter(self.filhos)
+
+    @abstractmethod
+    def get_tamanho(self) -> int:
+        """Retorna o tamanho total, em bytes, do componente.
+
+        Returns:
+            int: O tamanho do arquivo ou a soma dos tamanhos da subárvore.
+        """
+        pass
+
+    @abstractmethod
+    def contar_arquivos(self) -> int:
+        """Retorna quantos arquivos existem no componente.
+
+        Returns:
+            int: 1 para um arquivo ou o total de arquivos da subárvore.
+        """
+        pass
+
+    @abstractmethod
+    def contar_pastas(self) -> int:
+        """Retorna quantas pastas existem no componente, incluindo ele mesmo.
+
+        Returns:
+            int: 0 para um arquivo ou o total de pastas da subárvore.
+        """
+        pass
+
+    @abstractmethod
+    def get_profundidade(self) -> int:
+        """Retorna a altura da subárvore a partir deste componente.
+
+        Returns:
+            int: 0 para um arquivo ou uma pasta vazia.
+        """
+        pass
+
+
+def _validar_nome(nome: str) -> str:
+    """Recusa nomes com o separador de caminhos, que quebrariam o índice."""
+    if Pasta.SEPARADOR in nome:
+        raise ValueError(f"O nome '{nome}' não pode conter '{Pasta.SEPARADOR}'.")
+    return nome
+
 
 class Arquivo(ComponenteSistemaArquivos):
     """
@@ -30,13 +103,62 @@ class Arquivo(ComponenteSistemaArquivos):
     Uma folha não pode ter filhos. Ela faz o trabalho real do sistema.
     """
 
-    def __init__(self, nome: str):
+    def __init__(self, nome: str, tamanho: int = 0):
         """Inicializa o arquivo com um nome.
 
         Args:
             nome (str): O nome do arquivo.
+            tamanho (int, optional): O tamanho do arquivo em bytes. Defaults to 0.
+
+        Raises:
+            ValueError: Se o nome contiver o separador "/".
         """
-        self.nome = nome
+        self._nome = _validar_nome(nome)
+        self._tamanho = tamanho
+        self._pai: Optional["Pasta"] = None
+
+    @property
+    def nome(self) -> str:
+        """str: O nome do arquivo; renomear atualiza o índice da árvore."""
+        return self._nome
+
+    @nome.setter
+    def nome(self, valor: str) -> None:
+        _validar_nome(valor)
+        if self._pai is not None:
+            self._pai._renomear(self, valor)
+        self._nome = valor
+
+    @property
+    def tamanho(self) -> int:
+        """int: O tamanho do arquivo em bytes."""
+        return self._tamanho
+
+    @tamanho.setter
+    def tamanho(self, valor: int) -> None:
+        self._tamanho = valor
+        if self._pai is not None:
+            self._pai._invalidar_agregados()
+
+    def get_tamanho(self) -> int:
+        """Retorna o tamanho do arquivo."""
+        return self._tamanho
+
+    def contar_arquivos(self) -> int:
+        """Um arquivo conta a si mesmo."""
+        return 1
+
+    def contar_pastas(self) -> int:
+        """Um arquivo não contém pastas."""
+        return 0
+
+    def get_profundidade(self) -> int:
+        """Uma folha tem altura zero."""
+        return 0
+
+    def descrever(self) -> str:
+        """Retorna a linha que identifica o arquivo."""
+        return f"- [Arquivo] {self.nome}"
 
     def exibir(self, nivel: int = 0):
         """Exibe o nome do arquivo com indentação para mostrar a hierarquia.
@@ -44,7 +166,7 @@ class Arquivo(ComponenteSistemaArquivos):
         Args:
             nivel (int, optional): O nível de indentação. Defaults to 0.
         """
-        print("  " * nivel + f"- [Arquivo] {self.nome}")
+        print("  " * nivel + self.descrever())
 
 
 class Pasta(ComponenteSistemaArquivos):
@@ -52,41 +174,266 @@ class Pasta(ComponenteSistemaArquivos):
     A classe Composto (Composite) representa os componentes complexos que podem
     ter filhos. Geralmente, os objetos Compostos delegam o trabalho real
     para seus filhos e, em seguida, "somam" o resultado.
+
+    Os agregados da subárvore (tamanho, arquivos, pastas e profundidade) ficam
+    em cache em cada pasta. Ao adicionar ou remover um filho, apenas o caminho
+    até a raiz é invalidado; a próxima consulta recalcula somente as pastas
+    invalidadas, e as seguintes custam O(1).
+
+    A pasta raiz da árvore mantém um índice caminho -> componente, atualizado
+    em adicionar()/remover() e ao renomear, para que buscar() responda em O(1).
+    Cada pasta guarda a raiz e o próprio caminho, recalculados para a subárvore
+    quando ela é anexada, removida ou renomeada, então buscar() não sobe a
+    árvore.
+
+    Como o caminho identifica cada componente, a pasta impõe duas regras que
+    a versão sem índice não tinha (ambas levantam ValueError):
+      - nomes não podem conter o separador "/" (na criação ou ao renomear);
+      - dois filhos da mesma pasta não podem ter o mesmo nome.
     """
 
+    SEPARADOR = "/"
+
     def __init__(self, nome: str):
         """Inicializa a pasta com um nome.
 
         Args:
             nome (str): O nome da pasta.
+
+        Raises:
+            ValueError: Se o nome contiver o separador "/".
         """
-        self.nome = nome
+        self._nome = _validar_nome(nome)
         self._filhos: List[ComponenteSistemaArquivos] = []
+        self._pai: Optional["Pasta"] = None
+        # A raiz da árvore e o caminho desta pasta com separador final ("" na raiz).
+        self._raiz: "Pasta" = self
+        self._prefixo = ""
+        # (tamanho, arquivos, pastas, profundidade) ou None se inválido
+        self._agregados: Optional[Tuple[int, int, int, int]] = None
+        # Caminho relativo -> componente; só é mantido enquanto a pasta é raiz.
+        self._indice: Optional[Dict[str, ComponenteSistemaArquivos]] = {}
+
+    @property
+    def nome(self) -> str:
+        """str: O nome da pasta; renomear atualiza o índice e os caminhos da subárvore."""
+        return self._nome
+
+    @nome.setter
+    def nome(self, valor: str) -> None:
+        _validar_nome(valor)
+        if self._pai is not None:
+            self._pai._renomear(self, valor)
+        self._nome = valor
 
     def adicionar(self, componente: ComponenteSistemaArquivos) -> None:
         """Adiciona um componente (arquivo ou outra pasta) a esta pasta.
 
         Args:
             componente (ComponenteSistemaArquivos): O componente a ser adicionado.
+
+        Raises:
+            TypeError: Se o componente não for um Arquivo ou uma Pasta (por
+                exemplo, uma visão de ArvoreCompacta).
+            ValueError: Se o componente já pertencer a outra pasta, se for
+                esta pasta ou um de seus ancestrais (o que criaria um ciclo),
+                ou se já existir um componente com o mesmo nome nesta pasta.
+                Nada é alterado quando a exceção é levantada.
         """
+        if not isinstance(componente, (Arquivo, Pasta)):
+            raise TypeError(f"Pasta só aceita Arquivo ou Pasta, não {type(componente).__name__}; "
+                            "use ArvoreCompacta.para_componente() para converter uma visão.")
+        if componente._pai is not None:
+            raise ValueError(f"'{componente.nome}' já pertence à pasta '{componente._pai.nome}'.")
+        raiz = self._raiz
+        if componente is raiz:
+            # Sem pai, o componente só pode ser ancestral desta pasta sendo a raiz dela.
+            raise ValueError(f"'{componente.nome}' é esta pasta ou um de seus ancestrais; "
+                             "adicioná-la criaria um ciclo.")
+        caminho = self._prefixo + componente.nome
+        if caminho in raiz._indice:
+            raise ValueError(f"Já existe um componente em '{caminho}'.")
+
         self._filhos.append(componente)
+        componente._pai = self
+        raiz._indice[caminho] = componente
+        if isinstance(componente, Pasta):
+            # A pasta adicionada deixa de ser raiz: seu índice é incorporado
+            # e a subárvore passa a apontar para a nova raiz.
+            prefixo = caminho + self.SEPARADOR
+            componente._raiz, componente._prefixo = raiz, prefixo
+            for relativo, descendente in componente._indice.items():
+                raiz._indice[prefixo + relativo] = descendente
+                if isinstance(descendente, Pasta):
+                    descendente._raiz = raiz
+                    descendente._prefixo = prefixo + relativo + self.SEPARADOR
+            componente._indice = None
+        self._invalidar_agregados()
 
     def remover(self, componente: ComponenteSistemaArquivos) -> None:
         """Remove um componente desta pasta.
 
+        O componente removido passa a ser a raiz de sua própria árvore.
+
         Args:
             componente (ComponenteSistemaArquivos): O componente a ser removido.
         """
         self._filhos.remove(componente)
+        raiz = self._raiz
+        caminho = self._prefixo + componente.nome
+        del raiz._indice[caminho]
+        if isinstance(componente, Pasta):
+            componente._indice = {}
+            componente._raiz, componente._prefixo = componente, ""
+            prefixo = caminho + self.SEPARADOR
+            for relativo, descendente in componente._percorrer_caminhos():
+                del raiz._indice[prefixo + relativo]
+                componente._indice[relativo] = descendente
+                if isinstance(descendente, Pasta):
+                    descendente._raiz = componente
+                    descendente._prefixo = relativo + self.SEPARADOR
+        componente._pai = None
+        self._invalidar_agregados()
+
+    @property
+    def caminho(self) -> str:
+        """str: O caminho desta pasta relativo à raiz da árvore ("" na raiz)."""
+        return self._prefixo[:-1]
+
+    def buscar(self, caminho: str) -> Optional[ComponenteSistemaArquivos]:
+        """Localiza um componente pelo caminho relativo a esta pasta.
+
+        Args:
+            caminho (str): Caminho separado por "/", por exemplo "Fotos/familia.png".
+
+        Returns:
+            Optional[ComponenteSistemaArquivos]: O componente ou None se não existir.
+        """
+        caminho = caminho.strip(self.SEPARADOR)
+        if not caminho:
+            return self
+        return self._raiz._indice.get(self._prefixo + caminho)
+
+    def _renomear(self, componente: ComponenteSistemaArquivos, novo: str) -> None:
+        """Move no índice o filho renomeado e, se for pasta, sua subárvore.
+
+        Raises:
+            ValueError: Se já existir um componente com o novo nome nesta pasta.
+        """
+        if novo == componente.nome:
+            return
+        raiz = self._raiz
+        antigo, caminho = self._prefixo + componente.nome, self._prefixo + novo
+        if caminho in raiz._indice:
+            raise ValueError(f"Já existe um componente em '{caminho}'.")
+        del raiz._indice[antigo]
+        raiz._indice[caminho] = componente
+        if isinstance(componente, Pasta):
+            prefixo_antigo, prefixo = antigo + self.SEPARADOR, caminho + self.SEPARADOR
+            componente._prefixo = prefixo
+            for relativo, descendente in componente._percorrer_caminhos():
+                del raiz._indice[prefixo_antigo + relativo]
+                raiz._indice[prefixo + relativo] = descendente
+                if isinstance(descendente, Pasta):
+                    descendente._prefixo = prefixo + relativo + self.SEPARADOR
+
+    def _percorrer_caminhos(self) -> Iterator[Tuple[str, ComponenteSistemaArquivos]]:
+        """Gera (caminho relativo, componente) para toda a subárvore, sem recursão."""
+        pilha = [("", self)]
+        while pilha:
+            prefixo, pasta = pilha.pop()
+            for filho in pasta._filhos:
+                caminho = prefixo + filho.nome
+                yield caminho, filho
+                if isinstance(filho, Pasta):
+                    pilha.append((caminho + self.SEPARADOR, filho))
+
+    def _invalidar_agregados(self) -> None:
+        """Invalida o cache desta pasta e de seus ancestrais.
+
+        Se uma pasta já está inválida, todos os seus ancestrais também estão,
+        então a subida pode parar nela.
+        """
+        pasta = self
+        while pasta is not None and pasta._agregados is not None:
+            pasta._agregados = None
+            pasta = pasta._pai
+
+    def _calcular_agregados(self) -> Tuple[int, int, int, int]:
+        """Recalcula as pastas inválidas da subárvore sem usar recursão.
+
+        Returns:
+            Tuple[int, int, int, int]: tamanho, arquivos, pastas e profundidade.
+        """
+        if self._agregados is not None:
+            return self._agregados
+
+        # Pós-ordem iterativa visitando apenas as pastas com cache inválido.
+        pilha = [(self, False)]
+        while pilha:
+            pasta, filhos_prontos = pilha.pop()
+            if not filhos_prontos:
+                pilha.append((pasta, True))
+                for filho in pasta._filhos:
+                    if isinstance(filho, Pasta) and filho._agregados is None:
+                        pilha.append((filho, False))
+                continue
+
+            tamanho, arquivos, pastas, profundidade = 0, 0, 1, 0
+            for filho in pasta._filhos:
+                if isinstance(filho, Pasta):
+                    t, a, p, h = filho._agregados
+                    tamanho += t
+                    arquivos += a
+                    pastas += p
+                    profundidade = max(profundidade, h + 1)
+                else:
+                    tamanho += filho.get_tamanho()
+                    arquivos += filho.contar_arquivos()
+                    pastas += filho.contar_pastas()
+                    profundidade = max(profundidade, filho.get_profundidade() + 1)
+            pasta._agregados = (tamanho, arquivos, pastas, profundidade)
+
+        return self._agregados
+
+    def get_tamanho(self) -> int:
+        """Retorna a soma dos tamanhos de todos os arquivos da subárvore."""
+        return self._calcular_agregados()[0]
+
+    def contar_arquivos(self) -> int:
+        """Retorna o total de arquivos da subárvore."""
+        return self._calcular_agregados()[1]
+
+    def contar_pastas(self) -> int:
+        """Retorna o total de pastas da subárvore, incluindo esta."""
+        return self._calcular_agregados()[2]
+
+    def get_profundidade(self) -> int:
+        """Retorna a altura da subárvore."""
+        return self._calcular_agregados()[3]
+
+    @property
+    def filhos(self) -> Tuple[ComponenteSistemaArquivos, ...]:
+        """Tuple[ComponenteSistemaArquivos, ...]: Os filhos diretos da pasta."""
+        return tuple(self._filhos)
+
+    def iterar_filhos(self) -> Iterator[ComponenteSistemaArquivos]:
+        """Itera diretamente sobre a lista interna de filhos, sem copiá-la."""
+        return iter(self._filhos)
+
+    def descrever(self) -> str:
+        """Retorna a linha que identifica a pasta."""
+        return f"+ [Pasta] {self.nome}/"
 
     def exibir(self, nivel: int = 0):
         """
-        Exibe a estrutura da pasta e, em seguida, chama recursivamente o método
-        exibir() de cada um de seus filhos. A recursão é a chave aqui.
+        Exibe a estrutura da pasta e de todos os seus descendentes.
+
+        Conceitualmente é a mesma recursão do Composite (cada filho se
+        descreve), mas o percurso usa uma pilha explícita e a saída é escrita
+        em blocos, o que suporta árvores muito profundas e muito largas.
 
         Args:
             nivel (int, optional): O nível de indentação. Defaults to 0.
         """
-        print("  " * nivel + f"+ [Pasta] {self.nome}/")
-        for filho in self._filhos:
-            filho.exibir(nivel + 1)
+        renderizar(self, nivel_inicial=nivel)
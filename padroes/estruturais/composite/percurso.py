@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Percurso iterativo e renderização em blocos de árvores Composite.
+
+Nenhuma função deste módulo usa recursão: a pilha (ou fila) é explícita,
+então árvores com milhares de níveis não esbarram no limite de recursão do
+Python. Qualquer objeto que exponha `filhos` e `descrever()` pode ser
+percorrido, inclusive representações alternativas da árvore; se ele também
+oferecer `iterar_filhos()`, os filhos são lidos sem cópia. A árvore não deve
+ser alterada durante um percurso.
+"""
+
+import sys
+from collections import deque
+from typing import Callable, Iterator, Optional, TextIO, Tuple
+
+PRE_ORDEM = "pre"
+POS_ORDEM = "pos"
+LARGURA = "largura"
+
+# Tamanho padrão, em caracteres, de cada bloco escrito pelo renderizador.
+TAMANHO_BLOCO = 64 * 1024
+
+# Marca o fim de um iterador de filhos.
+_FIM = object()
+
+
+def _iterar_filhos(no) -> Iterator:
+    """Usa `iterar_filhos()` quando o componente oferece, senão `filhos`."""
+    iterar = getattr(no, "iterar_filhos", None)
+    return iterar() if iterar is not None else iter(no.filhos)
+
+
+def percorrer(raiz, ordem: str = PRE_ORDEM, profundidade_maxima: Optional[int] = None,
+              filtro: Optional[Callable[[object], bool]] = None) -> Iterator[Tuple[int, object]]:
+    """Gera (nível, componente) para a árvore a partir de `raiz`.
+
+    Args:
+        raiz: O componente inicial (nível 0).
+        ordem (str, optional): PRE_ORDEM, POS_ORDEM ou LARGURA. Defaults to PRE_ORDEM.
+        profundidade_maxima (Optional[int], optional): Último nível visitado;
+            os filhos abaixo dele não são explorados. Defaults to None (sem limite).
+        filtro (Optional[Callable], optional): Predicado que decide quais
+            componentes são gerados. Não interrompe a descida aos filhos.
+            Defaults to None (todos).
+
+    Yields:
+        Tuple[int, object]: O nível do componente e o próprio componente.
+
+    Raises:
+        ValueError: Se a ordem não for conhecida.
+    """
+    if ordem == PRE_ORDEM:
+        # A pilha guarda (iterador dos filhos, nível deles): um item por nível
+        # aberto, então cresce com a profundidade e não com a largura.
+        if filtro is None or filtro(raiz):
+            yield 0, raiz
+        pilha = [(_iterar_filhos(raiz), 1)] if profundidade_maxima is None or profundidade_maxima > 0 else []
+        while pilha:
+            filhos, nivel = pilha[-1]
+            no = next(filhos, _FIM)
+            if no is _FIM:
+                pilha.pop()
+                continue
+            if filtro is None or filtro(no):
+                yield nivel, no
+            if profundidade_maxima is None or nivel < profundidade_maxima:
+                pilha.append((_iterar_filhos(no), nivel + 1))
+
+    elif ordem == POS_ORDEM:
+        # (componente, nível, iterador dos filhos ou None abaixo do limite)
+        pilha = [(raiz, 0, _iterar_filhos(raiz)
+                  if profundidade_maxima is None or profundidade_maxima > 0 else None)]
+        while pilha:
+            no, nivel, filhos = pilha[-1]
+            filho = _FIM if filhos is None else next(filhos, _FIM)
+            if filho is _FIM:
+                pilha.pop()
+                if filtro is None or filtro(no):
+                    yield nivel, no
+                continue
+            abaixo = profundidade_maxima is None or nivel + 1 < profundidade_maxima
+            pilha.append((filho, nivel + 1, _iterar_filhos(filho) if abaixo else None))
+
+    elif ordem == LARGURA:
+        fila = deque([(raiz, 0)])
+        while fila:
+            no, nivel = fila.popleft()
+            if filtro is None or filtro(no):
+                yield nivel, no
+            if profundidade_maxima is None or nivel < profundidade_maxima:
+                for filho in _iterar_filhos(no):
+                    fila.append((filho, nivel + 1))
+
+    else:
+        raise ValueError(f"Ordem de percurso desconhecida: '{ordem}'.")
+
+
+def renderizar(raiz, saida: Optional[TextIO] = None, nivel_inicial: int = 0,
+               tamanho_bloco: int = TAMANHO_BLOCO, **opcoes) -> int:
+    """Escreve a árvore indentada, acumulando as linhas em blocos grandes.
+
+    Em vez de um print() por componente, as linhas são agrupadas e cada bloco
+    de aproximadamente `tamanho_bloco` caracteres é enviado com uma única
+    chamada a `saida.write()`.
+
+    Args:
+        raiz: O componente inicial.
+        saida (Optional[TextIO], optional): Destino do texto. Defaults to sys.stdout.
+        nivel_inicial (int, optional): Indentação da raiz. Defaults to 0.
+        tamanho_bloco (int, optional): Caracteres por escrita. Defaults to TAMANHO_BLOCO.
+        **opcoes: Repassadas para percorrer() (ordem, profundidade_maxima, filtro).
+
+    Returns:
+        int: O número de componentes escritos.
+    """
+    if saida is None:
+        saida = sys.stdout
+    bloco = []
+    acumulado = 0
+    total = 0
+    for nivel, no in percorrer(raiz, **opcoes):
+        linha = "  " * (nivel_inicial + nivel) + no.descrever() + "\n"
+        bloco.append(linha)
+        acumulado += len(linha)
+        total += 1
+        if acumulado >= tamanho_bloco:
+            saida.write("".join(bloco))
+            bloco.clear()
+            acumulado = 0
+    if bloco:
+        saida.write("".join(bloco))
+    return total
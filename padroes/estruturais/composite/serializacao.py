@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Formato binário para árvores Composite, com carregamento preguiçoso via mmap.
+
+O arquivo é a própria `ArvoreCompacta` gravada em disco:
+
+    cabeçalho | tabela de nós (uma seção por coluna) | tabela de nomes
+
+A tabela de nós guarda, para cada nó, pai, primeiro/último filho, próximo
+irmão (os deslocamentos dos filhos), tipo, tamanho e a posição do nome na
+tabela de nomes. Cada seção começa alinhada em 8 bytes.
+
+`carregar()` apenas mapeia o arquivo e cria memoryviews sobre as seções: nada
+é lido ou convertido na abertura. As páginas de uma subárvore só são trazidas
+do disco quando ela é acessada pela primeira vez, então abrir uma árvore de
+milhões de nós leva milissegundos. O arquivo fica mapeado até a árvore ser
+fechada (`fechar()` ou o fim de um bloco `with`) ou modificada.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Union
+
+from .compacta import ArvoreCompacta
+from .implementacao import Pasta
+
+MAGICO = b"PADCOMP\x00"
+VERSAO = 2  # 2: tamanho dos nomes em 32 bits
+
+# mágico, versão, ordem dos bytes (0 = little, 1 = big), número de nós, bytes de nomes
+_CABECALHO = struct.Struct("<8sIIQQ")
+_ALINHAMENTO = 8
+
+
+def _alinhar(posicao: int) -> int:
+    """Arredonda a posição para o próximo múltiplo do alinhamento."""
+    return (posicao + _ALINHAMENTO - 1) // _ALINHAMENTO * _ALINHAMENTO
+
+
+def _ordem_local() -> int:
+    """Retorna o código da ordem de bytes desta máquina."""
+    return 0 if sys.byteorder == "little" else 1
+
+
+def salvar(arvore: Union[ArvoreCompacta, Pasta], caminho: str) -> None:
+    """Grava a árvore no formato binário.
+
+    Uma `Pasta` é convertida para `ArvoreCompacta` antes da gravação. Nós
+    removidos de uma árvore compacta também são gravados; para descartá-los,
+    grave `ArvoreCompacta.de_componente(arvore.raiz)`.
+
+    Args:
+        arvore (Union[ArvoreCompacta, Pasta]): A árvore a ser gravada.
+        caminho (str): O arquivo de destino.
+    """
+    if not isinstance(arvore, ArvoreCompacta):
+        arvore = ArvoreCompacta.de_componente(arvore)
+
+    with open(caminho, "wb") as arquivo:
+        nomes = bytes(arvore._nomes)
+        arquivo.write(_CABECALHO.pack(MAGICO, VERSAO, _ordem_local(), len(arvore), len(nomes)))
+        posicao = _CABECALHO.size
+        secoes = [memoryview(getattr(arvore, atributo)).cast("B")
+                  for atributo, _ in ArvoreCompacta.COLUNAS]
+        secoes.append(memoryview(nomes))
+        for secao in secoes:
+            inicio = _alinhar(posicao)
+            arquivo.write(b"\0" * (inicio - posicao))
+            arquivo.write(secao)
+            posicao = inicio + secao.nbytes
+
+
+def carregar(caminho: str) -> ArvoreCompacta:
+    """Abre uma árvore gravada por `salvar()` sem ler seu conteúdo.
+
+    A árvore devolvida lê diretamente do arquivo mapeado. Ela pode ser
+    modificada: na primeira escrita as colunas são copiadas para a memória
+    e o mapeamento é liberado (o arquivo em disco nunca é alterado). Feche a
+    árvore com `fechar()`, ou use-a num bloco `with`, quando terminar:
+
+        with carregar("arvore.bin") as arvore:
+            print(arvore.raiz.get_tamanho())
+
+    Args:
+        caminho (str): O arquivo a ser aberto.
+
+    Returns:
+        ArvoreCompacta: A árvore apoiada no arquivo mapeado.
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato esperado.
+    """
+    with open(caminho, "rb") as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _abrir(mapa, caminho)
+    except Exception:
+        mapa.close()
+        raise
+
+
+def _abrir(mapa: mmap.mmap, caminho: str) -> ArvoreCompacta:
+    """Valida o cabeçalho e cria a árvore sobre as seções do mapa."""
+    if len(mapa) < _CABECALHO.size:
+        raise ValueError(f"'{caminho}' é pequeno demais para conter uma árvore.")
+    magico, versao, ordem, total_nos, total_nomes = _CABECALHO.unpack_from(mapa)
+    if magico != MAGICO or versao != VERSAO:
+        raise ValueError(f"'{caminho}' não é uma árvore compacta na versão {VERSAO}.")
+    if ordem != _ordem_local():
+        raise ValueError(f"'{caminho}' foi gravado com outra ordem de bytes.")
+
+    secoes = []
+    posicao = _CABECALHO.size
+    for atributo, codigo in ArvoreCompacta.COLUNAS:
+        inicio = _alinhar(posicao)
+        posicao = inicio + total_nos * array(codigo).itemsize
+        secoes.append((atributo, codigo, inicio, posicao))
+    inicio_nomes = _alinhar(posicao)
+    if inicio_nomes + total_nomes > len(mapa):
+        raise ValueError(f"'{caminho}' está truncado.")
+
+    with memoryview(mapa) as buffer:
+        colunas = {atributo: buffer[inicio:fim].cast(codigo)
+                   for atributo, codigo, inicio, fim in secoes}
+        nomes = buffer[inicio_nomes:inicio_nomes + total_nomes]
+    return ArvoreCompacta.de_colunas(colunas, nomes, recurso=mapa)
@@ -1,4 +1,5 @@
 from .implementacao import CafeSimples, Leite, Acucar
+from .flyweight import FabricaCafe
 
 def main():
     """Função principal para demonstrar o uso do padrão Decorator."""
@@ -20,4 +21,12 @@ def main():
     cafe_com_acucar = Acucar(CafeSimples())
     print(f"Pedido: {cafe_com_acucar.get_descricao()} | Custo: R${cafe_com_acucar.get_custo():.2f}")
 
+    # Flyweight: pedidos iguais compartilham uma única instância pronta
+    fabrica = FabricaCafe()
+    pedidos = [fabrica.obter(Leite, Acucar) for _ in range(1000)]
+    mesmo_cafe = fabrica.canonizar(Acucar(Leite(CafeSimples())))
+    print(f"Pedido: {mesmo_cafe.get_descricao()} | Custo: R${mesmo_cafe.get_custo():.2f}")
+    print(f"{len(pedidos)} pedidos iguais, {len(fabrica)} instância(s) criada(s); "
+          f"mesma instância: {mesmo_cafe is pedidos[0]}")
+
     print("------------------------\n")
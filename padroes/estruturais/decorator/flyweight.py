@@ -0,0 +1,126 @@
+from typing import Dict, Tuple, Type
+
+from .implementacao import Cafe, CafeSimples, DecoradorCafe
+
+# (classe base, decorador aplicado primeiro, ..., decorador mais externo)
+Configuracao = Tuple[Type[Cafe], ...]
+
+
+class CafeConfigurado(Cafe):
+    """Café imutável e compartilhado (Flyweight) para uma configuração de adicionais.
+
+    Guarda apenas a configuração e os valores já calculados. Duas instâncias
+    são iguais (e têm o mesmo hash) quando têm a mesma configuração, na mesma
+    ordem.
+    """
+    __slots__ = ("_configuracao", "_custo", "_descricao")
+
+    def __init__(self, configuracao: Configuracao, custo: float, descricao: str):
+        """Inicializa o café configurado.
+
+        Args:
+            configuracao (Configuracao): A classe base seguida dos decoradores.
+            custo (float): O custo já calculado.
+            descricao (str): A descrição já montada.
+        """
+        object.__setattr__(self, "_configuracao", configuracao)
+        object.__setattr__(self, "_custo", custo)
+        object.__setattr__(self, "_descricao", descricao)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("CafeConfigurado é imutável.")
+
+    def __eq__(self, outro):
+        if not isinstance(outro, CafeConfigurado):
+            return NotImplemented
+        return self._configuracao == outro._configuracao
+
+    def __hash__(self):
+        return hash(self._configuracao)
+
+    def __repr__(self):
+        nomes = ", ".join(classe.__name__ for classe in self._configuracao)
+        return f"CafeConfigurado({nomes})"
+
+    @property
+    def configuracao(self) -> Configuracao:
+        """Configuracao: A classe base seguida dos decoradores, na ordem aplicada."""
+        return self._configuracao
+
+    def get_custo(self):
+        """Retorna o custo calculado na criação.
+
+        Returns:
+            float: O custo do café.
+        """
+        return self._custo
+
+    def get_descricao(self):
+        """Retorna a descrição montada na criação.
+
+        Returns:
+            str: A descrição do café.
+        """
+        return self._descricao
+
+
+class FabricaCafe:
+    """Fábrica Flyweight que devolve uma única instância por configuração.
+
+    A cadeia de decoradores é montada só na primeira vez que uma configuração
+    é pedida; os pedidos seguintes são uma consulta a um dicionário e não
+    alocam nada.
+    """
+
+    def __init__(self):
+        """Inicializa a fábrica com o cache vazio."""
+        self._cafes: Dict[Configuracao, CafeConfigurado] = {}
+
+    def __len__(self):
+        """Retorna quantas configurações distintas já foram criadas."""
+        return len(self._cafes)
+
+    def obter(self, *adicionais: Type[DecoradorCafe], base: Type[Cafe] = CafeSimples) -> CafeConfigurado:
+        """Retorna o café compartilhado para a combinação pedida.
+
+        Args:
+            *adicionais (Type[DecoradorCafe]): Os decoradores, do primeiro
+                aplicado ao mais externo. `obter(Leite, Acucar)` equivale a
+                `Acucar(Leite(CafeSimples()))`.
+            base (Type[Cafe], optional): O café base. Defaults to CafeSimples.
+
+        Returns:
+            CafeConfigurado: A instância compartilhada.
+        """
+        configuracao = (base,) + adicionais
+        cafe = self._cafes.get(configuracao)
+        if cafe is None:
+            montado = base()
+            for decorador in adicionais:
+                montado = decorador(montado)
+            novo = CafeConfigurado(configuracao, montado.get_custo(), montado.get_descricao())
+            # setdefault garante uma única instância mesmo com threads concorrentes.
+            cafe = self._cafes.setdefault(configuracao, novo)
+        return cafe
+
+    def canonizar(self, cafe: Cafe) -> CafeConfigurado:
+        """Troca uma cadeia de decoradores já montada pela instância compartilhada.
+
+        Args:
+            cafe (Cafe): Por exemplo, `Acucar(Leite(CafeSimples()))`. A base
+                da cadeia pode ser um CafeConfigurado, como em
+                `Acucar(fabrica.obter(Leite))`.
+
+        Returns:
+            CafeConfigurado: A instância compartilhada com a mesma configuração.
+        """
+        adicionais = []
+        while isinstance(cafe, DecoradorCafe):
+            adicionais.append(type(cafe))
+            cafe = cafe._cafe
+        adicionais.reverse()
+        if isinstance(cafe, CafeConfigurado):
+            # A base já é um flyweight: os decoradores dela vêm antes dos desembrulhados.
+            base, *anteriores = cafe.configuracao
+            return self.obter(*anteriores, *adicionais, base=base)
+        return self.obter(*adicionais, base=type(cafe))
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 # Componente Abstrato
 class Cafe(ABC):
     """Define a interface para os componentes de café."""
+    __slots__ = ()
+
     @abstractmethod
     def get_custo(self):
         """Retorna o custo do café."""
@@ -34,7 +36,41 @@ class CafeSimples(Cafe):
 
 # Decorador Abstrato
 class DecoradorCafe(Cafe, ABC):
-    """Decorador abstrato que envolve um componente de café."""
+    """Decorador abstrato que envolve um componente de café.
+
+    Cada decorador concreto declara o que acrescenta (`custo_adicional` e
+    `descricao_adicional`) e delega ao café envolvido o resto do cálculo.
+    A delegação acontece uma única vez: o custo acumulado é pedido ao café
+    envolvido na construção, e a descrição na primeira consulta, descendo a
+    cadeia com um laço (sem recursão e sem concatenações repetidas). Depois
+    disso get_custo()/get_descricao() custam O(1), mesmo em cadeias de
+    milhares de decoradores. Um decorador que sobrescreve get_descricao() é
+    respeitado: a descida para nele e usa o que ele devolver.
+
+    Os valores declarados ficam visíveis na classe, o que permite precificar
+    combinações em lote (veja `lote.py`) sem instanciar as cadeias.
+    """
+    custo_adicional = 0.0
+    descricao_adicional = ""
+
+    # Decoradores concretos, na ordem em que as classes foram definidas.
+    _registrados = []
+
+    def __init_subclass__(cls, **kwargs):
+        """Registra cada subclasse que declara seu próprio custo_adicional."""
+        super().__init_subclass__(**kwargs)
+        if "custo_adicional" in cls.__dict__:
+            DecoradorCafe._registrados.append(cls)
+
+    @classmethod
+    def registrados(cls):
+        """Retorna os decoradores concretos registrados.
+
+        Returns:
+            tuple: As classes, na ordem de definição.
+        """
+        return tuple(DecoradorCafe._registrados)
+
     def __init__(self, cafe: Cafe):
         """Inicializa o decorador com um componente de café.
 
@@ -42,51 +78,44 @@ class DecoradorCafe(Cafe, ABC):
             cafe (Cafe): O componente de café a ser decorado.
         """
         self._cafe = cafe
+        # O café envolvido já tem o próprio custo pronto: a soma é O(1).
+        self._custo = cafe.get_custo() + self.custo_adicional
+        self._descricao = None
 
-    @abstractmethod
     def get_custo(self):
-        """Método abstrato para obter o custo."""
-        pass
-
-    @abstractmethod
-    def get_descricao(self):
-        """Método abstrato para obter a descrição."""
-        pass
-
-# Decorador Concreto: Leite
-class Leite(DecoradorCafe):
-    """Decorador concreto que adiciona leite ao café."""
-    def get_custo(self):
-        """Retorna o custo do café com leite.
+        """Retorna o custo do café envolvido mais o adicional deste decorador.
 
         Returns:
-            float: O custo do café com leite.
+            float: O custo acumulado, calculado na construção.
         """
-        return self._cafe.get_custo() + 2.0
+        return self._custo
 
     def get_descricao(self):
-        """Retorna a descrição do café com leite.
+        """Retorna a descrição do café envolvido mais a deste decorador.
 
         Returns:
-            str: A descrição do café com leite.
+            str: A descrição acumulada, montada na primeira consulta.
         """
-        return self._cafe.get_descricao() + ", com Leite"
+        if self._descricao is None:
+            partes = []
+            atual = self
+            while (isinstance(atual, DecoradorCafe) and atual._descricao is None
+                   and type(atual).get_descricao is DecoradorCafe.get_descricao):
+                partes.append(atual.descricao_adicional)
+                atual = atual._cafe
+            # Café base, decorador já pronto ou que sobrescreve get_descricao.
+            partes.append(atual.get_descricao())
+            self._descricao = "".join(reversed(partes))
+        return self._descricao
+
+# Decorador Concreto: Leite
+class Leite(DecoradorCafe):
+    """Decorador concreto que adiciona leite ao café (R$ 2,00)."""
+    custo_adicional = 2.0
+    descricao_adicional = ", com Leite"
 
 # Decorador Concreto: Açúcar
 class Acucar(DecoradorCafe):
-    """Decorador concreto que adiciona açúcar ao café."""
-    def get_custo(self):
-        """Retorna o custo do café com açúcar.
-
-        Returns:
-            float: O custo do café com açúcar.
-        """
-        return self._cafe.get_custo() + 1.0
-
-    def get_descricao(self):
-        """Retorna a descrição do café com açúcar.
-
-        Returns:
-            str: A descrição do café com açúcar.
-        """
-        return self._cafe.get_descricao() + ", com Açúcar"
+    """Decorador concreto que adiciona açúcar ao café (R$ 1,00)."""
+    custo_adicional = 1.0
+    descricao_adicional = ", com Açúcar"
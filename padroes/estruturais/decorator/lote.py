@@ -0,0 +1,64 @@
+from typing import Optional, Sequence, Tuple, Type
+
+from .implementacao import Cafe, CafeSimples, DecoradorCafe
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele, usamos Python puro.
+    np = None
+
+
+def colunas_adicionais(adicionais: Optional[Sequence[Type[DecoradorCafe]]] = None
+                       ) -> Tuple[Tuple[Type[DecoradorCafe], ...], Tuple[float, ...]]:
+    """Retorna as colunas da matriz de pedidos e o vetor de preços correspondente.
+
+    Args:
+        adicionais (Optional[Sequence[Type[DecoradorCafe]]], optional): A ordem
+            das colunas. Defaults to None (todos os decoradores registrados).
+
+    Returns:
+        Tuple[tuple, tuple]: As classes de cada coluna e o custo de cada uma.
+    """
+    classes = tuple(adicionais) if adicionais is not None else DecoradorCafe.registrados()
+    return classes, tuple(classe.custo_adicional for classe in classes)
+
+
+def precificar_lote(quantidades, adicionais: Optional[Sequence[Type[DecoradorCafe]]] = None,
+                    base: Type[Cafe] = CafeSimples):
+    """Calcula o preço de muitos pedidos de uma só vez.
+
+    Cada linha de `quantidades` é um pedido e cada coluna a quantidade de um
+    adicional (por padrão, todos os decoradores registrados, na ordem de
+    definição: Leite, Açúcar, ...). O total de cada pedido é
+    `preço base + quantidades @ preços`. Com numpy isso é uma única operação
+    vetorizada; sem ele, o mesmo cálculo é feito linha a linha.
+
+    Args:
+        quantidades: Matriz pedidos x adicionais (array numpy ou sequência de sequências).
+        adicionais (Optional[Sequence[Type[DecoradorCafe]]], optional): A ordem
+            das colunas. Defaults to None (todos os registrados).
+        base (Type[Cafe], optional): O café base de todos os pedidos. Defaults to CafeSimples.
+
+    Returns:
+        O total de cada pedido: um array numpy, ou uma lista sem numpy.
+
+    Raises:
+        ValueError: Se o número de colunas não corresponder aos adicionais.
+    """
+    classes, precos = colunas_adicionais(adicionais)
+    preco_base = base().get_custo()
+
+    if np is not None:
+        matriz = np.asarray(quantidades, dtype=float)
+        if matriz.ndim != 2 or matriz.shape[1] != len(precos):
+            raise ValueError(f"Esperada uma matriz com {len(precos)} coluna(s): "
+                             f"{', '.join(c.__name__ for c in classes)}.")
+        return preco_base + matriz @ np.asarray(precos, dtype=float)
+
+    totais = []
+    for linha in quantidades:
+        if len(linha) != len(precos):
+            raise ValueError(f"Esperada uma matriz com {len(precos)} coluna(s): "
+                             f"{', '.join(c.__name__ for c in classes)}.")
+        totais.append(preco_base + sum(q * p for q, p in zip(linha, precos)))
+    return totais
@@ -16,4 +16,27 @@ def main():
     home_theater.assistir_filme("Design Patterns: O Filme")
     home_theater.parar_filme()
 
+    # Com aparelhos que demoram para aquecer, as etapas independentes rodam em
+    # paralelo: o filme começa após o caminho crítico, não após a soma.
+    lento = HomeTheaterFacade(Amplificador(0.2), DVDPlayer(0.3), Projetor(0.5))
+    relatorio = lento.assistir_filme("Design Patterns: O Retorno")
+    for etapa in relatorio.ordem:
+        inicio, fim = relatorio.tempos[etapa]
+        print(f"  {etapa}: {inicio:.2f}s -> {fim:.2f}s")
+    print(f"Tempo até o play: {relatorio.total:.2f}s "
+          f"(caminho crítico: {' -> '.join(relatorio.caminho_critico)})")
+    lento.parar_filme()
+
+    # Numa sessão, os aparelhos ficam ligados entre filmes e a fachada só
+    # envia os comandos que mudam o estado.
+    sessao = HomeTheaterFacade(Amplificador(), DVDPlayer(), Projetor())
+    with sessao.sessao():
+        sessao.assistir_filme("Padrões de Projeto I")
+        sessao.parar_filme()
+        for nivel in (12, 15, 14):
+            sessao.ajustar_volume(nivel)
+        sessao.assistir_filme("Padrões de Projeto II")
+    print(f"Comandos enviados: {sessao.comandos_enviados}, "
+          f"evitados: {sessao.comandos_evitados}")
+
     print("---------------------\n")
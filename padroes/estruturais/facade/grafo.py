@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Execução concorrente de etapas com dependências, usada pela fachada."""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Etapa:
+    """Um passo da operação e os passos que precisam terminar antes dele.
+
+    Attributes:
+        nome (str): Identificação única da etapa.
+        acao (Callable[[], object]): O que a etapa executa.
+        depende_de (Tuple[str, ...]): Nomes das etapas anteriores obrigatórias.
+    """
+
+    nome: str
+    acao: Callable[[], object]
+    depende_de: Tuple[str, ...] = ()
+
+
+@dataclass
+class RelatorioExecucao:
+    """Tempos de uma execução do grafo, em segundos desde o início.
+
+    Attributes:
+        tempos (Dict[str, Tuple[float, float]]): Início e fim de cada etapa.
+        total (float): Duração da execução inteira.
+        caminho_critico (List[str]): A cadeia de dependências que determinou o total.
+        ordem (List[str]): As etapas numa ordem topológica fixa (a de `validar`),
+            independente de qual thread terminou primeiro.
+        resultados (Dict[str, object]): O valor retornado pela ação de cada etapa.
+    """
+
+    tempos: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    total: float = 0.0
+    caminho_critico: List[str] = field(default_factory=list)
+    ordem: List[str] = field(default_factory=list)
+    resultados: Dict[str, object] = field(default_factory=dict)
+
+    def duracao(self, nome: str) -> float:
+        """Retorna quanto tempo a etapa `nome` levou."""
+        inicio, fim = self.tempos[nome]
+        return fim - inicio
+
+
+def validar(etapas: Sequence[Etapa]) -> List[Etapa]:
+    """Confere o grafo e devolve as etapas numa ordem topológica.
+
+    Args:
+        etapas (Sequence[Etapa]): As etapas a executar.
+
+    Returns:
+        List[Etapa]: As mesmas etapas, cada uma depois das suas dependências.
+
+    Raises:
+        ValueError: Para nomes repetidos, dependências desconhecidas ou ciclos.
+    """
+    por_nome = {}
+    for etapa in etapas:
+        if etapa.nome in por_nome:
+            raise ValueError(f"Etapa repetida: '{etapa.nome}'.")
+        por_nome[etapa.nome] = etapa
+    for etapa in etapas:
+        for dependencia in etapa.depende_de:
+            if dependencia not in por_nome:
+                raise ValueError(f"A etapa '{etapa.nome}' depende de '{dependencia}', que não existe.")
+
+    ordem, visitadas, em_andamento = [], set(), set()
+    for inicial in etapas:
+        if inicial.nome in visitadas:
+            continue
+        pilha = [(inicial, iter(inicial.depende_de))]
+        em_andamento.add(inicial.nome)
+        while pilha:
+            etapa, pendentes = pilha[-1]
+            proxima = next(pendentes, None)
+            if proxima is None:
+                pilha.pop()
+                em_andamento.discard(etapa.nome)
+                visitadas.add(etapa.nome)
+                ordem.append(etapa)
+            elif proxima in em_andamento:
+                raise ValueError(f"Ciclo de dependências envolvendo '{proxima}'.")
+            elif proxima not in visitadas:
+                em_andamento.add(proxima)
+                pilha.append((por_nome[proxima], iter(por_nome[proxima].depende_de)))
+    return ordem
+
+
+def executar(etapas: Sequence[Etapa], max_trabalhadores: Optional[int] = None) -> RelatorioExecucao:
+    """Executa as etapas, em paralelo sempre que as dependências permitirem.
+
+    Cada etapa é submetida a um pool de threads assim que todas as suas
+    dependências terminam, de modo que o tempo total é o do caminho crítico e
+    não a soma das etapas. Se uma etapa falhar, nenhuma etapa nova é iniciada;
+    as que já estão rodando terminam e a exceção é propagada.
+
+    Args:
+        etapas (Sequence[Etapa]): As etapas a executar.
+        max_trabalhadores (Optional[int], optional): Threads no pool. Defaults
+            to None (uma por etapa).
+
+    Returns:
+        RelatorioExecucao: Os tempos e resultados de cada etapa e o caminho crítico.
+
+    Raises:
+        ValueError: Se o grafo for inválido (veja `validar`).
+    """
+    ordem = validar(etapas)
+    relatorio = RelatorioExecucao(ordem=[etapa.nome for etapa in ordem])
+    if not ordem:
+        return relatorio
+
+    faltando = {etapa.nome: set(etapa.depende_de) for etapa in ordem}
+    dependentes: Dict[str, List[Etapa]] = {etapa.nome: [] for etapa in ordem}
+    for etapa in ordem:
+        for dependencia in etapa.depende_de:
+            dependentes[dependencia].append(etapa)
+    inicio = time.perf_counter()
+
+    def rodar(etapa: Etapa) -> Tuple[float, float, object]:
+        comeco = time.perf_counter() - inicio
+        resultado = etapa.acao()
+        return comeco, time.perf_counter() - inicio, resultado
+
+    with ThreadPoolExecutor(max_workers=max_trabalhadores or len(ordem)) as executor:
+        em_execucao = {executor.submit(rodar, etapa): etapa
+                       for etapa in ordem if not etapa.depende_de}
+        erro = None
+        while em_execucao:
+            prontas, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+            for futuro in prontas:
+                etapa = em_execucao.pop(futuro)
+                try:
+                    comeco, fim, resultado = futuro.result()
+                except Exception as falha:
+                    erro = erro or falha
+                    continue
+                relatorio.tempos[etapa.nome] = (comeco, fim)
+                relatorio.resultados[etapa.nome] = resultado
+                if erro is not None:
+                    continue
+                for dependente in dependentes[etapa.nome]:
+                    faltando[dependente.nome].discard(etapa.nome)
+                    if not faltando[dependente.nome]:
+                        em_execucao[executor.submit(rodar, dependente)] = dependente
+        if erro is not None:
+            raise erro
+
+    relatorio.total = time.perf_counter() - inicio
+    relatorio.caminho_critico = _caminho_critico(ordem, relatorio.tempos)
+    return relatorio
+
+
+def _caminho_critico(ordem: List[Etapa], tempos: Dict[str, Tuple[float, float]]) -> List[str]:
+    """Volta da etapa que terminou por último seguindo a dependência mais tardia."""
+    por_nome = {etapa.nome: etapa for etapa in ordem}
+    atual = max(ordem, key=lambda etapa: tempos[etapa.nome][1])
+    caminho = [atual.nome]
+    while atual.depende_de:
+        atual = por_nome[max(atual.depende_de, key=lambda nome: tempos[nome][1])]
+        caminho.append(atual.nome)
+    caminho.reverse()
+    return caminho
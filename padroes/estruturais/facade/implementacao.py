@@ -1,13 +1,54 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from .grafo import Etapa, RelatorioExecucao, executar
+
+# Mensagens dos aparelhos da etapa em execução nesta thread, se estiverem sendo coletadas.
+_saida_local = threading.local()
+
+
+def _anunciar(mensagem: str):
+    """Imprime a mensagem de um aparelho, ou a guarda se a etapa atual a coleta."""
+    linhas = getattr(_saida_local, "linhas", None)
+    if linhas is None:
+        print(mensagem)
+    else:
+        linhas.append(mensagem)
+
+
+def _coletando(acao):
+    """Envolve a ação de uma etapa para que ela retorne as mensagens que gerou."""
+    def executar_coletando():
+        _saida_local.linhas = []
+        try:
+            acao()
+            return _saida_local.linhas
+        finally:
+            _saida_local.linhas = None
+    return executar_coletando
+
 # Classes do subsistema complexo
 class Amplificador:
     """Representa um amplificador de áudio."""
+    def __init__(self, aquecimento: float = 0.0):
+        """Inicializa o amplificador.
+
+        Args:
+            aquecimento (float, optional): Segundos que o aparelho leva para
+                ligar. Defaults to 0.0.
+        """
+        self.aquecimento = aquecimento
+
     def ligar(self):
         """Liga o amplificador."""
-        print("Amplificador ligado.")
+        time.sleep(self.aquecimento)
+        _anunciar("Amplificador ligado.")
 
     def desligar(self):
         """Desliga o amplificador."""
-        print("Amplificador desligado.")
+        _anunciar("Amplificador desligado.")
 
     def ajustar_volume(self, nivel):
         """Ajusta o volume do amplificador.
@@ -15,17 +56,27 @@ class Amplificador:
         Args:
             nivel (int): O nível do volume.
         """
-        print(f"Volume do amplificador ajustado para {nivel}.")
+        _anunciar(f"Volume do amplificador ajustado para {nivel}.")
 
 class DVDPlayer:
     """Representa um DVD player."""
+    def __init__(self, aquecimento: float = 0.0):
+        """Inicializa o DVD player.
+
+        Args:
+            aquecimento (float, optional): Segundos que o aparelho leva para
+                ligar. Defaults to 0.0.
+        """
+        self.aquecimento = aquecimento
+
     def ligar(self):
         """Liga o DVD player."""
-        print("DVD Player ligado.")
+        time.sleep(self.aquecimento)
+        _anunciar("DVD Player ligado.")
 
     def desligar(self):
         """Desliga o DVD player."""
-        print("DVD Player desligado.")
+        _anunciar("DVD Player desligado.")
 
     def play(self, filme):
         """Reproduz um filme.
@@ -33,49 +84,274 @@ class DVDPlayer:
         Args:
             filme (str): O nome do filme.
         """
-        print(f'Reproduzindo filme: "{filme}".')
+        _anunciar(f'Reproduzindo filme: "{filme}".')
+
+    def parar(self):
+        """Interrompe a reprodução."""
+        _anunciar("Reprodução interrompida.")
 
 class Projetor:
     """Representa um projetor de vídeo."""
+    def __init__(self, aquecimento: float = 0.0):
+        """Inicializa o projetor.
+
+        Args:
+            aquecimento (float, optional): Segundos que o aparelho leva para
+                ligar. Defaults to 0.0.
+        """
+        self.aquecimento = aquecimento
+
     def ligar(self):
         """Liga o projetor."""
-        print("Projetor ligado.")
+        time.sleep(self.aquecimento)
+        _anunciar("Projetor ligado.")
 
     def desligar(self):
         """Desliga o projetor."""
-        print("Projetor desligado.")
+        _anunciar("Projetor desligado.")
 
 # Fachada: simplifica a operação de assistir a um filme
 class HomeTheaterFacade:
-    """Fachada para simplificar a interação com o sistema de home theater."""
-    def __init__(self, amp: Amplificador, dvd: DVDPlayer, proj: Projetor):
+    """
+    Fachada para simplificar a interação com o sistema de home theater.
+
+    A fachada guarda o último estado conhecido de cada aparelho (ligado ou
+    não, volume, filme em reprodução) e só envia os comandos que mudam algo:
+    ligar um aparelho já ligado ou repetir o volume atual é evitado.
+    Ajustes de volume pedidos à fachada são acumulados e só o último é
+    aplicado. Dentro de `sessao()`, `parar_filme` só interrompe o DVD player,
+    sem desligar os aparelhos, e filmes seguidos custam apenas o play. Os
+    contadores `comandos_enviados` e `comandos_evitados` mostram o efeito.
+
+    Cada aparelho tem a sua trava, mantida da consulta ao estado até o fim do
+    comando, para que duas threads não enviem o mesmo comando; aparelhos
+    diferentes continuam sendo acionados em paralelo. As mensagens dos
+    aparelhos são impressas só depois que todas as etapas terminam, na ordem
+    das dependências, e não na ordem em que as threads acabaram.
+    """
+    def __init__(self, amp: Amplificador, dvd: DVDPlayer, proj: Projetor,
+                 max_trabalhadores: Optional[int] = None, volume_padrao: int = 10):
         """Inicializa a fachada.
 
         Args:
             amp (Amplificador): O amplificador.
             dvd (DVDPlayer): O DVD player.
             proj (Projetor): O projetor.
+            max_trabalhadores (Optional[int], optional): Etapas simultâneas;
+                1 executa tudo em sequência. Defaults to None (sem limite).
+            volume_padrao (int, optional): Volume usado ao assistir, se nenhum
+                outro foi pedido. Defaults to 10.
         """
         self.amplificador = amp
         self.dvd_player = dvd
         self.projetor = proj
+        self.max_trabalhadores = max_trabalhadores
+        self.volume_padrao = volume_padrao
+        self.ultimo_relatorio: Optional[RelatorioExecucao] = None
+        self.comandos_enviados = 0
+        self.comandos_evitados = 0
+        # Os aparelhos começam desligados, sob controle exclusivo da fachada.
+        self._ligados = {"projetor": False, "amplificador": False, "dvd": False}
+        self._volume: Optional[int] = None
+        self._volume_pendente: Optional[int] = None
+        self._filme: Optional[str] = None
+        # Profundidade de sessões abertas; os aparelhos só desligam ao fechar a última.
+        self._sessoes = 0
+        self._trava = threading.Lock()
+        # Reentrantes: _volume_para_filme decide e envia o volume sob a mesma trava.
+        self._travas_aparelhos = {chave: threading.RLock() for chave in self._ligados}
+
+    @property
+    def estado(self) -> dict:
+        """dict: O estado conhecido dos aparelhos."""
+        with self._trava:
+            return dict(self._ligados, volume=self._volume, filme=self._filme)
+
+    def ajustar_volume(self, nivel):
+        """Pede um volume novo. Pedidos seguidos são agrupados num só comando,
+        aplicado por `aplicar_volume()` ou no próximo `assistir_filme`.
+
+        Args:
+            nivel (int): O nível do volume.
+        """
+        with self._trava:
+            self._volume_pendente = nivel
+
+    def aplicar_volume(self):
+        """Envia ao amplificador o último volume pedido, se ele estiver ligado."""
+        with self._travas_aparelhos["amplificador"]:
+            with self._trava:
+                if not self._ligados["amplificador"] or self._volume_pendente is None:
+                    return
+                nivel, self._volume_pendente = self._volume_pendente, None
+            self._definir_volume(nivel)
+
+    @contextmanager
+    def sessao(self):
+        """Mantém os aparelhos ligados entre filmes; desliga tudo ao sair.
+
+        Sessões podem ser aninhadas: ao sair de uma interna o filme é
+        interrompido, mas os aparelhos só desligam ao sair da mais externa.
+
+        Exemplo:
+            with fachada.sessao():
+                fachada.assistir_filme("A")
+                fachada.parar_filme()
+                fachada.assistir_filme("B")
+        """
+        with self._trava:
+            self._sessoes += 1
+        try:
+            yield self
+        finally:
+            with self._trava:
+                self._sessoes -= 1
+            self.parar_filme()
+
+    def etapas_assistir(self, filme):
+        """Descreve a preparação do filme como um grafo de etapas.
+
+        Os aparelhos ligam em paralelo; o volume espera o amplificador e o
+        filme só começa com todos prontos.
+
+        Args:
+            filme (str): O nome do filme.
+
+        Returns:
+            list: As etapas (grafo.Etapa) com as suas dependências.
+        """
+        return [
+            Etapa("ligar_projetor", lambda: self._ligar("projetor", self.projetor)),
+            Etapa("ligar_amplificador", lambda: self._ligar("amplificador", self.amplificador)),
+            Etapa("ajustar_volume", self._volume_para_filme, ("ligar_amplificador",)),
+            Etapa("ligar_dvd", lambda: self._ligar("dvd", self.dvd_player)),
+            Etapa("play", lambda: self._play(filme),
+                  ("ligar_dvd", "ligar_projetor", "ajustar_volume")),
+        ]
+
+    def etapas_parar(self):
+        """Descreve o desligamento: os aparelhos são independentes entre si.
+
+        Returns:
+            list: As etapas (grafo.Etapa) sem dependências.
+        """
+        return [
+            Etapa("desligar_dvd", lambda: self._desligar("dvd", self.dvd_player)),
+            Etapa("desligar_amplificador", lambda: self._desligar("amplificador", self.amplificador)),
+            Etapa("desligar_projetor", lambda: self._desligar("projetor", self.projetor)),
+        ]
 
     def assistir_filme(self, filme):
         """Liga o home theater e começa a assistir a um filme.
 
+        O tempo até o filme começar é o do caminho crítico do grafo, e não a
+        soma dos aquecimentos. Os tempos ficam em `ultimo_relatorio`.
+
         Args:
             filme (str): O nome do filme.
+
+        Returns:
+            RelatorioExecucao: Os tempos de cada etapa.
         """
         print("\nPreparando para assistir filme...")
-        self.projetor.ligar()
-        self.amplificador.ligar()
-        self.amplificador.ajustar_volume(10)
-        self.dvd_player.ligar()
-        self.dvd_player.play(filme)
+        return self._executar(self.etapas_assistir(filme))
 
     def parar_filme(self):
-        """Para o filme e desliga o home theater."""
+        """Para o filme e, fora de uma sessão, desliga o home theater.
+
+        Returns:
+            RelatorioExecucao: Os tempos de cada etapa.
+        """
         print("\nFinalizando a sessão de filme...")
-        self.dvd_player.desligar()
-        self.amplificador.desligar()
-        self.projetor.desligar()
+        with self._trava:
+            em_sessao = self._sessoes > 0
+        etapas = [Etapa("parar_dvd", self._parar)] if em_sessao else self.etapas_parar()
+        return self._executar(etapas)
+
+    def _executar(self, etapas):
+        """Executa o grafo e então imprime, na ordem das dependências, as
+        mensagens que os aparelhos de cada etapa geraram."""
+        relatorio = executar([Etapa(etapa.nome, _coletando(etapa.acao), etapa.depende_de)
+                              for etapa in etapas], self.max_trabalhadores)
+        for nome in relatorio.ordem:
+            for linha in relatorio.resultados[nome]:
+                print(linha)
+        self.ultimo_relatorio = relatorio
+        return relatorio
+
+    def _contar(self, enviado: bool) -> bool:
+        """Atualiza os contadores; retorna se o comando deve ser enviado."""
+        with self._trava:
+            if enviado:
+                self.comandos_enviados += 1
+            else:
+                self.comandos_evitados += 1
+        return enviado
+
+    def _ligar(self, chave: str, aparelho):
+        """Liga o aparelho, a menos que ele já esteja ligado."""
+        with self._travas_aparelhos[chave]:
+            with self._trava:
+                necessario = not self._ligados[chave]
+            if self._contar(necessario):
+                aparelho.ligar()
+                with self._trava:
+                    self._ligados[chave] = True
+
+    def _desligar(self, chave: str, aparelho):
+        """Desliga o aparelho, a menos que ele já esteja desligado."""
+        with self._travas_aparelhos[chave]:
+            with self._trava:
+                necessario = self._ligados[chave]
+            if self._contar(necessario):
+                aparelho.desligar()
+                with self._trava:
+                    self._ligados[chave] = False
+                    if chave == "amplificador":
+                        self._volume = None
+                    elif chave == "dvd":
+                        self._filme = None
+
+    def _definir_volume(self, nivel):
+        """Envia o volume, a menos que ele já seja o atual."""
+        with self._travas_aparelhos["amplificador"]:
+            with self._trava:
+                necessario = self._volume != nivel
+            if self._contar(necessario):
+                self.amplificador.ajustar_volume(nivel)
+                with self._trava:
+                    self._volume = nivel
+
+    def _volume_para_filme(self):
+        """Aplica o volume pendente, ou o padrão se nenhum foi aplicado ainda."""
+        with self._travas_aparelhos["amplificador"]:
+            with self._trava:
+                pendente, self._volume_pendente = self._volume_pendente, None
+                atual = self._volume
+            if pendente is not None:
+                self._definir_volume(pendente)
+            elif atual is None:
+                self._definir_volume(self.volume_padrao)
+            else:
+                # Já há um volume aplicado nesta sessão: nada a enviar.
+                self._contar(False)
+
+    def _play(self, filme):
+        """Reproduz o filme, a menos que ele já esteja em reprodução."""
+        with self._travas_aparelhos["dvd"]:
+            with self._trava:
+                necessario = self._filme != filme
+            if self._contar(necessario):
+                self.dvd_player.play(filme)
+                with self._trava:
+                    self._filme = filme
+
+    def _parar(self):
+        """Interrompe o filme no DVD player, se houver um em reprodução."""
+        with self._travas_aparelhos["dvd"]:
+            with self._trava:
+                necessario = self._filme is not None
+            if self._contar(necessario):
+                self.dvd_player.parar()
+                with self._trava:
+                    self._filme = None
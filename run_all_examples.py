@@ -1,51 +1,187 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""Script principal para executar todos os exemplos de Padrões de Projeto."""
+"""Script principal para executar todos os exemplos de Padrões de Projeto.
 
+Uso:
+    python run_all_examples.py                 # em sequência, no mesmo processo
+    python run_all_examples.py --paralelo      # cada exemplo em seu subprocesso
+    python run_all_examples.py --paralelo --timeout 10
+"""
+
+import argparse
 import importlib
+import json
 import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage, o pico de memória não é medido.
+    resource = None
+
+# Define a ordem de execução para uma apresentação lógica
+patterns_order = [
+    # Estruturais
+    'estruturais.adapter',
+    'estruturais.composite',
+    'estruturais.decorator',
+    'estruturais.facade',
+    # Comportamentais
+    'comportamentais.observer',
+    'comportamentais.strategy',
+]
+
+# Linha que o processo filho escreve no stderr com as suas métricas.
+METRICS_MARKER = "__METRICAS_EXEMPLO__"
+
+
+def run_example(pattern_path):
+    """Importa o módulo de exemplo do padrão e executa a sua função 'main'.
+
+    Args:
+        pattern_path (str): Caminho do padrão dentro de 'padroes', ex.: 'estruturais.adapter'.
+    """
+    module_name = f"padroes.{pattern_path}.exemplo"
+    example_module = importlib.import_module(module_name)
+    if hasattr(example_module, 'main'):
+        example_module.main()
+    else:
+        print(f"Aviso: O módulo {module_name} não possui uma função 'main'.")
 
 
 def run_all_examples():
     """Encontra e executa a função 'main' de cada arquivo 'exemplo.py' no projeto."""
-    
-    # Define a ordem de execução para uma apresentação lógica
-    patterns_order = [
-        # Estruturais
-        'estruturais.adapter',
-        'estruturais.composite',
-        'estruturais.decorator',
-        'estruturais.facade',
-        # Comportamentais
-        'comportamentais.observer',
-        'comportamentais.strategy',
-    ]
-
-    base_path = 'padroes'
-
     for pattern_path in patterns_order:
+        # Extrai o nome do padrão para o cabeçalho
+        pattern_name = pattern_path.split('.')[-1].upper()
         try:
-            module_name = f"padroes.{pattern_path}.exemplo"
-            
-            # Extrai o nome do padrão para o cabeçalho
-            pattern_name = pattern_path.split('.')[-1].upper()
-            
             print(f"\n{'='*15} Padrão {pattern_name} {'='*15}\n")
-            
-            # Importa o módulo dinamicamente
-            example_module = importlib.import_module(module_name)
-            
-            # Executa a função main() do módulo
-            if hasattr(example_module, 'main'):
-                example_module.main()
-            else:
-                print(f"Aviso: O módulo {module_name} não possui uma função 'main'.")
-
+            run_example(pattern_path)
         except ImportError as e:
-            print(f"Erro ao importar o módulo {module_name}: {e}")
+            print(f"Erro ao importar o módulo padroes.{pattern_path}.exemplo: {e}")
         except Exception as e:
             print(f"Ocorreu um erro ao executar o exemplo para {pattern_name}: {e}")
 
+
+def _run_child(pattern_path):
+    """Modo filho: executa um exemplo e informa CPU e pico de memória no stderr.
+
+    Args:
+        pattern_path (str): O padrão a executar.
+
+    Returns:
+        int: O código de saída do processo.
+    """
+    status = 0
+    try:
+        run_example(pattern_path)
+    except Exception as e:
+        print(f"Ocorreu um erro ao executar o exemplo: {e!r}", file=sys.stderr)
+        status = 1
+    sys.stdout.flush()
+    metrics = {"cpu": time.process_time(), "rss_kb": None}
+    if resource is not None:
+        uso = resource.getrusage(resource.RUSAGE_SELF)
+        # ru_maxrss é em KiB no Linux e em bytes no macOS.
+        metrics["rss_kb"] = uso.ru_maxrss // 1024 if sys.platform == "darwin" else uso.ru_maxrss
+    print(METRICS_MARKER + json.dumps(metrics), file=sys.stderr)
+    return status
+
+
+def _run_isolated(pattern_path, timeout):
+    """Executa um exemplo num subprocesso e coleta saída, tempos e memória.
+
+    Args:
+        pattern_path (str): O padrão a executar.
+        timeout (float): Segundos até o subprocesso ser interrompido.
+
+    Returns:
+        dict: Status, tempo de parede, CPU, pico de RSS, stdout e stderr.
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--filho", pattern_path]
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    except subprocess.TimeoutExpired as e:
+        return {"pattern": pattern_path, "status": "timeout", "wall": time.perf_counter() - start,
+                "cpu": None, "rss_kb": None, "stdout": _text(e.stdout), "stderr": _text(e.stderr)}
+    wall = time.perf_counter() - start
+
+    metrics, stderr_lines = {"cpu": None, "rss_kb": None}, []
+    for line in completed.stderr.splitlines():
+        if line.startswith(METRICS_MARKER):
+            metrics = json.loads(line[len(METRICS_MARKER):])
+        else:
+            stderr_lines.append(line)
+    return {"pattern": pattern_path, "status": "ok" if completed.returncode == 0 else "erro",
+            "wall": wall, "cpu": metrics["cpu"], "rss_kb": metrics["rss_kb"],
+            "stdout": completed.stdout, "stderr": "\n".join(stderr_lines)}
+
+
+def _text(output):
+    """Normaliza a saída parcial de um TimeoutExpired (bytes, str ou None)."""
+    if output is None:
+        return ""
+    return output.decode(errors="replace") if isinstance(output, bytes) else output
+
+
+def run_all_examples_parallel(timeout=30.0, workers=None):
+    """Executa todos os exemplos em paralelo, cada um em seu próprio subprocesso.
+
+    Uma falha ou lentidão num exemplo não afeta os outros. As saídas são
+    impressas na ordem de apresentação, seguidas de uma tabela com tempo de
+    parede, tempo de CPU e pico de memória (RSS) de cada exemplo.
+
+    Args:
+        timeout (float, optional): Limite, em segundos, por exemplo. Defaults to 30.0.
+        workers (int, optional): Subprocessos simultâneos. Defaults to None (todos).
+
+    Returns:
+        bool: True se todos os exemplos terminaram com sucesso.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or len(patterns_order)) as executor:
+        results = list(executor.map(lambda path: _run_isolated(path, timeout), patterns_order))
+    total = time.perf_counter() - start
+
+    for result in results:
+        pattern_name = result["pattern"].split('.')[-1].upper()
+        print(f"\n{'='*15} Padrão {pattern_name} {'='*15}\n")
+        print(result["stdout"], end="")
+        if result["stderr"]:
+            print(result["stderr"])
+        if result["status"] == "timeout":
+            print(f"Tempo esgotado após {timeout:.1f}s.")
+
+    print(f"\n{'Padrão':<28}{'Status':<9}{'Parede (s)':>11}{'CPU (s)':>10}{'RSS pico (MB)':>15}")
+    for result in results:
+        cpu = f"{result['cpu']:.3f}" if result["cpu"] is not None else "-"
+        rss = f"{result['rss_kb'] / 1024:.1f}" if result["rss_kb"] is not None else "-"
+        print(f"{result['pattern']:<28}{result['status']:<9}{result['wall']:>11.3f}{cpu:>10}{rss:>15}")
+    print(f"\nTempo total: {total:.3f}s (soma dos exemplos: "
+          f"{sum(r['wall'] for r in results):.3f}s)")
+    return all(result["status"] == "ok" for result in results)
+
+
 if __name__ == "__main__":
-    run_all_examples()
+    parser = argparse.ArgumentParser(description="Executa os exemplos de Padrões de Projeto.")
+    parser.add_argument("--paralelo", action="store_true",
+                        help="executa cada exemplo em um subprocesso, em paralelo")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="limite em segundos por exemplo no modo paralelo (padrão: 30)")
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="subprocessos simultâneos no modo paralelo (padrão: todos)")
+    parser.add_argument("--filho", metavar="PADRAO", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        sys.exit(_run_child(args.filho))
+    elif args.paralelo:
+        sys.exit(0 if run_all_examples_parallel(args.timeout, args.trabalhadores) else 1)
+    else:
+        run_all_examples()
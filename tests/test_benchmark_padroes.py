@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmark_padroes import comparar, mann_whitney
+
+
+# Valores de referência calculados à parte pela aproximação normal, com
+# correção de empates e de continuidade: o mesmo método de
+# scipy.stats.mannwhitneyu(a, b, method="asymptotic").
+# Ex.: 6 x 6 intercalados -> U = 15, z = (|15 - 18| - 0.5) / sqrt(39).
+@pytest.mark.parametrize("a, b, u, p", [
+    (list(range(1, 9)), list(range(9, 17)), 0.0, 0.000939106),
+    (list(range(9, 17)), list(range(1, 9)), 64.0, 0.000939106),
+    ([1, 2, 2, 3], [2, 3, 3, 4], 3.0, 0.172034),  # com empates
+    ([1, 3, 5, 7, 9, 11], [2, 4, 6, 8, 10, 12], 15.0, 0.688921),
+])
+def test_mann_whitney_valores_conhecidos(a, b, u, p):
+    estatistica, valor_p = mann_whitney(a, b)
+    assert estatistica == u
+    assert valor_p == pytest.approx(p, rel=1e-5)
+    assert mann_whitney(b, a) == (len(a) * len(b) - u, pytest.approx(valor_p))
+
+
+def test_mann_whitney_amostras_identicas():
+    assert mann_whitney([5.0] * 8, [5.0] * 8) == (32.0, 1.0)
+    assert mann_whitney([1, 2, 3, 4], [1, 2, 3, 4])[1] == 1.0
+
+
+def _documento(**cenarios):
+    return {"resultados": {
+        chave: {"amostras": amostras, "mediana": sorted(amostras)[len(amostras) // 2]}
+        for chave, amostras in cenarios.items()
+    }}
+
+
+def test_comparar_vereditos():
+    base = [1.00 + i / 1000 for i in range(10)]
+    atual = _documento(
+        igual=list(base),
+        lento=[2 * valor for valor in base],
+        rapido=[valor / 2 for valor in base],
+        pouco_mais_lento=[valor + 0.02 for valor in base],  # significativo, mas 2%
+        so_no_atual=list(base),
+    )
+    anterior = _documento(igual=base, lento=base, rapido=base, pouco_mais_lento=base)
+
+    linhas = {chave: (razao, p, veredito) for chave, razao, p, veredito in comparar(atual, anterior)}
+
+    assert set(linhas) == {"igual", "lento", "rapido", "pouco_mais_lento"}
+    assert linhas["igual"] == (1.0, 1.0, "sem diferença")
+    assert linhas["lento"][0] == pytest.approx(2.0, rel=1e-3)
+    assert linhas["lento"][1:] == (pytest.approx(0.000183, rel=1e-2), "mais lento")
+    assert linhas["rapido"][2] == "mais rápido"
+    assert linhas["pouco_mais_lento"][1] < 0.01
+    assert linhas["pouco_mais_lento"][2] == "sem diferença"
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from composite import Arquivo, Pasta
+
+
+def _arvore():
+    raiz = Pasta("raiz")
+    fotos = Pasta("Fotos")
+    ferias = Pasta("Ferias")
+    raiz.adicionar(fotos)
+    fotos.adicionar(ferias)
+    ferias.adicionar(Arquivo("praia.png", 300))
+    raiz.adicionar(Arquivo("notas.txt", 20))
+    return raiz, fotos, ferias
+
+
+def test_agregados_da_subarvore():
+    raiz, fotos, ferias = _arvore()
+    assert (raiz.get_tamanho(), raiz.contar_arquivos()) == (320, 2)
+    assert (raiz.contar_pastas(), raiz.get_profundidade()) == (3, 3)
+    assert (fotos.contar_pastas(), fotos.get_profundidade()) == (2, 2)
+    assert (Pasta("vazia").contar_pastas(), Pasta("vazia").get_profundidade()) == (1, 0)
+
+
+def test_resumo_fica_em_cache(monkeypatch):
+    raiz, _, ferias = _arvore()
+    raiz.get_tamanho()
+    praia = ferias.componentes[0]
+    monkeypatch.setattr(Arquivo, "get_tamanho", lambda self: pytest.fail("recalculou"))
+    assert raiz.get_tamanho() == 320
+    assert praia.tamanho == 300
+
+
+def test_mudanca_em_descendente_invalida_os_ancestrais():
+    raiz, fotos, ferias = _arvore()
+    assert raiz.get_tamanho() == 320
+    praia = ferias.componentes[0]
+
+    praia.tamanho = 500
+    assert (raiz.get_tamanho(), fotos.get_tamanho()) == (520, 500)
+
+    ferias.adicionar(Pasta("Dia1"))
+    ferias.componentes[-1].adicionar(Arquivo("sol.png", 5))
+    assert (raiz.get_tamanho(), raiz.contar_arquivos()) == (525, 3)
+    assert (raiz.contar_pastas(), raiz.get_profundidade()) == (4, 4)
+
+    fotos.remover(ferias)
+    assert (raiz.get_tamanho(), raiz.contar_pastas(), raiz.get_profundidade()) == (20, 2, 1)
+    # A pasta removida mantém o próprio resumo, agora como raiz de outra árvore.
+    assert ferias.get_tamanho() == 505
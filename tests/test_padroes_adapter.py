@@ -0,0 +1,239 @@
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from padroes.estruturais.adapter.assincrono import AdaptadorEnvioAssincrono, APIAntigaSimulada
+from padroes.estruturais.adapter.esquema import ESQUEMA_PADRAO, EsquemaTraducao
+from padroes.estruturais.adapter.implementacao import APIAntigaEnvio
+from padroes.estruturais.adapter.lote import AdaptadorEnvioEmLote
+from padroes.estruturais.adapter.pool import PoolAdaptadores, SemBackendDisponivel
+
+
+class APIInstavel(APIAntigaEnvio):
+    def __init__(self, falhas):
+        self.falhas = falhas
+        self.recebidos = []
+
+    def enviar_dados_legado(self, dados_antigos):
+        if self.falhas:
+            self.falhas -= 1
+            raise ConnectionError("fora do ar")
+        self.recebidos.append(dados_antigos)
+
+
+def test_lote_volta_ao_buffer_quando_a_api_antiga_falha():
+    api = APIInstavel(falhas=1)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=10, idade_maxima=None)
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "1"})
+    with pytest.raises(ConnectionError):
+        adaptador.flush()
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "2"})
+
+    assert adaptador.historico[0].erro is not None
+    assert adaptador.mensagens_enviadas == 0
+    adaptador.flush()
+    assert api.recebidos == ["user:ana;msg:1\nuser:ana;msg:2"]
+    assert adaptador.mensagens_enviadas == 2
+
+
+class APIQueFalha(APIAntigaEnvio):
+    def enviar_dados_legado(self, dados_antigos):
+        raise ConnectionError("fora do ar")
+
+
+
+def _esperar(condicao, limite=2.0):
+    fim = time.monotonic() + limite
+    while not condicao() and time.monotonic() < fim:
+        time.sleep(0.005)
+    return condicao()
+
+
+def test_lote_enviado_ao_atingir_o_tamanho():
+    api = APIInstavel(falhas=0)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=2, idade_maxima=None)
+    for i in range(5):
+        adaptador.enviar_dados({"usuario": "ana", "mensagem": str(i)})
+
+    assert api.recebidos == ["user:ana;msg:0\nuser:ana;msg:1", "user:ana;msg:2\nuser:ana;msg:3"]
+    assert [lote.motivo for lote in adaptador.historico] == ["tamanho", "tamanho"]
+    adaptador.fechar()
+    assert api.recebidos[-1] == "user:ana;msg:4"
+    assert adaptador.historico[-1].motivo == "fechamento"
+    assert (adaptador.chamadas_legado, adaptador.mensagens_enviadas) == (3, 5)
+
+
+def test_lote_enviado_por_idade_sem_novos_envios():
+    api = APIInstavel(falhas=0)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=100, idade_maxima=0.02)
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "oi"})
+
+    assert _esperar(lambda: api.recebidos)
+    assert api.recebidos == ["user:ana;msg:oi"]
+    assert adaptador.historico[0].motivo == "idade"
+    adaptador.fechar()
+
+
+def test_erro_do_temporizador_relancado_no_proximo_envio():
+    api = APIInstavel(falhas=1)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=100, idade_maxima=0.02)
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "1"})
+
+    # A primeira tentativa falha; o temporizador rearmado entrega o lote.
+    assert _esperar(lambda: api.recebidos)
+    with pytest.raises(ConnectionError):
+        adaptador.enviar_dados({"usuario": "ana", "mensagem": "2"})
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "3"})
+    adaptador.fechar()
+    assert api.recebidos == ["user:ana;msg:1", "user:ana;msg:3"]
+
+
+def test_erro_do_temporizador_relancado_no_fechamento():
+    api = APIInstavel(falhas=1)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=100, idade_maxima=0.02)
+    adaptador.enviar_dados({"usuario": "ana", "mensagem": "1"})
+    assert _esperar(lambda: adaptador._erro_temporizador is not None)
+
+    # O lote é entregue no fechamento, mas a falha anterior não é engolida.
+    with pytest.raises(ConnectionError):
+        adaptador.fechar()
+    assert api.recebidos == ["user:ana;msg:1"]
+    adaptador.fechar()
+
+
+def test_historico_limitado_e_contadores_totais():
+    api = APIInstavel(falhas=0)
+    adaptador = AdaptadorEnvioEmLote(api, tamanho_lote=1, idade_maxima=None, limite_historico=3)
+    for i in range(10):
+        adaptador.enviar_dados({"usuario": "ana", "mensagem": str(i)})
+
+    assert len(adaptador.historico) == 3
+    assert (adaptador.chamadas_legado, adaptador.mensagens_enviadas) == (10, 10)
+
+
+def test_pool_sem_backend_disponivel_encadeia_a_ultima_falha():
+    pool = PoolAdaptadores([APIQueFalha(), APIQueFalha()])
+    with pytest.raises(SemBackendDisponivel) as info:
+        pool.enviar_dados({"usuario": "ana", "mensagem": "oi"})
+    assert isinstance(info.value.__cause__, ConnectionError)
+
+
+def test_backend_lento_ejetado_nao_volta_como_preferido():
+    pool = PoolAdaptadores([APIInstavel(falhas=0), APIInstavel(falhas=0)], limite_latencia=0.01)
+    rapido, lento = pool.backends
+    for backend, duracao in ((rapido, 0.001), (lento, 0.5)):
+        backend.pendentes += 1
+        pool._registrar(backend, duracao, sucesso=True)
+    assert lento.ejecoes == 1
+
+    lento.ejetado_ate = 0.0
+    assert lento.latencia_media == pool.limite_latencia
+    assert pool._escolher({"usuario": "ana"}, []) is rapido
+
+
+class APIAssincronaComErro:
+    def __init__(self, erro):
+        self.erro = erro
+        self.chamadas = 0
+
+    async def enviar_dados_legado(self, dados_antigos):
+        self.chamadas += 1
+        raise self.erro
+
+
+def test_assincrono_so_repete_erros_transitorios():
+    permanente = APIAssincronaComErro(ValueError("carga inválida"))
+    adaptador = AdaptadorEnvioAssincrono(permanente, tentativas=3, atraso_base=0.0)
+    with pytest.raises(ValueError):
+        asyncio.run(adaptador.enviar_dados({"usuario": "ana", "mensagem": "oi"}))
+    assert permanente.chamadas == 1
+    assert adaptador.retentativas == 0
+
+    transitorio = APIAssincronaComErro(ConnectionError("fora do ar"))
+    adaptador = AdaptadorEnvioAssincrono(transitorio, tentativas=3, atraso_base=0.0)
+    with pytest.raises(ConnectionError):
+        asyncio.run(adaptador.enviar_dados({"usuario": "ana", "mensagem": "oi"}))
+    assert transitorio.chamadas == 3
+    assert adaptador.falhas == 1
+
+
+
+def test_assincrono_funciona_em_lacos_sucessivos():
+    legado = APIAntigaSimulada(latencia=0.001)
+    adaptador = AdaptadorEnvioAssincrono(legado, max_concorrencia=1)
+    mensagens = [{"usuario": "ana", "mensagem": str(i)} for i in range(3)]
+
+    # Com disputa pela vaga, um semáforo preso ao primeiro laço falharia no segundo.
+    assert asyncio.run(adaptador.enviar_varios(mensagens)) == [None] * 3
+    assert asyncio.run(adaptador.enviar_varios(mensagens)) == [None] * 3
+    assert legado.pico_concorrencia == 1
+
+
+class APISincronaLenta(APIAntigaEnvio):
+    def __init__(self, duracao):
+        self.duracao = duracao
+        self.em_andamento = 0
+        self.pico = 0
+        self._trava = threading.Lock()
+
+    def enviar_dados_legado(self, dados_antigos):
+        with self._trava:
+            self.em_andamento += 1
+            self.pico = max(self.pico, self.em_andamento)
+        time.sleep(self.duracao)
+        with self._trava:
+            self.em_andamento -= 1
+
+
+def test_assincrono_sincrono_so_libera_a_vaga_quando_a_thread_termina():
+    legado = APISincronaLenta(duracao=0.1)
+    adaptador = AdaptadorEnvioAssincrono(legado, max_concorrencia=1, tentativas=1, timeout=0.02)
+    mensagens = [{"usuario": "ana", "mensagem": str(i)} for i in range(3)]
+
+    resultados = asyncio.run(adaptador.enviar_varios(mensagens))
+
+    assert all(isinstance(r, asyncio.TimeoutError) for r in resultados)
+    assert legado.pico == 1
+
+
+def test_esquema_ida_e_volta():
+    mensagens = [{"usuario": f"u{i}", "mensagem": f"olá {i}"} for i in range(5)]
+    texto = ESQUEMA_PADRAO.traduzir_lote(mensagens)
+    assert texto.split("\n")[0] == ESQUEMA_PADRAO.traduzir(mensagens[0]) == "user:u0;msg:olá 0"
+
+    recuperadas = []
+    for linha in texto.split("\n"):
+        campos = dict(parte.split(":", 1) for parte in linha.split(";"))
+        recuperadas.append({"usuario": campos["user"], "mensagem": campos["msg"]})
+    assert recuperadas == mensagens
+
+
+def test_esquema_escapa_rotulos_e_chaves():
+    chave = "x'); import os; ('"
+    esquema = EsquemaTraducao([("{a}", chave), ('"b"', "b")], separador_campos="}{",
+                              prefixo="{", sufixo="}")
+    assert esquema.traduzir({chave: 1, "b": "{c}"}) == '{{a}:1}{"b":{c}}'
+    assert esquema.traduzir({}) == '{{a}:None}{"b":None}'
+
+
+def test_escrever_lote_igual_a_traduzir_lote():
+    mensagens = [{"usuario": "ana", "mensagem": "café"}, {"usuario": "bia", "mensagem": ""}]
+    esperado = ESQUEMA_PADRAO.traduzir_lote(mensagens, "|").encode("utf-8")
+
+    buffer = bytearray(b"x")
+    assert ESQUEMA_PADRAO.escrever_lote(mensagens, buffer, "|") == len(esperado)
+    assert bytes(buffer) == b"x" + esperado
+
+    fluxo = io.BytesIO()
+    assert ESQUEMA_PADRAO.escrever_lote(iter(mensagens), fluxo, "|") == len(esperado)
+    assert fluxo.getvalue() == esperado
+    assert ESQUEMA_PADRAO.escrever_lote([], fluxo) == 0
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from padroes.estruturais.decorator.flyweight import FabricaCafe
+from padroes.estruturais.decorator import lote
+from padroes.estruturais.decorator.implementacao import (
+    Acucar, CafeSimples, DecoradorCafe, Leite,
+)
+
+
+def test_canonizar_cadeia_sobre_cafe_ja_canonico():
+    fabrica = FabricaCafe()
+    canonico = fabrica.canonizar(Acucar(fabrica.obter(Leite)))
+
+    assert canonico is fabrica.obter(Leite, Acucar)
+    assert canonico is fabrica.canonizar(Acucar(Leite(CafeSimples())))
+    assert fabrica.canonizar(canonico) is canonico
+    assert canonico.get_descricao() == "Café Simples, com Leite, com Açúcar"
+
+
+class Chantilly(Leite):
+    """Decorador intermediário que muda a descrição herdada de Leite."""
+
+    def get_descricao(self):
+        return self._cafe.get_descricao() + ", com Chantilly"
+
+
+def test_decorador_intermediario_que_sobrescreve_descricao_e_respeitado():
+    cafe = Acucar(Chantilly(CafeSimples()))
+
+    assert cafe.get_descricao() == "Café Simples, com Chantilly, com Açúcar"
+    assert cafe.get_custo() == 8.0
+
+
+def test_cadeia_profunda_sem_recursao():
+    cafe = CafeSimples()
+    for nivel in range(10_000):
+        cafe = (Leite if nivel % 2 else Acucar)(cafe)
+
+    assert cafe.get_custo() == 5.0 + 5_000 * 2.0 + 5_000 * 1.0
+    descricao = cafe.get_descricao()
+    assert descricao.startswith("Café Simples, com Açúcar, com Leite")
+    assert descricao.count(", com ") == 10_000
+
+
+PEDIDOS = [[0, 0], [1, 0], [0, 3], [2, 1], [5, 7]]
+
+
+def _preco_encadeado(quantidades, adicionais):
+    cafe = CafeSimples()
+    for classe, quantidade in zip(adicionais, quantidades):
+        for _ in range(quantidade):
+            cafe = classe(cafe)
+    return cafe.get_custo()
+
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_precificar_lote_igual_ao_preco_de_cada_pedido(monkeypatch, com_numpy):
+    if com_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(lote, "np", None)
+    adicionais = (Leite, Acucar)
+
+    totais = lote.precificar_lote(PEDIDOS, adicionais)
+
+    assert [float(total) for total in totais] == pytest.approx(
+        [_preco_encadeado(pedido, adicionais) for pedido in PEDIDOS])
+    with pytest.raises(ValueError):
+        lote.precificar_lote([[1, 2, 3]], adicionais)
+
+
+def test_colunas_padrao_sao_os_decoradores_registrados():
+    classes, precos = lote.colunas_adicionais()
+    assert classes == DecoradorCafe.registrados()
+    assert classes[:2] == (Leite, Acucar)
+    assert precos == tuple(classe.custo_adicional for classe in classes)
+
@@ -0,0 +1,131 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from padroes.estruturais.facade.grafo import Etapa, executar, validar
+from padroes.estruturais.facade.implementacao import (
+    Amplificador, DVDPlayer, HomeTheaterFacade, Projetor,
+)
+
+
+class DVDContado(DVDPlayer):
+    def __init__(self, aquecimento=0.0):
+        super().__init__(aquecimento)
+        self.comandos = []
+
+    def ligar(self):
+        super().ligar()
+        self.comandos.append("ligar")
+
+    def play(self, filme):
+        self.comandos.append(("play", filme))
+
+    def parar(self):
+        self.comandos.append("parar")
+
+    def desligar(self):
+        self.comandos.append("desligar")
+
+
+def test_ligar_concorrente_envia_um_unico_comando():
+    dvd = DVDContado(aquecimento=0.05)
+    fachada = HomeTheaterFacade(Amplificador(), dvd, Projetor())
+    threads = [threading.Thread(target=fachada._ligar, args=("dvd", dvd)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert dvd.comandos == ["ligar"]
+
+
+def test_sessoes_aninhadas_e_parar_dentro_da_sessao():
+    dvd = DVDContado()
+    fachada = HomeTheaterFacade(Amplificador(), dvd, Projetor(), max_trabalhadores=1)
+    with fachada.sessao():
+        with fachada.sessao():
+            fachada.assistir_filme("A")
+        # Sair da sessão interna para o filme, mas mantém os aparelhos ligados.
+        assert dvd.comandos == ["ligar", ("play", "A"), "parar"]
+        assert fachada.estado["dvd"] is True
+        fachada.assistir_filme("B")
+    assert dvd.comandos[-2:] == [("play", "B"), "desligar"]
+    assert fachada.estado == {"projetor": False, "amplificador": False, "dvd": False,
+                              "volume": None, "filme": None}
+
+
+def _dormir(segundos, resultado=None):
+    def acao():
+        time.sleep(segundos)
+        return resultado
+    return acao
+
+
+def test_grafo_respeita_as_dependencias():
+    etapas = [
+        Etapa("c", _dormir(0.01, "C"), ("a", "b")),
+        Etapa("a", _dormir(0.03, "A")),
+        Etapa("b", _dormir(0.01, "B"), ("a",)),
+    ]
+    relatorio = executar(etapas)
+
+    assert relatorio.ordem == ["a", "b", "c"]
+    assert relatorio.resultados == {"a": "A", "b": "B", "c": "C"}
+    assert relatorio.tempos["b"][0] >= relatorio.tempos["a"][1]
+    assert relatorio.tempos["c"][0] >= relatorio.tempos["b"][1]
+    assert relatorio.caminho_critico == ["a", "b", "c"]
+
+
+def test_grafo_executa_etapas_independentes_em_paralelo():
+    etapas = [Etapa(nome, _dormir(0.1)) for nome in ("x", "y", "z")]
+    assert executar(etapas).total < 0.25
+    assert executar(etapas, max_trabalhadores=1).total >= 0.3
+
+
+def test_falha_propaga_e_nao_inicia_dependentes():
+    executadas = []
+
+    def falhar():
+        raise RuntimeError("queimou")
+
+    etapas = [
+        Etapa("falha", falhar),
+        Etapa("lenta", lambda: (time.sleep(0.05), executadas.append("lenta"))),
+        Etapa("depois", lambda: executadas.append("depois"), ("falha",)),
+        Etapa("apos_lenta", lambda: executadas.append("apos_lenta"), ("lenta",)),
+    ]
+    with pytest.raises(RuntimeError, match="queimou"):
+        executar(etapas)
+    # A etapa que já rodava termina; nenhuma etapa nova é iniciada.
+    assert executadas == ["lenta"]
+
+
+@pytest.mark.parametrize("etapas", [
+    [Etapa("a", print, ("b",)), Etapa("b", print, ("a",))],
+    [Etapa("a", print, ("fantasma",))],
+    [Etapa("a", print), Etapa("a", print)],
+])
+def test_grafo_invalido(etapas):
+    with pytest.raises(ValueError):
+        validar(etapas)
+
+
+def test_mensagens_dos_aparelhos_saem_na_ordem_das_dependencias(capsys):
+    # O projetor termina por último, mas é a primeira etapa na ordem do grafo.
+    fachada = HomeTheaterFacade(Amplificador(0.01), DVDPlayer(0.0), Projetor(0.05))
+    fachada.assistir_filme("A")
+
+    assert capsys.readouterr().out.splitlines()[2:] == [
+        "Projetor ligado.",
+        "Amplificador ligado.",
+        "Volume do amplificador ajustado para 10.",
+        "DVD Player ligado.",
+        'Reproduzindo filme: "A".',
+    ]
+
@@ -0,0 +1,123 @@
+import os
+import sys
+from abc import abstractmethod
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from padroes.comportamentais.strategy.implementacao import (
+    EstrategiaCalculoFrete, FreteExpresso, FreteNormal, FreteRetiradaLocal,
+)
+from padroes.comportamentais.strategy import tabela as modulo_tabela
+from padroes.comportamentais.strategy.selecao import (
+    estrategias_registradas, selecionar_frete_mais_barato,
+)
+from padroes.comportamentais.strategy.tabela import TARIFAS_EXEMPLO, FreteTabelado, TabelaFrete
+
+
+class FreteComSeguro(EstrategiaCalculoFrete, registrar=False):
+    """Intermediária abstrata: não deve entrar no registro."""
+
+    @abstractmethod
+    def seguro(self, peso: float) -> float:
+        pass
+
+    def calcular(self, peso: float) -> float:
+        return peso * 20.0 + self.seguro(peso)
+
+
+class FreteAbstrato(EstrategiaCalculoFrete):
+    """Intermediária abstrata sem registrar=False: também fica de fora."""
+
+
+class FreteNormalComTaxa(FreteNormal, registrar=False):
+    def calcular(self, peso: float) -> float:
+        return super().calcular(peso) + 3
+
+
+def test_intermediaria_abstrata_nao_e_registrada():
+    assert FreteAbstrato not in EstrategiaCalculoFrete.registradas()
+    assert FreteComSeguro not in EstrategiaCalculoFrete.registradas()
+    assert FreteNormalComTaxa not in EstrategiaCalculoFrete.registradas()
+    with pytest.raises(TypeError):
+        EstrategiaCalculoFrete.registrar_classe(FreteAbstrato)
+    assert {type(e) for e in estrategias_registradas()} >= {FreteNormal, FreteExpresso}
+
+
+def test_retirada_so_entra_quando_pedida():
+    pesos = [1.0, 3.0]
+    escolhidas, _ = selecionar_frete_mais_barato(pesos)
+    assert not any(isinstance(e, FreteRetiradaLocal) for e in escolhidas)
+    escolhidas, custos = selecionar_frete_mais_barato(pesos, incluir_retirada=True)
+    assert all(isinstance(e, FreteRetiradaLocal) for e in escolhidas)
+    assert list(custos) == [0.0, 0.0]
+
+
+def test_calcular_lote_igual_a_calcular():
+    pesos = [0.5, 2.0, 7.25]
+    for estrategia in (FreteNormal(), FreteExpresso(), FreteRetiradaLocal()):
+        assert list(estrategia.calcular_lote(pesos)) == [estrategia.calcular(p) for p in pesos]
+
+
+def test_calcular_sobrescrito_vale_tambem_no_lote():
+    estrategia = FreteNormalComTaxa()
+    assert estrategia.calcular(2) == 13
+    assert list(estrategia.calcular_lote([2])) == [13.0]
+    escolhidas, custos = selecionar_frete_mais_barato([2], [FreteNormal(), estrategia])
+    assert type(escolhidas[0]) is FreteNormal and list(custos) == [10.0]
+
+
+def _tabela():
+    # Fora de ordem de propósito: a tabela ordena as faixas.
+    return TabelaFrete({
+        "sul": [(5.0, 30.0), (1.0, 10.0), (2.0, 20.0)],
+        "norte": [(1.0, 15.0), (float("inf"), 99.0)],
+    })
+
+
+@pytest.mark.parametrize("peso, preco", [
+    (0.0, 10.0), (0.99, 10.0),
+    (1.0, 10.0),  # o peso máximo pertence à própria faixa
+    (1.000001, 20.0), (2.0, 20.0), (2.5, 30.0), (5.0, 30.0),
+])
+def test_tabela_limites_das_faixas(peso, preco):
+    assert _tabela().cotar(peso, "sul") == preco
+
+
+def test_tabela_acima_da_ultima_faixa_e_regiao_desconhecida():
+    tabela = _tabela()
+    with pytest.raises(ValueError):
+        tabela.cotar(5.01, "sul")
+    assert tabela.cotar(1e9, "norte") == 99.0
+    with pytest.raises(KeyError):
+        tabela.cotar(1.0, "centro")
+    with pytest.raises(KeyError):
+        FreteTabelado(tabela, "centro")
+    with pytest.raises(ValueError):
+        TabelaFrete({"sul": [(1.0, 10.0), (1.0, 12.0)]})
+
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_tabela_cotar_lote_igual_a_cotar(monkeypatch, com_numpy):
+    if com_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(modulo_tabela, "np", None)
+    tabela = _tabela()
+    pesos = [0.0, 1.0, 1.5, 2.0, 4.99, 5.0]
+
+    assert list(FreteTabelado(tabela, "sul").calcular_lote(pesos)) == \
+        [tabela.cotar(peso, "sul") for peso in pesos]
+    with pytest.raises(ValueError):
+        tabela.cotar_lote([1.0, 6.0], "sul")
+
+
+def test_tabela_de_exemplo_carrega():
+    tabela = TabelaFrete.carregar(TARIFAS_EXEMPLO)
+    assert "sudeste" in tabela.regioes
+    assert tabela.cotar(0.5, "sudeste") == 12.90
+    assert tabela.cotar(0.51, "sudeste") == 15.40
+
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import run_all_examples
+from run_all_examples import METRICS_MARKER, _run_child, _run_isolated
+
+
+def test_run_isolated_executa_o_exemplo_num_subprocesso():
+    resultado = _run_isolated("estruturais.decorator", timeout=60)
+
+    assert resultado["status"] == "ok"
+    assert resultado["pattern"] == "estruturais.decorator"
+    assert resultado["stdout"]
+    assert METRICS_MARKER not in resultado["stderr"]
+    assert resultado["cpu"] > 0
+    assert resultado["wall"] > 0
+
+
+def test_linha_de_metricas_do_filho_e_separada_do_stderr(monkeypatch):
+    stderr = "\n".join(["aviso 1", METRICS_MARKER + json.dumps({"cpu": 0.25, "rss_kb": 2048}),
+                        "aviso 2"])
+
+    def executar(comando, **opcoes):
+        assert comando[-2:] == ["--filho", "estruturais.facade"]
+        return subprocess.CompletedProcess(comando, 3, stdout="saida\n", stderr=stderr)
+
+    monkeypatch.setattr(run_all_examples.subprocess, "run", executar)
+    resultado = _run_isolated("estruturais.facade", timeout=5)
+
+    assert resultado["status"] == "erro"
+    assert (resultado["cpu"], resultado["rss_kb"]) == (0.25, 2048)
+    assert resultado["stdout"] == "saida\n"
+    assert resultado["stderr"] == "aviso 1\naviso 2"
+
+
+def test_sem_linha_de_metricas_os_campos_ficam_vazios(monkeypatch):
+    monkeypatch.setattr(run_all_examples.subprocess, "run", lambda comando, **opcoes:
+                        subprocess.CompletedProcess(comando, 0, stdout="", stderr="quebrou"))
+    resultado = _run_isolated("estruturais.facade", timeout=5)
+    assert (resultado["status"], resultado["cpu"], resultado["rss_kb"]) == ("ok", None, None)
+    assert resultado["stderr"] == "quebrou"
+
+
+def test_tempo_esgotado_guarda_a_saida_parcial(monkeypatch):
+    def executar(comando, **opcoes):
+        raise subprocess.TimeoutExpired(comando, opcoes["timeout"], output=b"parcial\xff", stderr=None)
+
+    monkeypatch.setattr(run_all_examples.subprocess, "run", executar)
+    resultado = _run_isolated("estruturais.adapter", timeout=0.5)
+
+    assert resultado["status"] == "timeout"
+    assert resultado["stdout"] == "parcial\ufffd"
+    assert resultado["stderr"] == ""
+    assert (resultado["cpu"], resultado["rss_kb"]) == (None, None)
+
+
+def test_modo_filho_escreve_as_metricas_no_stderr(capsys):
+    assert _run_child("estruturais.decorator") == 0
+    linhas = capsys.readouterr().err.splitlines()
+    metricas = json.loads(linhas[-1][len(METRICS_MARKER):])
+    assert linhas[-1].startswith(METRICS_MARKER)
+    assert set(metricas) == {"cpu", "rss_kb"}
+
+    assert _run_child("estruturais.inexistente") == 1
+    assert capsys.readouterr().err.splitlines()[-1].startswith(METRICS_MARKER)